@@ -0,0 +1,551 @@
+"""
+async_load_generator.py — Async Load Generator for OpenAI-Compatible Endpoints
+===============================================================================
+Drives /v1/chat/completions with many concurrent streaming requests to find
+the real throughput knee of an inference server, with every request tagged by
+the RID S_n of its context size.
+
+HOW IT WORKS:
+  - Pure asyncio HTTP/1.1 client with a pool of keep-alive connections
+    (no new TCP handshake per request once the pool is warm)
+  - Responses are decoded incrementally: chunked transfer-encoding → SSE
+    events → JSON deltas, with no line buffering of the whole body
+  - Arrival patterns:
+      closed  N workers, each sends its next request when the last finishes
+      poisson open loop, exponential inter-arrival gaps at a fixed rate;
+              latency is measured from the scheduled arrival, so queueing
+              inside the client counts against the server as it should
+  - Per request: TTFT, inter-token latencies, decode TPS, and
+      S_n = RLE = max(0, (MAX_CONTEXT − context) / MAX_CONTEXT)   (LTP = RSR = 1)
+    as in predictive_stress_test.py
+
+Run:  python async_load_generator.py --url http://127.0.0.1:1234/v1/chat/completions \\
+          --mode closed --concurrency 1,2,4,8,16 --requests 64 --out load.csv
+"""
+
+import argparse
+import asyncio
+import csv
+import json
+import os
+import random
+import ssl as ssl_module
+import statistics
+import time
+from dataclasses import dataclass, field, asdict
+from typing import AsyncIterator, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+DEFAULT_URL = os.environ.get("RID_LLM_URL", "http://127.0.0.1:1234/v1/chat/completions")
+MAX_CONTEXT = 8192
+CHARS_PER_TOKEN = 4
+
+BASE_SENTENCES = [
+    "The quick brown fox jumps over the lazy dog. ",
+    "A system of cells interlinked within cells interlinked. ",
+    "To be or not to be, that is the question. ",
+    "All those moments will be lost in time, like tears in rain. ",
+    "I have a bad feeling about this. ",
+]
+
+
+class HTTPError(Exception):
+    pass
+
+
+# ---------------------------------------------------------------------------
+# Connection pool
+# ---------------------------------------------------------------------------
+
+class ConnectionPool:
+    """
+    Up to `size` keep-alive connections to one host. acquire() reuses an idle
+    connection when one is open and waits when all `size` are busy.
+    """
+
+    def __init__(self, host: str, port: int, size: int = 64, use_ssl: bool = False,
+                 connect_timeout: float = 5.0):
+        self.host, self.port = host, port
+        self.size = size
+        self.ssl = ssl_module.create_default_context() if use_ssl else None
+        self.connect_timeout = connect_timeout
+        self._idle: List[Tuple[asyncio.StreamReader, asyncio.StreamWriter]] = []
+        self._slots = asyncio.Semaphore(size)
+        self.opened = 0
+
+    async def acquire(self) -> Tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        await self._slots.acquire()
+        while self._idle:
+            reader, writer = self._idle.pop()
+            if not writer.is_closing() and not reader.at_eof():
+                return reader, writer
+            writer.close()
+        try:
+            conn = await asyncio.wait_for(
+                asyncio.open_connection(self.host, self.port, ssl=self.ssl), self.connect_timeout)
+        except BaseException:
+            self._slots.release()
+            raise
+        self.opened += 1
+        return conn
+
+    def release(self, conn, reuse: bool = True) -> None:
+        if reuse and not conn[1].is_closing():
+            self._idle.append(conn)
+        else:
+            conn[1].close()
+        self._slots.release()
+
+    async def close(self) -> None:
+        idle, self._idle = self._idle, []
+        for _, writer in idle:
+            writer.close()
+        for _, writer in idle:
+            try:
+                await writer.wait_closed()
+            except OSError:
+                pass
+
+
+# ---------------------------------------------------------------------------
+# HTTP/1.1 framing and SSE
+# ---------------------------------------------------------------------------
+
+async def read_head(reader: asyncio.StreamReader) -> Tuple[int, Dict[str, str]]:
+    """Status code and lower-cased headers of a response."""
+    status_line = await reader.readline()
+    if not status_line:
+        raise ConnectionResetError("connection closed before response")
+    parts = status_line.decode("latin-1").split(None, 2)
+    if len(parts) < 2 or not parts[0].startswith("HTTP/"):
+        raise HTTPError(f"bad status line: {status_line!r}")
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    return int(parts[1]), headers
+
+
+async def iter_body(reader: asyncio.StreamReader, headers: Dict[str, str]) -> AsyncIterator[bytes]:
+    """Body bytes as they arrive: chunked, Content-Length, or read-until-close."""
+    if "chunked" in headers.get("transfer-encoding", "").lower():
+        while True:
+            size_line = await reader.readline()
+            if not size_line:
+                raise ConnectionResetError("connection closed inside chunked body")
+            size = int(size_line.split(b";", 1)[0].strip() or b"0", 16)
+            if size == 0:
+                while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                    pass                                    # trailers
+                return
+            yield await reader.readexactly(size)
+            await reader.readline()                         # CRLF after each chunk
+    elif "content-length" in headers:
+        remaining = int(headers["content-length"])
+        while remaining > 0:
+            data = await reader.read(min(remaining, 65536))
+            if not data:
+                raise ConnectionResetError("connection closed inside body")
+            remaining -= len(data)
+            yield data
+    else:
+        while True:
+            data = await reader.read(65536)
+            if not data:
+                return
+            yield data
+
+
+def keeps_alive(headers: Dict[str, str]) -> bool:
+    framed = "content-length" in headers or "chunked" in headers.get("transfer-encoding", "").lower()
+    return framed and headers.get("connection", "").lower() != "close"
+
+
+class SSEParser:
+    """
+    Incremental text/event-stream parser. feed() takes raw bytes in arbitrary
+    splits and returns the `data` payload of every event completed so far.
+    """
+
+    def __init__(self):
+        self._buf = b""
+        self._data: List[str] = []
+
+    def feed(self, chunk: bytes) -> List[str]:
+        self._buf += chunk
+        events = []
+        while True:
+            nl = self._buf.find(b"\n")
+            if nl < 0:
+                break
+            line = self._buf[:nl].rstrip(b"\r").decode("utf-8")
+            self._buf = self._buf[nl + 1:]
+            if not line:
+                if self._data:
+                    events.append("\n".join(self._data))
+                    self._data = []
+            elif line.startswith("data:"):
+                value = line[5:]
+                self._data.append(value[1:] if value.startswith(" ") else value)
+            # comments (":") and event/id/retry fields carry nothing we need
+        return events
+
+
+def delta_text(payload: str) -> Optional[str]:
+    """Content of a chat.completion.chunk payload; None if it is not one."""
+    try:
+        choice = json.loads(payload)["choices"][0]
+    except (json.JSONDecodeError, KeyError, IndexError, TypeError):
+        return None
+    delta = choice.get("delta") or {}
+    return delta.get("content") or ""
+
+
+# ---------------------------------------------------------------------------
+# Requests and results
+# ---------------------------------------------------------------------------
+
+def context_s_n(context_tokens: int, max_context: int = MAX_CONTEXT) -> float:
+    """S_n = RLE = remaining context capacity (LTP = RSR = 1)."""
+    return max(0.0, (max_context - context_tokens) / max_context)
+
+
+def make_prompt(target_tokens: int, rng: random.Random) -> str:
+    """~target_tokens of varied filler (4 chars/token) with a unique suffix to defeat prefix caching."""
+    chars = target_tokens * CHARS_PER_TOKEN
+    parts, length = [], 0
+    while length < chars:
+        s = rng.choice(BASE_SENTENCES)
+        parts.append(s)
+        length += len(s)
+    suffix = f"\n\n[Noise Seed: {rng.randint(10000, 99999)}] Summarize the text above in one sentence."
+    return "".join(parts)[:max(0, chars - len(suffix))] + suffix
+
+
+@dataclass
+class RequestResult:
+    context_tokens: int
+    s_n: float
+    status: str                     # OK | HTTP <code> | TIMEOUT | ERROR <type>
+    start: float                    # seconds since the run started (scheduled arrival)
+    ttft: float = 0.0
+    duration: float = 0.0
+    tokens: int = 0
+    itl: List[float] = field(default_factory=list)
+    concurrency: int = 0
+
+    @property
+    def tps(self) -> float:
+        """Decode tokens/s after the first token."""
+        gen = sum(self.itl)
+        return len(self.itl) / gen if gen > 0 else 0.0
+
+    @property
+    def mean_itl(self) -> float:
+        return statistics.fmean(self.itl) if self.itl else 0.0
+
+    def row(self) -> dict:
+        row = asdict(self)
+        row.pop("itl")
+        row.update(tps=self.tps, mean_itl=self.mean_itl,
+                   p95_itl=_percentile(self.itl, 95) if self.itl else 0.0)
+        return row
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return float("nan")
+    ordered = sorted(values)
+    k = (len(ordered) - 1) * pct / 100.0
+    lo = int(k)
+    hi = min(lo + 1, len(ordered) - 1)
+    return ordered[lo] + (ordered[hi] - ordered[lo]) * (k - lo)
+
+
+class LoadGenerator:
+    """Streaming chat-completions client over a keep-alive ConnectionPool."""
+
+    def __init__(self, url: str = DEFAULT_URL, model: str = "", pool_size: int = 64,
+                 max_context: int = MAX_CONTEXT, max_tokens: int = 32, timeout: float = 60.0):
+        parts = urlsplit(url)
+        if parts.scheme not in ("http", "https"):
+            raise ValueError(f"unsupported URL scheme: {url}")
+        self.url = url
+        self.host = parts.hostname
+        self.port = parts.port or (443 if parts.scheme == "https" else 80)
+        self.path = parts.path or "/"
+        self.host_header = parts.netloc
+        self.model = model
+        self.max_context = max_context
+        self.max_tokens = max_tokens
+        self.timeout = timeout
+        self.pool = ConnectionPool(self.host, self.port, pool_size, use_ssl=parts.scheme == "https")
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.pool.close()
+
+    def _request(self, method: str, path: str, body: bytes = b"") -> bytes:
+        head = (f"{method} {path} HTTP/1.1\r\nHost: {self.host_header}\r\n"
+                f"Connection: keep-alive\r\nAccept: text/event-stream, application/json\r\n")
+        if body:
+            head += f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n"
+        return head.encode("latin-1") + b"\r\n" + body
+
+    async def get_json(self, path: str) -> dict:
+        conn = await self.pool.acquire()
+        reuse = False
+        try:
+            conn[1].write(self._request("GET", path))
+            status, headers = await read_head(conn[0])
+            body = b"".join([c async for c in iter_body(conn[0], headers)])
+            reuse = keeps_alive(headers)
+            if status != 200:
+                raise HTTPError(f"HTTP {status}")
+            return json.loads(body)
+        finally:
+            self.pool.release(conn, reuse)
+
+    async def detect_model(self) -> str:
+        """First model listed by /v1/models (LM Studio, llama.cpp, vLLM)."""
+        root = self.path.split("/chat/completions")[0] if "/chat/completions" in self.path else "/v1"
+        try:
+            models = (await self.get_json(root + "/models")).get("data", [])
+        except (OSError, HTTPError, ValueError, asyncio.TimeoutError):
+            models = []
+        return models[0]["id"] if models else "unknown-model"
+
+    async def send(self, context_tokens: int, prompt: str, scheduled: float, t0: float) -> RequestResult:
+        """One streaming request; timings run from `scheduled` (perf_counter)."""
+        result = RequestResult(context_tokens, context_s_n(context_tokens, self.max_context),
+                               "OK", scheduled - t0)
+        try:
+            await asyncio.wait_for(self._stream(prompt, scheduled, result), self.timeout)
+        except asyncio.TimeoutError:
+            result.status = "TIMEOUT"
+        except HTTPError as e:
+            result.status = str(e)
+        except (OSError, asyncio.IncompleteReadError, ValueError) as e:
+            result.status = f"ERROR {type(e).__name__}"
+        result.duration = time.perf_counter() - scheduled
+        return result
+
+    async def _stream(self, prompt: str, scheduled: float, result: RequestResult) -> None:
+        body = json.dumps({
+            "model": self.model,
+            "messages": [{"role": "user", "content": prompt}],
+            "max_tokens": self.max_tokens,
+            "stream": True,
+            "temperature": 0.0,
+        }).encode()
+        conn = await self.pool.acquire()
+        reuse = False
+        try:
+            reader, writer = conn
+            writer.write(self._request("POST", self.path, body))
+            await writer.drain()
+            status, headers = await read_head(reader)
+            if status != 200:
+                async for _ in iter_body(reader, headers):
+                    pass
+                reuse = keeps_alive(headers)
+                raise HTTPError(f"HTTP {status}")
+            parser = SSEParser()
+            last = None
+            async for chunk in iter_body(reader, headers):
+                now = time.perf_counter()
+                for payload in parser.feed(chunk):
+                    if payload == "[DONE]":
+                        continue                            # drain to the end of the body
+                    if not delta_text(payload):
+                        continue
+                    if last is None:
+                        result.ttft = now - scheduled
+                    else:
+                        result.itl.append(now - last)
+                    last = now
+                    result.tokens += 1
+            reuse = keeps_alive(headers)
+            if last is None:
+                result.ttft = time.perf_counter() - scheduled
+                result.status = "EMPTY"
+        finally:
+            self.pool.release(conn, reuse)
+
+    # -- arrival patterns ------------------------------------------------------
+
+    async def run_closed_loop(self, contexts: Iterable[int], concurrency: int, seed: int = 0,
+                              duration: Optional[float] = None) -> List[RequestResult]:
+        """`concurrency` workers pull context sizes until exhausted (or `duration` s pass)."""
+        items = iter(contexts)
+        rng = random.Random(seed)
+        results: List[RequestResult] = []
+        t0 = time.perf_counter()
+
+        async def worker():
+            for ctx in items:
+                if duration is not None and time.perf_counter() - t0 >= duration:
+                    return
+                r = await self.send(ctx, make_prompt(ctx, rng), time.perf_counter(), t0)
+                r.concurrency = concurrency
+                results.append(r)
+
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        return results
+
+    async def run_poisson(self, contexts: Iterable[int], rate: float, seed: int = 0) -> List[RequestResult]:
+        """Open loop: one request per context size at exponential gaps with mean 1/rate s."""
+        rng = random.Random(seed)
+        t0 = time.perf_counter()
+        arrival = t0
+        tasks = []
+        for ctx in contexts:
+            arrival += rng.expovariate(rate)
+            delay = arrival - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            tasks.append(asyncio.create_task(self.send(ctx, make_prompt(ctx, rng), arrival, t0)))
+        return list(await asyncio.gather(*tasks))
+
+
+def random_contexts(n: int, lo: int, hi: int, seed: int = 0) -> List[int]:
+    rng = random.Random(seed)
+    return [rng.randint(lo, hi) for _ in range(n)]
+
+
+# ---------------------------------------------------------------------------
+# Analysis
+# ---------------------------------------------------------------------------
+
+def summarize(results: List[RequestResult], wall: Optional[float] = None) -> dict:
+    """Aggregate throughput and latency percentiles for one run."""
+    ok = [r for r in results if r.status == "OK"]
+    if wall is None:
+        wall = max((r.start + r.duration for r in results), default=0.0)
+    ttft = [r.ttft for r in ok]
+    itl = [x for r in ok for x in r.itl]
+    return {
+        "requests": len(results),
+        "ok": len(ok),
+        "tokens_per_s": sum(r.tokens for r in ok) / wall if wall > 0 else 0.0,
+        "ttft_p50": _percentile(ttft, 50),
+        "ttft_p95": _percentile(ttft, 95),
+        "itl_p50": _percentile(itl, 50),
+        "itl_p95": _percentile(itl, 95),
+        "mean_tps": statistics.fmean([r.tps for r in ok]) if ok else 0.0,
+    }
+
+
+def by_s_n_bucket(results: List[RequestResult], width: float = 0.1) -> Dict[float, dict]:
+    """summarize() per S_n bucket (lower edge → stats)."""
+    buckets: Dict[float, List[RequestResult]] = {}
+    for r in results:
+        edge = round(min(r.s_n, 1.0 - 1e-9) // width * width, 6)
+        buckets.setdefault(edge, []).append(r)
+    return {edge: summarize(rs) for edge, rs in sorted(buckets.items())}
+
+
+def find_knee(levels: List[Tuple[int, dict]], min_gain: float = 0.10) -> Optional[int]:
+    """
+    Concurrency level after which throughput stops scaling: the last level
+    whose tokens/s grew by at least min_gain × the ideal (linear) gain.
+    """
+    knee = levels[0][0] if levels else None
+    for (c0, s0), (c1, s1) in zip(levels, levels[1:]):
+        ideal = s0["tokens_per_s"] * (c1 - c0) / c0 if c0 else 0.0
+        if ideal <= 0 or s1["tokens_per_s"] - s0["tokens_per_s"] < min_gain * ideal:
+            break
+        knee = c1
+    return knee
+
+
+def write_csv(path: str, results: List[RequestResult]) -> None:
+    rows = [r.row() for r in results]
+    if not rows:
+        return
+    with open(path, "w", newline="") as f:
+        w = csv.DictWriter(f, fieldnames=list(rows[0]))
+        w.writeheader()
+        w.writerows(rows)
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+async def _main(args) -> None:
+    async with LoadGenerator(args.url, args.model, pool_size=args.pool, max_context=args.max_context,
+                             max_tokens=args.max_tokens, timeout=args.timeout) as gen:
+        if not gen.model:
+            gen.model = await gen.detect_model()
+        contexts = random_contexts(args.requests, args.context_min, args.context_max, args.seed)
+
+        print("=" * 100)
+        print("  RID LOAD GENERATOR — OpenAI-compatible streaming endpoint")
+        print(f"  URL: {args.url} | Model: {gen.model} | Mode: {args.mode} | Requests/level: {args.requests}")
+        print("=" * 100)
+        print(f" {'Level':>7} | {'OK':>5} | {'Tok/s':>8} | {'TTFT p50':>9} | {'TTFT p95':>9} | "
+              f"{'ITL p50':>8} | {'ITL p95':>8} | {'TPS/req':>8}")
+        print("-" * 100)
+
+        all_results, levels = [], []
+        level_values = args.concurrency if args.mode == "closed" else args.rate
+        for level in level_values:
+            t_start = time.perf_counter()
+            if args.mode == "closed":
+                results = await gen.run_closed_loop(contexts, int(level), seed=args.seed)
+            else:
+                results = await gen.run_poisson(contexts, level, seed=args.seed)
+                for r in results:
+                    r.concurrency = 0
+            s = summarize(results, time.perf_counter() - t_start)
+            levels.append((level, s))
+            all_results.extend(results)
+            print(f" {level:>7g} | {s['ok']:>5} | {s['tokens_per_s']:>8.1f} | {s['ttft_p50']:>8.3f}s | "
+                  f"{s['ttft_p95']:>8.3f}s | {s['itl_p50'] * 1e3:>6.1f}ms | {s['itl_p95'] * 1e3:>6.1f}ms | "
+                  f"{s['mean_tps']:>8.1f}")
+
+        print("-" * 100)
+        print("\n  BY S_n BUCKET (all levels):")
+        print(f"  {'S_n':>9} | {'Count':>5} | {'TTFT p50':>9} | {'TTFT p95':>9} | {'TPS/req':>8}")
+        for edge, s in by_s_n_bucket(all_results).items():
+            print(f"  {edge:>4.1f}–{edge + 0.1:<4.1f} | {s['requests']:>5} | {s['ttft_p50']:>8.3f}s | "
+                  f"{s['ttft_p95']:>8.3f}s | {s['mean_tps']:>8.1f}")
+        if args.mode == "closed" and len(levels) > 1:
+            print(f"\n  Throughput knee: concurrency ≈ {find_knee(levels)}")
+        print(f"  Connections opened: {gen.pool.opened}")
+        if args.out:
+            write_csv(args.out, all_results)
+            print(f"  Per-request results written to {args.out}")
+
+
+def _floats(text: str) -> List[float]:
+    return [float(v) for v in text.split(",")]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Async load generator for OpenAI-compatible endpoints")
+    parser.add_argument("--url", default=DEFAULT_URL, help="chat completions URL (env RID_LLM_URL)")
+    parser.add_argument("--model", default="", help="model id (default: first from /v1/models)")
+    parser.add_argument("--mode", choices=("closed", "poisson"), default="closed")
+    parser.add_argument("--concurrency", type=_floats, default=[1, 2, 4, 8], help="closed-loop levels, e.g. 1,2,4,8")
+    parser.add_argument("--rate", type=_floats, default=[1.0], help="Poisson arrival rates (req/s), e.g. 0.5,1,2")
+    parser.add_argument("--requests", type=int, default=32, help="requests per level")
+    parser.add_argument("--context-min", type=int, default=1000)
+    parser.add_argument("--context-max", type=int, default=8000)
+    parser.add_argument("--max-context", type=int, default=MAX_CONTEXT)
+    parser.add_argument("--max-tokens", type=int, default=32)
+    parser.add_argument("--pool", type=int, default=64, help="max keep-alive connections")
+    parser.add_argument("--timeout", type=float, default=60.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", default="", help="CSV of per-request results")
+    asyncio.run(_main(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
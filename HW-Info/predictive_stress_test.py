@@ -24,13 +24,14 @@ load-bearing and a reliable leading indicator for cognitive throughput collapse.
 Run: L:\.venv\Scripts\python.exe predictive_stress_test.py
 """
 
-import sys, time, json, requests
+import os, sys, time, json, requests
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 from hw_telemetry import read_latest, read_cpu_latest, CSV_PATH
 
-LM_STUDIO_URL = "http://192.168.1.21:1234/v1/chat/completions"
+# RID_LLM_URL points the harness elsewhere, e.g. at stub_inference_server.py
+LM_STUDIO_URL = os.environ.get("RID_LLM_URL", "http://192.168.1.21:1234/v1/chat/completions")
 MODEL_ID = "qwen/qwen3-1.7b"
 MAX_CONTEXT = 8192  # assumed max context capacity (adjust if model supports more)
 
@@ -19,20 +19,21 @@ to prove that the correlation survives statistical noise.
 Run: L:\.venv\Scripts\python.exe robustness_stress_test.py
 """
 
-import sys, time, json, requests, random, statistics
+import os, sys, time, json, requests, random, statistics
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 from hw_telemetry import read_latest, CSV_PATH
 
 # User can run this with whatever model is currently loaded in LM Studio
-LM_STUDIO_URL = "http://192.168.1.21:1234/v1/chat/completions"
+# RID_LLM_URL points the harness elsewhere, e.g. at stub_inference_server.py
+LM_STUDIO_URL = os.environ.get("RID_LLM_URL", "http://192.168.1.21:1234/v1/chat/completions")
 MAX_CONTEXT = 8192
 
 def get_current_model():
     """Auto-detects the first loaded model in LM Studio."""
     try:
-        resp = requests.get("http://192.168.1.21:1234/v1/models", timeout=2)
+        resp = requests.get(LM_STUDIO_URL.replace("/chat/completions", "/models"), timeout=2)
         models = resp.json().get('data', [])
         if models:
             return models[0]['id']
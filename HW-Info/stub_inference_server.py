@@ -0,0 +1,289 @@
+"""
+stub_inference_server.py — Local Stand-In for an OpenAI-Compatible LLM Server
+==============================================================================
+Lets the predictive-validity harnesses and the async load generator run
+offline (CI, laptops) at high request rates, against a server whose TTFT and
+tokens/sec degrade with context length, concurrency and a simulated VRAM
+budget the way a consumer GPU running LM Studio does.
+
+ENDPOINTS (stdlib asyncio, HTTP/1.1 keep-alive):
+  GET  /v1/models             → {"data": [{"id": MODEL_ID, ...}]}
+  POST /v1/chat/completions   → chunked SSE chat.completion.chunk stream
+                                 ("stream": true) or a single JSON completion
+
+PERFORMANCE MODEL (PerformanceModel, all times × time_scale):
+  context    ≈ characters of all messages / 4
+  VRAM       weights + KV cache of every active request (kv_mb_per_token each)
+  spill      KV that does not fit in VRAM lives in system RAM; every step is
+             slowed by 1 + spill_penalty × (fraction of KV spilled)
+  TTFT       context / prefill_tps × (1 + (context / max_context)²) × spill
+  decode     per-request TPS = decode_tps / active^batch_exponent
+                                / (1 + context / attention_half) / spill
+  refusal    context > max_context → HTTP 400 (as LM Studio does)
+
+With the defaults (8 GB card, 7.25 GB of weights, 128 KB/token of KV) the
+KV budget is 6144 tokens: a single stream falls off the KV-cache cliff at
+~6k tokens, below MAX_CONTEXT, and the cliff moves lower as concurrency rises.
+
+Run:  python stub_inference_server.py --port 1234 [--time-scale 0.1]
+      python async_load_generator.py --url http://127.0.0.1:1234/v1/chat/completions
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+MODEL_ID = "rid/stub-8b"
+MAX_CONTEXT = 8192
+CHARS_PER_TOKEN = 4
+
+
+@dataclass
+class PerformanceModel:
+    max_context: int = MAX_CONTEXT
+    prefill_tps: float = 4000.0         # prompt tokens/s with an empty cache
+    decode_tps: float = 60.0            # generated tokens/s for one short-context stream
+    batch_exponent: float = 0.6         # aggregate decode grows as active^(1 − batch_exponent)
+    attention_half: float = 16384.0     # context at which decode speed halves
+    vram_mb: float = 8192.0
+    weights_mb: float = 7424.0          # leaves 768 MB of KV: 6144 tokens < max_context
+    kv_mb_per_token: float = 0.125
+    spill_penalty: float = 12.0         # slowdown when all KV is in system RAM
+    jitter: float = 0.0                 # relative uniform noise on every delay
+    time_scale: float = 1.0             # multiply every delay (0.01 = 100× faster)
+
+    @property
+    def kv_capacity_tokens(self) -> float:
+        """Total KV tokens that fit in VRAM next to the weights."""
+        return max(0.0, self.vram_mb - self.weights_mb) / self.kv_mb_per_token
+
+    def spill(self, kv_tokens: float) -> float:
+        """Slowdown factor ≥ 1 for `kv_tokens` of KV cache across all active requests."""
+        if kv_tokens <= 0:
+            return 1.0
+        overflow = max(0.0, kv_tokens - self.kv_capacity_tokens) / kv_tokens
+        return 1.0 + self.spill_penalty * overflow
+
+    def ttft(self, context: int, kv_tokens: float) -> float:
+        """Prefill time (unscaled seconds) for one request."""
+        quad = 1.0 + (context / self.max_context) ** 2
+        return context / self.prefill_tps * quad * self.spill(kv_tokens)
+
+    def token_interval(self, context: int, active: int, kv_tokens: float) -> float:
+        """Seconds (unscaled) between two generated tokens of one request."""
+        tps = self.decode_tps / max(1, active) ** self.batch_exponent
+        tps /= (1.0 + context / self.attention_half) * self.spill(kv_tokens)
+        return 1.0 / tps
+
+
+def estimate_tokens(messages) -> int:
+    chars = sum(len(m.get("content") or "") for m in messages if isinstance(m, dict))
+    return chars // CHARS_PER_TOKEN
+
+
+class StubInferenceServer:
+    """
+    asyncio server implementing the subset of the OpenAI API the harnesses use.
+
+        async with StubInferenceServer(PerformanceModel(time_scale=0.01)) as srv:
+            url = srv.url           # http://127.0.0.1:<port>/v1/chat/completions
+    """
+
+    def __init__(self, perf: Optional[PerformanceModel] = None, host: str = "127.0.0.1", port: int = 0,
+                 model_id: str = MODEL_ID, seed: int = 0):
+        self.perf = perf or PerformanceModel()
+        self.host, self.port = host, port
+        self.model_id = model_id
+        self._rng = random.Random(seed)
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._active: Dict[int, int] = {}       # request id → context tokens (KV held)
+        self._next_id = 0
+        self.served = 0
+        self.rejected = 0
+        self.peak_active = 0
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}/v1/chat/completions"
+
+    @property
+    def kv_tokens(self) -> int:
+        return sum(self._active.values())
+
+    async def start(self) -> "StubInferenceServer":
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def __aenter__(self):
+        return await self.start()
+
+    async def __aexit__(self, *exc):
+        await self.stop()
+
+    async def serve_forever(self) -> None:
+        if self._server is None:
+            await self.start()
+        await self._server.serve_forever()
+
+    # -- HTTP --------------------------------------------------------------------
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+                    break
+                lines = head.decode("latin-1").split("\r\n")
+                method, path = (lines[0].split(" ") + ["", ""])[:2]
+                headers = {}
+                for line in lines[1:]:
+                    name, _, value = line.partition(":")
+                    if name:
+                        headers[name.strip().lower()] = value.strip()
+                body = await reader.readexactly(int(headers.get("content-length", "0") or 0))
+                await self._route(method, path, body, writer)
+                if headers.get("connection", "").lower() == "close":
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def _send_json(self, writer, status: int, obj) -> None:
+        reason = {200: "OK", 400: "Bad Request", 404: "Not Found"}.get(status, "Error")
+        data = json.dumps(obj).encode()
+        writer.write(f"HTTP/1.1 {status} {reason}\r\nContent-Type: application/json\r\n"
+                     f"Content-Length: {len(data)}\r\n\r\n".encode() + data)
+        await writer.drain()
+
+    async def _route(self, method: str, path: str, body: bytes, writer) -> None:
+        path = path.split("?", 1)[0].rstrip("/")
+        if method == "GET" and path == "/v1/models":
+            await self._send_json(writer, 200, {"object": "list", "data": [
+                {"id": self.model_id, "object": "model", "owned_by": "rid"}]})
+        elif method == "POST" and path == "/v1/chat/completions":
+            try:
+                req = json.loads(body or b"{}")
+            except json.JSONDecodeError:
+                await self._send_json(writer, 400, {"error": {"message": "invalid JSON body"}})
+                return
+            await self._chat(req, writer)
+        else:
+            await self._send_json(writer, 404, {"error": {"message": f"no route for {method} {path}"}})
+
+    # -- inference ---------------------------------------------------------------
+
+    async def _sleep(self, seconds: float) -> None:
+        if self.perf.jitter:
+            seconds *= 1.0 + self._rng.uniform(-self.perf.jitter, self.perf.jitter)
+        await asyncio.sleep(seconds * self.perf.time_scale)
+
+    async def _chat(self, req: dict, writer) -> None:
+        context = estimate_tokens(req.get("messages") or [])
+        if context > self.perf.max_context:
+            self.rejected += 1
+            await self._send_json(writer, 400, {"error": {
+                "message": f"context length {context} exceeds the model's {self.perf.max_context} tokens"}})
+            return
+        n_gen = max(1, int(req.get("max_tokens") or 16))
+        stream = bool(req.get("stream"))
+        rid = self._next_id
+        self._next_id += 1
+        created = int(time.time())
+        cid = f"chatcmpl-stub-{rid}"
+
+        self._active[rid] = context
+        self.peak_active = max(self.peak_active, len(self._active))
+        try:
+            if stream:
+                writer.write(b"HTTP/1.1 200 OK\r\nContent-Type: text/event-stream\r\n"
+                             b"Cache-Control: no-cache\r\nTransfer-Encoding: chunked\r\n\r\n")
+                await self._chunk(writer, self._sse(cid, created, {"role": "assistant"}))
+            await self._sleep(self.perf.ttft(context, self.kv_tokens))
+            text = []
+            for i in range(n_gen):
+                if i:
+                    await self._sleep(self.perf.token_interval(context, len(self._active), self.kv_tokens))
+                piece = f"tok{i} "
+                text.append(piece)
+                self._active[rid] = context + i + 1         # KV grows with every generated token
+                if stream:
+                    await self._chunk(writer, self._sse(cid, created, {"content": piece}))
+            if stream:
+                await self._chunk(writer, self._sse(cid, created, {}, finish="length"))
+                await self._chunk(writer, b"data: [DONE]\n\n")
+                writer.write(b"0\r\n\r\n")
+                await writer.drain()
+            else:
+                await self._send_json(writer, 200, {
+                    "id": cid, "object": "chat.completion", "created": created, "model": self.model_id,
+                    "choices": [{"index": 0, "finish_reason": "length",
+                                 "message": {"role": "assistant", "content": "".join(text)}}],
+                    "usage": {"prompt_tokens": context, "completion_tokens": n_gen,
+                              "total_tokens": context + n_gen},
+                })
+            self.served += 1
+        finally:
+            del self._active[rid]
+
+    def _sse(self, cid: str, created: int, delta: dict, finish: Optional[str] = None) -> bytes:
+        chunk = {"id": cid, "object": "chat.completion.chunk", "created": created, "model": self.model_id,
+                 "choices": [{"index": 0, "delta": delta, "finish_reason": finish}]}
+        return b"data: " + json.dumps(chunk).encode() + b"\n\n"
+
+    async def _chunk(self, writer, data: bytes) -> None:
+        writer.write(b"%x\r\n" % len(data) + data + b"\r\n")
+        await writer.drain()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local OpenAI-compatible stand-in inference server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=1234)
+    parser.add_argument("--model-id", default=MODEL_ID)
+    parser.add_argument("--max-context", type=int, default=MAX_CONTEXT)
+    parser.add_argument("--vram-mb", type=float, default=8192.0)
+    parser.add_argument("--weights-mb", type=float, default=7424.0)
+    parser.add_argument("--kv-mb-per-token", type=float, default=0.125)
+    parser.add_argument("--prefill-tps", type=float, default=4000.0)
+    parser.add_argument("--decode-tps", type=float, default=60.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--time-scale", type=float, default=1.0, help="multiply every delay (0.01 = 100x faster)")
+    args = parser.parse_args()
+
+    perf = PerformanceModel(max_context=args.max_context, prefill_tps=args.prefill_tps,
+                            decode_tps=args.decode_tps, vram_mb=args.vram_mb, weights_mb=args.weights_mb,
+                            kv_mb_per_token=args.kv_mb_per_token, jitter=args.jitter,
+                            time_scale=args.time_scale)
+    server = StubInferenceServer(perf, args.host, args.port, args.model_id)
+
+    async def run():
+        await server.start()
+        print("=" * 80)
+        print("  RID STUB INFERENCE SERVER — OpenAI-compatible, simulated KV-cache cliff")
+        print(f"  {server.url} | model {server.model_id} | KV fits {perf.kv_capacity_tokens:.0f} tokens "
+              f"| time scale {perf.time_scale:g}")
+        print("=" * 80)
+        await server.serve_forever()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        print(f"\n  Served {server.served} requests | rejected {server.rejected} | "
+              f"peak concurrency {server.peak_active}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,8 @@
 import subprocess
 import csv
+import glob
 import os
+import sys
 import time
 
 def get_cpu_temperature_hwinfo(csv_path: str) -> float:
@@ -81,20 +83,129 @@ def get_cpu_temp_powershell() -> float:
     return -1.0
 
 
+# --- Pluggable sensor backends ---------------------------------------------
+# A backend is any object with read() -> float (°C, or -1.0 when unavailable).
+
+# hwmon temp*_label values that name the package/die sensor, most specific first
+HWMON_PACKAGE_LABELS = ("Package id 0", "Tctl", "Tdie", "CPU Temperature", "CPU")
+# hwmon driver names that expose CPU temperatures
+HWMON_CPU_DRIVERS = ("coretemp", "k10temp", "zenpower", "cpu_thermal")
+# thermal_zone types for the CPU package
+THERMAL_ZONE_TYPES = ("x86_pkg_temp", "cpu-thermal", "cpu_thermal", "soc_thermal")
+
+
+def _read_text(path: str) -> str:
+    try:
+        with open(path, "r") as f:
+            return f.read().strip()
+    except OSError:
+        return ""
+
+
+class SysfsThermalBackend:
+    """
+    Linux sysfs backend: /sys/class/hwmon and /sys/class/thermal.
+
+    Discovery runs once: the package sensor is chosen by hwmon label, then by CPU
+    hwmon driver, then by thermal_zone type. The chosen file is kept open and
+    reread with os.pread each tick (no open/close, no subprocess), so a read is a
+    single syscall. `root` replaces "/sys" so a fake tree can be used in tests.
+    """
+
+    def __init__(self, root: str = "/sys"):
+        self.root = root
+        self.path = self._discover()
+        self._fd = os.open(self.path, os.O_RDONLY) if self.path else None
+
+    def _discover(self) -> str:
+        hwmons = sorted(glob.glob(os.path.join(self.root, "class", "hwmon", "hwmon*")))
+        by_label = {}
+        driver_inputs = []
+        for hw in hwmons:
+            driver = _read_text(os.path.join(hw, "name"))
+            for inp in sorted(glob.glob(os.path.join(hw, "temp*_input"))):
+                label = _read_text(inp[:-len("_input")] + "_label")
+                if label and label not in by_label:
+                    by_label[label] = inp
+                if driver in HWMON_CPU_DRIVERS:
+                    driver_inputs.append(inp)
+        for label in HWMON_PACKAGE_LABELS:
+            if label in by_label:
+                return by_label[label]
+        if driver_inputs:
+            return driver_inputs[0]
+        zones = sorted(glob.glob(os.path.join(self.root, "class", "thermal", "thermal_zone*")))
+        for zone_type in THERMAL_ZONE_TYPES:
+            for zone in zones:
+                if _read_text(os.path.join(zone, "type")) == zone_type:
+                    return os.path.join(zone, "temp")
+        return ""
+
+    @property
+    def available(self) -> bool:
+        return self._fd is not None
+
+    def read(self) -> float:
+        """Package temperature in °C (sysfs reports millidegrees), -1.0 on failure."""
+        if self._fd is None:
+            return -1.0
+        try:
+            return int(os.pread(self._fd, 32, 0)) / 1000.0
+        except (OSError, ValueError):
+            return -1.0
+
+    def close(self) -> None:
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+
+class WindowsTelemetryBackend:
+    """Legacy chain: LibreHardwareMonitor/OpenHardwareMonitor WMI, then the HWiNFO CSV log."""
+
+    def __init__(self, csv_path: str = r"L:\Steel_Brain\RID\RID_Completed\Physical_Validation\cpu_test.csv"):
+        self.csv_path = csv_path
+
+    def read(self) -> float:
+        # 1. First try PowerShell (LHM/OHM WMI)
+        temp = get_cpu_temp_powershell()
+        if temp > 0:
+            return temp
+
+        # 2. If it fails, rely on the user having HWiNFO logging to `cpu_test.csv`
+        temp = get_cpu_temperature_hwinfo(self.csv_path)
+        if temp > 0:
+            return temp
+
+        return -1.0
+
+
+_backend = None
+
+
+def set_temperature_backend(backend) -> None:
+    """Install the backend used by get_cpu_temperature (None = auto-detect again)."""
+    global _backend
+    _backend = backend
+
+
+def get_temperature_backend():
+    """Current backend; auto-detects on first use (sysfs on Linux, WMI/HWiNFO elsewhere)."""
+    global _backend
+    if _backend is None:
+        if sys.platform.startswith("linux"):
+            sysfs = SysfsThermalBackend()
+            if sysfs.available:
+                _backend = sysfs
+                return _backend
+        _backend = WindowsTelemetryBackend()
+    return _backend
+
+
 def get_cpu_temperature() -> float:
     """Gets the dominant CPU temperature (Package/Tjunction)."""
-    # 1. First try PowerShell (LHM/OHM WMI)
-    temp = get_cpu_temp_powershell()
-    if temp > 0:
-        return temp
-        
-    # 2. If it fails, rely on the user having HWiNFO logging to `cpu_test.csv`
-    csv_fallback = r"L:\Steel_Brain\RID\RID_Completed\Physical_Validation\cpu_test.csv"
-    temp = get_cpu_temperature_hwinfo(csv_fallback)
-    if temp > 0:
-        return temp
-        
-    return -1.0
+    return get_temperature_backend().read()
+
 
 def calculate_cpu_thermal_ltp(current_temp: float, target_max: float = 95.0, target_safe: float = 75.0) -> float:
     """
@@ -1,19 +1,27 @@
 import time
-import csv
 import logging
 import multiprocessing
 import math
 import sys
+from pathlib import Path
 
 # Append L:\AIOS_V2 to the path so we can import the RID triangle
 sys.path.append(r"L:\AIOS_V2")
+# Repo root, for the bundled `rid` package (loop-lag instrumentation)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 try:
     from rid_core.triangle import stability_scalar
 except ImportError:
-    print("Failed to import AIOS V2 RID logic. Ensure it's executed from the right environment.")
-    sys.exit(1)
+    try:
+        from rid.triangle import stability_scalar
+    except ImportError:
+        print("Failed to import AIOS V2 RID logic. Ensure it's executed from the right environment.")
+        sys.exit(1)
 
+from rid.governor import DutyCycleGovernor, DutyCycleWorkerPool, ThreadGovernor, FURNACE_ACTIONS
+from rid.latency import LoopLagMonitor
+from rid.trace import TraceRecorder, trace_to_csv
 from cpu_sensors import get_cpu_temperature, calculate_cpu_thermal_ltp
 
 # Configure logging
@@ -23,6 +31,8 @@ logging.basicConfig(level=logging.INFO, format="%(message)s")
 THERMAL_MAX = 95.0  # Tjunction max cutoff safety buffer
 THERMAL_SAFE = 75.0  # Target optimal threshold
 PROCESS_UPDATE_INTERVAL = 0.5 # A bit slower to account for AIO fluid thermal inertia
+RESPONSE_DEADBAND_C = 0.5     # Temperature move that counts as the response to a thread change
+DUTY_PERIOD = 0.05            # PWM window for --duty mode (run duty * window, pause the rest)
 
 def mathematical_furnace_worker(run_event):
     """
@@ -42,7 +52,7 @@ def mathematical_furnace_worker(run_event):
             time.sleep(0.05)
 
 
-def cpu_thermal_governor_loop():
+def cpu_thermal_governor_loop(duty_mode: bool = False, csv_trace: bool = False):
     print("=" * 60)
     print(" IGNITING CPU THERMAL FURNACE (AIO Edition) ")
     print(" Hardware: Intel i7-11700F / Corsair H100i Elite Capellix ")
@@ -67,29 +77,47 @@ def cpu_thermal_governor_loop():
     max_workers = 16 
     workers = []
     run_events = []
+    pool = None
     
-    for _ in range(max_workers):
-        ev = multiprocessing.Event()
-        # Start them all paused
-        ev.clear() 
-        p = multiprocessing.Process(target=mathematical_furnace_worker, args=(ev,))
-        p.daemon = True
-        p.start()
-        workers.append(p)
-        run_events.append(ev)
+    if duty_mode:
+        # Continuous load: every worker burns for duty * DUTY_PERIOD of each window
+        pool = DutyCycleWorkerPool(max_workers, period=DUTY_PERIOD)
+        workers = pool.workers
+    else:
+        for _ in range(max_workers):
+            ev = multiprocessing.Event()
+            # Start them all paused
+            ev.clear() 
+            p = multiprocessing.Process(target=mathematical_furnace_worker, args=(ev,))
+            p.daemon = True
+            p.start()
+            workers.append(p)
+            run_events.append(ev)
 
     tick = 0
     active_threads = 0
+    load = 0.0
+    if duty_mode:
+        # Same policy on a load fraction; +2/16 per tick mirrors the +2 thread ramp
+        governor = DutyCycleGovernor(ramp=2 / max_workers, actions=FURNACE_ACTIONS)
+    else:
+        governor = ThreadGovernor(max_workers=max_workers, ramp=2, actions=FURNACE_ACTIONS)
+    lag = LoopLagMonitor(control_period=PROCESS_UPDATE_INTERVAL, deadband=RESPONSE_DEADBAND_C)
     
-    csv_out = "cpu_thermal_trace.csv"
-    with open(csv_out, "w", newline="") as f:
-        writer = csv.writer(f)
-        writer.writerow(["Tick", "Temp_C", "LTP", "S_n", "Active_Threads", "Action"])
+    # Binary trace (rid.replay.load_trace reads it directly); --csv also writes cpu_thermal_trace.csv
+    # on exit, or convert later with: python -m rid.trace cpu_thermal_trace.rtrace cpu_thermal_trace.csv
+    trace_out = "cpu_thermal_trace.rtrace"
+    with TraceRecorder(trace_out, sensor_names=("temp_c", "load")) as recorder:
         
         try:
             while True:
                 # 1. READ PHYSICAL SENSORS
+                lag.tick()
+                t_read = time.perf_counter()
                 cpu_temp = get_cpu_temperature()
+                lag.sensor_read(time.perf_counter() - t_read)
+                if cpu_temp >= 0:
+                    lag.observe(cpu_temp)
                 
                 # 2. AIOS MATHEMATICS
                 # For this isolated 1-axis test, RSR and RLE = 1.0
@@ -99,45 +127,53 @@ def cpu_thermal_governor_loop():
                 s_n = stability_scalar(rsr_n, ltp_n, rle_n)
                 
                 # 3. RID GOVERNOR ACTIONS OVER MULTIPROCESSING
-                action = ""
-                
-                if s_n >= 1.0:
-                    action = "ADD_FUEL"
-                    # Add threads aggressively if we are safe, to fight liquid thermal inertia
-                    active_threads += 2
-                elif s_n > 0.0:
-                    action = "SHED_LOAD"
-                    # Cut active threads proportional to S_n
-                    # e.g., if S_n drops to 0.7, we instantly cut threads to 16 * 0.7 = 11.2 -> 11
-                    active_threads = int(max_workers * s_n)
+                # S_n >= 1: ADD_FUEL, +2 threads per tick to fight liquid thermal inertia.
+                # 0 < S_n < 1: SHED_LOAD, cut threads proportional to S_n
+                #   (e.g. S_n = 0.7 -> 16 * 0.7 = 11.2 -> 11).
+                # S_n <= 0: CRITICAL_COOLING, sleep everything.
+                # (--duty: the same bands set a continuous duty instead, e.g. S_n = 0.97 -> 97%.)
+                prev_load = load
+                if pool is not None:
+                    action, load = governor.step(s_n)
+                    pool.set_duty(load)
+                    active_threads = round(load * max_workers)
                 else:
-                    action = "CRITICAL_COOLING"
-                    active_threads = 0 # Sleep everything
-                
-                active_threads = max(0, min(max_workers, active_threads))
-                
-                # Apply the fuel adjustment across the core topology
-                for i in range(max_workers):
-                    if i < active_threads:
-                        run_events[i].set()
-                    else:
-                        run_events[i].clear()
+                    action, active_threads = governor.step(s_n)
+                    load = active_threads / max_workers
+                    # Apply the fuel adjustment across the core topology
+                    for i in range(max_workers):
+                        if i < active_threads:
+                            run_events[i].set()
+                        else:
+                            run_events[i].clear()
+                if cpu_temp >= 0 and load != prev_load:
+                    # More load should heat the die, less should cool it.
+                    lag.actuate(load - prev_load, cpu_temp)
                 
                 # 4. LOGGING
-                logging.info(f"Tick {tick:04d} | Temp: {cpu_temp:04.1f}°C | LTP: {ltp_n:0.3f} | S_n: {s_n:0.3f} | Threads Pegged: {active_threads:02d} | Action: {action}")
-                writer.writerow([tick, cpu_temp, ltp_n, s_n, active_threads, action])
-                f.flush()
+                lag_flag = " | LAG" if lag.temporal_mismatch() else ""
+                load_str = f"Duty: {load * 100:05.1f}%" if pool is not None else f"Threads Pegged: {active_threads:02d}"
+                logging.info(f"Tick {tick:04d} | Temp: {cpu_temp:04.1f}°C | LTP: {ltp_n:0.3f} | S_n: {s_n:0.3f} | {load_str} | Action: {action}{lag_flag}")
+                recorder.append(time.time(), tick, rsr_n, ltp_n, rle_n, s_n, action,
+                                active_threads, (cpu_temp, load))
                 
                 tick += 1
                 time.sleep(PROCESS_UPDATE_INTERVAL)
 
         except KeyboardInterrupt:
             print("\n=================")
-            print("ABORTING TEST. SAVED THERMAL TRACE.")
+            print(f"ABORTING TEST. SAVED THERMAL TRACE ({trace_out}, {recorder.count} ticks).")
+            print(lag.describe())
             print("Killing workers...")
             for p in workers:
                 p.terminate()
             print("=================")
+
+    if csv_trace:
+        csv_out = "cpu_thermal_trace.csv"
+        print(f"Wrote {trace_to_csv(trace_out, csv_out)} rows to {csv_out}")
                 
 if __name__ == "__main__":
-    cpu_thermal_governor_loop()
+    # --duty: proportional PWM load instead of switching whole workers
+    # --csv:  also write the trace as CSV when the run ends
+    cpu_thermal_governor_loop(duty_mode="--duty" in sys.argv[1:], csv_trace="--csv" in sys.argv[1:])
@@ -1,22 +1,32 @@
 import time
-import csv
 import logging
 import multiprocessing
 import math
 import sys
 import psutil
 import random
-import copy
+from pathlib import Path
 
 # Append L:\AIOS_V2 to the path so we can import the RID triangle
 sys.path.append(r"L:\AIOS_V2")
+# Repo root, for the bundled `rid` package (loop-lag instrumentation)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 try:
     from rid_core.triangle import stability_scalar
 except ImportError:
-    print("Failed to import AIOS V2 RID logic. Ensure it's executed from the right environment.")
-    sys.exit(1)
+    try:
+        from rid.triangle import stability_scalar
+    except ImportError:
+        print("Failed to import AIOS V2 RID logic. Ensure it's executed from the right environment.")
+        sys.exit(1)
 
+from rid.governor import DutyCycleGovernor, DutyCycleWorkerPool, ThreadGovernor, TRI_AXIS_ACTIONS
+from rid.drift import DriftTracker
+from rid.latency import LoopLagMonitor
+from rid.rle_sources import default_memory_rle_source
+from rid.sampler import SensorSampler
+from rid.trace import TraceRecorder, trace_to_csv
 from cpu_sensors import get_cpu_temperature, calculate_cpu_thermal_ltp
 
 # Configure logging
@@ -26,6 +36,8 @@ logging.basicConfig(level=logging.INFO, format="%(message)s")
 THERMAL_MAX = 95.0
 THERMAL_SAFE = 75.0
 PROCESS_UPDATE_INTERVAL = 0.5
+RESPONSE_DEADBAND_C = 0.5  # Temperature move that counts as the response to a thread change
+DUTY_PERIOD = 0.05         # PWM window for --duty mode (run duty * window, pause the rest)
 
 # --- SYSTEM RAM CONSTANTS FOR RLE ---
 RAM_MAX_PERCENT = 95.0
@@ -35,13 +47,14 @@ RAM_SAFE_PERCENT = 80.0
 RSR_MAX_TOLERANCE = 1000.0  # Max permitted distance before identity loss
 
 
-def calculate_ram_rle(safe_pct: float, max_pct: float) -> float:
+def calculate_ram_rle(safe_pct: float, max_pct: float, current_pct: float = None) -> float:
     """
     RLE is 1.0 when memory is safe.
     It decays towards 0.0 as RAM approaches the maximum capacity (OS freeze limit).
+    Pass current_pct from a snapshot to avoid a second virtual_memory() call.
     """
-    mem = psutil.virtual_memory()
-    current_pct = mem.percent
+    if current_pct is None:
+        current_pct = psutil.virtual_memory().percent
     
     if current_pct <= safe_pct:
         return 1.0
@@ -55,6 +68,7 @@ def calculate_rsr_drift(working_matrix: list, baseline_matrix: list) -> float:
     """
     Calculates RSR by measuring the L2 Discrepancy between the working soul memory and the baseline.
     As bit-flips accumulate, the distance grows, and RSR decays towards 0.0.
+    Full O(n) reference; the loop keeps the same value incrementally with DriftTracker.
     """
     dist = 0.0
     for w, b in zip(working_matrix, baseline_matrix):
@@ -83,7 +97,7 @@ def mathematical_furnace_worker(run_event):
             time.sleep(0.05)
 
 
-def tri_axis_furnace_loop():
+def tri_axis_furnace_loop(duty_mode: bool = False, csv_trace: bool = False):
     print("=" * 70)
     print(" FATAL TRI-AXIS PHYSICS ENGINE (Full Triangle Validation) ")
     print(" Hardware: Core i7-11700F / 32GB RAM ")
@@ -100,18 +114,39 @@ def tri_axis_furnace_loop():
     max_workers = 16 
     workers = []
     run_events = []
+    pool = None
     
-    for _ in range(max_workers):
-        ev = multiprocessing.Event()
-        ev.clear() 
-        p = multiprocessing.Process(target=mathematical_furnace_worker, args=(ev,))
-        p.daemon = True
-        p.start()
-        workers.append(p)
-        run_events.append(ev)
+    if duty_mode:
+        # Continuous load: every worker burns for duty * DUTY_PERIOD of each window
+        pool = DutyCycleWorkerPool(max_workers, period=DUTY_PERIOD)
+        workers = pool.workers
+    else:
+        for _ in range(max_workers):
+            ev = multiprocessing.Event()
+            ev.clear() 
+            p = multiprocessing.Process(target=mathematical_furnace_worker, args=(ev,))
+            p.daemon = True
+            p.start()
+            workers.append(p)
+            run_events.append(ev)
 
     tick = 0
     active_threads = 0
+    load = 0.0
+    if duty_mode:
+        governor = DutyCycleGovernor(ramp=2 / max_workers, actions=TRI_AXIS_ACTIONS)
+    else:
+        governor = ThreadGovernor(max_workers=max_workers, ramp=2, actions=TRI_AXIS_ACTIONS)
+    lag = LoopLagMonitor(control_period=PROCESS_UPDATE_INTERVAL, deadband=RESPONSE_DEADBAND_C)
+    
+    # One concurrent read of every sensor per tick; a slow probe keeps its last good value
+    sampler = SensorSampler(ttl=PROCESS_UPDATE_INTERVAL * 0.8)
+    sampler.add_source("temp_c", get_cpu_temperature, timeout=PROCESS_UPDATE_INTERVAL * 0.8, default=-1.0)
+    sampler.add_source("ram_pct", lambda: psutil.virtual_memory().percent, timeout=0.1, default=0.0)
+    # Linux: memory PSI / cgroup v2 RLE fires on stall time before the percentage ramp does
+    memory_rle = default_memory_rle_source()
+    if memory_rle is not None:
+        sampler.add_source("rle_pressure", memory_rle.rle, timeout=0.1, default=1.0)
     
     # RLE Garbage Allocation (RAM Soaking)
     garbage_memory = []
@@ -119,12 +154,13 @@ def tri_axis_furnace_loop():
     
     # RSR Structural Baseline (Soul Anchor)
     baseline_matrix = [1.0] * 500
-    working_matrix = copy.deepcopy(baseline_matrix)
+    # Running L2 distance to the anchor, updated only for the elements that flip
+    identity = DriftTracker(baseline_matrix, tolerance=RSR_MAX_TOLERANCE)
     
-    csv_out = "tri_axis_trace.csv"
-    with open(csv_out, "w", newline="") as f:
-        writer = csv.writer(f)
-        writer.writerow(["Tick", "Temp_C", "LTP", "RAM_Pct", "RLE", "RSR_Dist", "RSR", "S_n", "Active_Threads", "Action"])
+    # Binary trace (rid.replay.load_trace reads it directly); --csv also writes tri_axis_trace.csv
+    # on exit, or convert later with: python -m rid.trace tri_axis_trace.rtrace tri_axis_trace.csv
+    trace_out = "tri_axis_trace.rtrace"
+    with TraceRecorder(trace_out, sensor_names=("temp_c", "ram_pct", "rsr_dist")) as recorder:
         
         try:
             while True:
@@ -132,18 +168,27 @@ def tri_axis_furnace_loop():
                 # 1. READ PHYSICAL SENSORS / CALCULATE AXES
                 # ==========================================
                 
+                lag.tick()
+                snap = sampler.sample()
+                
                 # --- Axis 1: LTP (Thermals) ---
-                cpu_temp = get_cpu_temperature()
+                cpu_temp = snap["temp_c"]
+                if "temp_c" in snap.latency:
+                    lag.sensor_read(snap.latency["temp_c"])
+                if cpu_temp >= 0 and snap.is_fresh("temp_c"):
+                    lag.observe(cpu_temp)
                 ltp_n = calculate_cpu_thermal_ltp(cpu_temp, target_max=THERMAL_MAX, target_safe=THERMAL_SAFE)
                 
                 # --- Axis 2: RLE (RAM Entropy) ---
-                rle_n = calculate_ram_rle(RAM_SAFE_PERCENT, RAM_MAX_PERCENT)
-                ram_pct = psutil.virtual_memory().percent
+                ram_pct = snap["ram_pct"]
+                rle_n = calculate_ram_rle(RAM_SAFE_PERCENT, RAM_MAX_PERCENT, ram_pct)
+                if "rle_pressure" in snap:
+                    rle_n = min(rle_n, snap["rle_pressure"])
                 
                 # --- Axis 3: RSR (Identity Drift) ---
-                rsr_n = calculate_rsr_drift(working_matrix, baseline_matrix)
-                # Calculate absolute drift for logging
-                rsr_dist = math.sqrt(sum((w - b)**2 for w, b in zip(working_matrix, baseline_matrix)))
+                rsr_n = identity.rsr()
+                # Absolute drift for logging
+                rsr_dist = identity.distance()
                 
                 # ==========================================
                 # 2. THE GRAND TRIANGLE EQUATION
@@ -160,72 +205,85 @@ def tri_axis_furnace_loop():
                     garbage_memory.append(bytearray(allocation_chunk_size))
                 
                 # 2. Continuous Hardware Faults / Radiation
-                for _ in range(100):
-                    idx = random.randint(0, len(working_matrix) - 1)
-                    working_matrix[idx] += random.uniform(-10.0, 10.0)
+                flips = [random.randint(0, len(identity) - 1) for _ in range(100)]
+                identity.add(flips, [random.uniform(-10.0, 10.0) for _ in flips])
 
                 # --- OS Governor Logic (Reacting to S_n) ---
-                action = ""
-                if s_n >= 1.0:
-                    action = "ADD_STRESS"
-                    # The OS feels perfectly safe natively, so it ramps up CPU workload
-                    active_threads = min(max_workers, active_threads + 2)
-                        
-                elif s_n > 0.0:
-                    action = f"GOVERN_S_N"
-                    
-                    # 1. Throttle CPU proportionally purely by mathematical S_n
-                    active_threads = int(max_workers * s_n)
-                    
-                    # 2. Free Memory proportional to RLE collapse
+                # ADD_STRESS: the OS feels perfectly safe natively, so it ramps up CPU workload.
+                # GOVERN_S_N: throttle CPU proportionally purely by mathematical S_n.
+                # CRITICAL_COLLAPSE: drop every worker.
+                # (--duty: the same bands set a continuous duty instead of whole workers.)
+                prev_load = load
+                if pool is not None:
+                    action, load = governor.step(s_n)
+                    active_threads = round(load * max_workers)
+                else:
+                    action, active_threads = governor.step(s_n)
+                    load = active_threads / max_workers
+
+                if action == "GOVERN_S_N":
+                    # Free Memory proportional to RLE collapse
                     # The OS desperately tries to free memory to fight the external leak
                     target_chunks = int(len(garbage_memory) * s_n)
                     while len(garbage_memory) > target_chunks:
                         garbage_memory.pop()
                         
-                    # 3. No Structural Healing!
+                    # No Structural Healing!
                     # RSR will monotonically decay due to constant environmental noise
                     # until S_n collapses to 0.0.
-                else:
-                    action = "CRITICAL_COLLAPSE"
-                    active_threads = 0
+                elif action == "CRITICAL_COLLAPSE":
                     garbage_memory.clear() # Dump all RAM stress
-                    working_matrix = copy.deepcopy(baseline_matrix) # Hard reset identity
+                    identity.reset() # Hard reset identity
                 
-                active_threads = max(0, min(max_workers, active_threads))
+                if cpu_temp >= 0 and load != prev_load:
+                    # More load should heat the die, less should cool it.
+                    lag.actuate(load - prev_load, cpu_temp)
                 
                 # Dispatch CPU workload instructions
-                for i in range(max_workers):
-                    if i < active_threads:
-                        run_events[i].set()
-                    else:
-                        run_events[i].clear()
+                if pool is not None:
+                    pool.set_duty(load)
+                else:
+                    for i in range(max_workers):
+                        if i < active_threads:
+                            run_events[i].set()
+                        else:
+                            run_events[i].clear()
                 
                 # ==========================================
                 # 4. LOGGING
                 # ==========================================
                 # Format a precise clean log output
+                load_str = f"Duty:{load * 100:05.1f}%" if pool is not None else f"Th:{active_threads:02d}"
                 log_str = (f"Tk {tick:04d} | "
                            f"LTP:{ltp_n:0.3f} (T:{cpu_temp:04.1f}C) | "
                            f"RLE:{rle_n:0.3f} (R:{ram_pct:04.1f}%) | "
                            f"RSR:{rsr_n:0.3f} (D:{rsr_dist:06.1f}) | "
-                           f"S_n: {s_n:0.3f} | Th:{active_threads:02d} | Act: {action}")
+                           f"S_n: {s_n:0.3f} | {load_str} | Act: {action}"
+                           f"{' | LAG' if lag.temporal_mismatch() else ''}")
                            
                 logging.info(log_str)
-                writer.writerow([tick, cpu_temp, ltp_n, ram_pct, rle_n, rsr_dist, rsr_n, s_n, active_threads, action])
-                f.flush()
+                recorder.append(time.time(), tick, rsr_n, ltp_n, rle_n, s_n, action,
+                                active_threads, (cpu_temp, ram_pct, rsr_dist))
                 
                 tick += 1
                 time.sleep(PROCESS_UPDATE_INTERVAL)
 
         except KeyboardInterrupt:
             print("\n=================")
-            print("ABORTING TEST. SAVED THERMAL TRACE.")
+            print(f"ABORTING TEST. SAVED THERMAL TRACE ({trace_out}, {recorder.count} ticks).")
+            print(lag.describe())
             print("Cleaning up memory and dropping workers...")
+            sampler.close()
             garbage_memory.clear()
             for p in workers:
                 p.terminate()
             print("=================")
+
+    if csv_trace:
+        csv_out = "tri_axis_trace.csv"
+        print(f"Wrote {trace_to_csv(trace_out, csv_out)} rows to {csv_out}")
                 
 if __name__ == "__main__":
-    tri_axis_furnace_loop()
+    # --duty: proportional PWM load instead of switching whole workers
+    # --csv:  also write the trace as CSV when the run ends
+    tri_axis_furnace_loop(duty_mode="--duty" in sys.argv[1:], csv_trace="--csv" in sys.argv[1:])
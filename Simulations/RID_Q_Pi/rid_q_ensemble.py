@@ -0,0 +1,181 @@
+import argparse
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+
+from rid_q_sim import (H_BAR, OMEGA, LP_NORMALIZED, START_SIZE, LOCK_SIZE, HIT_BUFFER_LEN, SPIN_SPREAD,
+                       MAX_TICKS)
+
+# ======================================================================
+# RID QUANTUM PI - ENSEMBLE ENGINE
+# ======================================================================
+# Advances thousands of independent T1/T2/T3 triplets of rid_q_sim.py as
+# NumPy arrays, one tick at a time, until every triplet phase-locks.
+#
+#   member state:  size (E, 3), rotation (E, 3), spin_rate (E, 3)
+#   hit history:   ring buffer (E, HIT_BUFFER_LEN) + per-member write index
+#                  (the three triangles of a triplet record the same particle)
+#   RNG:           one seeded Generator per ensemble run (SeedSequence(seed))
+#
+# Tick order matches run_simulation: measure, step, S_MASTER, check locks.
+# A member that locks is frozen; nothing is printed until the run returns.
+
+E_0 = H_BAR * OMEGA * 0.5
+S_MAX = np.log(2.0)
+
+
+def axes(size):
+    """(RLE_Q, LTP_Q, RSR_Q) for an array of containment sizes (QuantumTriangle._calc_*)."""
+    uncertainty_product = np.maximum(size * (1.0 / (size + 1e-10)), H_BAR / 2)
+    r = E_0 / uncertainty_product
+    rle_q = r / (r + 1)
+    rle = np.minimum(1.0, np.maximum(0.0, (rle_q - 0.5) * 2.0) + size)
+
+    ltp = 1.0 / (1.0 + size * 0.5)
+
+    p = np.clip(1.0 - size * 0.5, 0.001, 0.999)
+    s_rho = -(p * np.log(p) + (1 - p) * np.log(1 - p))
+    rsr = 1.0 - s_rho / S_MAX
+    return rle, ltp, rsr
+
+
+@dataclass
+class EnsembleResult:
+    seed: int
+    lock_tick: np.ndarray               # (E,) tick of full lock, -1 if max_ticks ran out
+    final_s_master: np.ndarray          # (E,) S_MASTER at the lock tick (or the last tick)
+    final_size: np.ndarray              # (E, 3)
+    hit_buffer: np.ndarray              # (E, HIT_BUFFER_LEN) oldest hit first
+    s_master: Optional[np.ndarray]      # (T, E) float32, NaN once a member has locked
+    axes: Optional[np.ndarray]          # (T, E, 3 triangles, 3 axes RLE/LTP/RSR) float32
+
+    @property
+    def locked(self) -> np.ndarray:
+        return self.lock_tick >= 0
+
+    def summary(self) -> dict:
+        ticks = self.lock_tick[self.locked]
+        q = [5, 50, 95]
+        return {
+            "members": int(self.lock_tick.size),
+            "locked": int(ticks.size),
+            "lock_tick_mean": float(ticks.mean()) if ticks.size else float("nan"),
+            "lock_tick_pct": np.percentile(ticks, q).tolist() if ticks.size else [],
+            "s_master_mean": float(self.final_s_master.mean()),
+            "s_master_std": float(self.final_s_master.std()),
+            "s_master_pct": np.percentile(self.final_s_master, q).tolist(),
+        }
+
+
+def run_ensemble(
+    n_ensemble: int = 1024,
+    seed: int = 0,
+    start_size=START_SIZE,
+    step_size=LP_NORMALIZED,
+    lock_size=LOCK_SIZE,
+    spin_spread=SPIN_SPREAD,
+    max_ticks: int = MAX_TICKS,
+    buffer_len: int = HIT_BUFFER_LEN,
+    record: bool = True,
+) -> EnsembleResult:
+    """
+    Run n_ensemble triplets to phase lock. start_size, step_size, lock_size and
+    spin_spread are scalars or per-member (E,) arrays. record=False skips the
+    per-tick trajectories.
+    """
+    E = n_ensemble
+    rng = np.random.default_rng(np.random.SeedSequence(seed))
+    start = np.broadcast_to(np.asarray(start_size, dtype=np.float64), (E,))
+    step = np.broadcast_to(np.asarray(step_size, dtype=np.float64), (E,))[:, None]
+    lock = np.broadcast_to(np.asarray(lock_size, dtype=np.float64), (E,))[:, None]
+    spread = np.broadcast_to(np.asarray(spin_spread, dtype=np.float64), (E,))[:, None]
+
+    size = np.repeat(start[:, None], 3, axis=1)
+    rotation = rng.uniform(0.0, 360.0, size=(E, 3))
+    spin_rate = 1.0 + rng.uniform(-1.0, 1.0, size=(E, 3)) * spread
+
+    hits = np.ones((E, buffer_len))
+    hit_pos = np.zeros(E, dtype=np.int64)
+
+    lock_tick = np.full(E, -1, dtype=np.int64)
+    final_s = np.zeros(E)
+    s_hist, axes_hist = [], []
+    idx = np.arange(E)
+
+    tick = 0
+    while idx.size and tick < max_ticks:
+        s = size[idx]
+        rot = rotation[idx]
+
+        # particle constrained by the overlapping, spiralling triangles
+        spiral = np.abs(np.sin(np.radians(rot[:, 0])) * np.cos(np.radians(rot[:, 1])))
+        max_bound = s.min(axis=1) * (0.5 + 0.5 * spiral)
+        particle = rng.uniform(-max_bound, max_bound)
+
+        # 1. measure axes and record the hit
+        rle, ltp, rsr = axes(s)
+        s_master = (rle * ltp * rsr).prod(axis=1)
+        hits[idx, hit_pos[idx]] = particle
+        hit_pos[idx] = (hit_pos[idx] + 1) % buffer_len
+
+        # 2. advance geometry
+        size[idx] = np.maximum(0.0, s - step[idx])
+        rotation[idx] = (rot + spin_rate[idx]) % 360
+
+        # 3-4. master consensus and phase locks
+        final_s[idx] = s_master
+        if record:
+            row = np.full(E, np.nan, dtype=np.float32)
+            row[idx] = s_master
+            s_hist.append(row)
+            ax = np.full((E, 3, 3), np.nan, dtype=np.float32)
+            ax[idx] = np.stack([rle, ltp, rsr], axis=-1)
+            axes_hist.append(ax)
+        full_lock = (size[idx] < lock[idx]).all(axis=1)
+        lock_tick[idx[full_lock]] = tick
+        idx = idx[~full_lock]
+        tick += 1
+
+    order = (hit_pos[:, None] + np.arange(buffer_len)) % buffer_len
+    return EnsembleResult(
+        seed=seed,
+        lock_tick=lock_tick,
+        final_s_master=final_s,
+        final_size=size,
+        hit_buffer=np.take_along_axis(hits, order, axis=1),
+        s_master=np.stack(s_hist) if record and s_hist else None,
+        axes=np.stack(axes_hist) if record and axes_hist else None,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="RID Quantum Pi ensemble engine")
+    parser.add_argument("--ensemble", type=int, default=4096, help="number of T1/T2/T3 triplets")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-ticks", type=int, default=MAX_TICKS)
+    parser.add_argument("--no-record", action="store_true", help="skip per-tick trajectories")
+    args = parser.parse_args()
+
+    result = run_ensemble(args.ensemble, seed=args.seed, max_ticks=args.max_ticks, record=not args.no_record)
+    stats = result.summary()
+
+    print("=" * 70)
+    print(" RID QUANTUM PI - ENSEMBLE ENGINE")
+    print("=" * 70)
+    print(f"  Members locked:   {stats['locked']} / {stats['members']}")
+    if stats["locked"]:
+        p5, p50, p95 = stats["lock_tick_pct"]
+        print(f"  Lock tick:        mean {stats['lock_tick_mean']:.1f} | p5 {p5:.0f} | p50 {p50:.0f} | p95 {p95:.0f}")
+    p5, p50, p95 = stats["s_master_pct"]
+    print(f"  Final S_MASTER:   mean {stats['s_master_mean']:.4e} ± {stats['s_master_std']:.4e}")
+    print(f"                    p5 {p5:.4e} | p50 {p50:.4e} | p95 {p95:.4e}")
+    if result.axes is not None and stats["locked"]:
+        members = np.flatnonzero(result.locked)
+        rle, ltp, rsr = result.axes[result.lock_tick[members], members].mean(axis=(0, 1))
+        print(f"  Axes at lock:     RLE_Q {rle:.4f} | LTP_Q {ltp:.4f} | RSR_Q {rsr:.4f}")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,7 @@
 import math
 import random
 import time
+from collections import deque
 
 # ======================================================================
 # RID QUANTUM PI - SIMULATION ENGINE
@@ -15,17 +16,24 @@ OMEGA = 1.0              # Normalized Angular Frequency
 LP_NORMALIZED = L_P * 1e35 * 0.002  # Normalized step size per tick
 START_SIZE = 1.0
 LOCK_THRESHOLD = 0.05
+LOCK_SIZE = 0.005                   # Containment size at which a triangle phase-locks
+HIT_BUFFER_LEN = 50
+SPIN_SPREAD = 0.1                   # spin_rate = 1 ± SPIN_SPREAD
+MAX_TICKS = 5000
 
 class QuantumTriangle:
-    def __init__(self, id_val):
+    def __init__(self, id_val, start_size=START_SIZE, step_size=LP_NORMALIZED, lock_size=LOCK_SIZE,
+                 spin_spread=SPIN_SPREAD, rng=random):
         self.id = id_val
-        self.size = START_SIZE
-        self.rotation = random.uniform(0, 360)
+        self.size = start_size
+        self.step_size = step_size
+        self.lock_size = lock_size
+        self.rotation = rng.uniform(0, 360)
         # Ensure triangles never perfectly align by giving them slightly different spin rates
-        self.spin_rate = 1.0 + random.uniform(-0.1, 0.1)
+        self.spin_rate = 1.0 + rng.uniform(-spin_spread, spin_spread)
         
         # Buffer to hold particle hits for phase lock detection
-        self.hit_buffer = [1.0] * 50
+        self.hit_buffer = deque([1.0] * HIT_BUFFER_LEN, maxlen=HIT_BUFFER_LEN)
 
     def _calc_rle_q(self):
         """
@@ -89,37 +97,46 @@ class QuantumTriangle:
         
         s_n = rle * ltp * rsr
         
-        # Shift the hit buffer
-        self.hit_buffer.pop(0)
+        # Shift the hit buffer (maxlen drops the oldest hit)
         self.hit_buffer.append(particle_x)
         
         return s_n
 
     def step(self):
-        self.size = max(0.0, self.size - LP_NORMALIZED)
+        self.size = max(0.0, self.size - self.step_size)
         self.rotation = (self.rotation + self.spin_rate) % 360
         
     def check_lock(self):
         # The system undergoes a phase lock only when containment reaches the absolute quantum limit.
-        return self.size < 0.005, 0
+        return self.size < self.lock_size, 0
 
-def run_simulation(fast_mode=False):
-    print("=" * 70)
-    print(" RID QUANTUM PI - SIMULATION ENGINE")
-    print(" Integrating Macro Bounds to Planck Length")
-    print("=" * 70)
+def run_simulation(fast_mode=False, start_size=START_SIZE, step_size=LP_NORMALIZED, lock_size=LOCK_SIZE,
+                   spin_spread=SPIN_SPREAD, max_ticks=MAX_TICKS, seed=None, verbose=True):
+    """
+    Run one T1/T2/T3 triplet to phase lock (or max_ticks). Returns a dict with
+    lock_tick (-1 if no lock), s_master and size; verbose=False prints nothing.
+    """
+    rng = random.Random(seed) if seed is not None else random
+    if verbose:
+        print("=" * 70)
+        print(" RID QUANTUM PI - SIMULATION ENGINE")
+        print(" Integrating Macro Bounds to Planck Length")
+        print("=" * 70)
     
-    t1 = QuantumTriangle("T1")
-    t2 = QuantumTriangle("T2")
-    t3 = QuantumTriangle("T3")
+    params = dict(start_size=start_size, step_size=step_size, lock_size=lock_size, spin_spread=spin_spread, rng=rng)
+    t1 = QuantumTriangle("T1", **params)
+    t2 = QuantumTriangle("T2", **params)
+    t3 = QuantumTriangle("T3", **params)
     
     tick = 0
     full_lock = False
+    lock_tick = -1
+    s_master = 0.0
     
     # We track the "spread" of the geometric locks to calculate Pi
     final_spreads = []
     
-    while not full_lock and tick < 5000:
+    while not full_lock and tick < max_ticks:
         
         # Simulate a particle strictly constrained by the geometry of the three overlapping triangles.
         # The true particle coordinate space is non-linear—it curves as the triangles spiral in.
@@ -129,7 +146,7 @@ def run_simulation(fast_mode=False):
         max_bound = base_bound * (0.5 + 0.5 * spiral_factor)
         
         # We model the particle randomly sampling the overlapping probability space
-        particle_x = random.uniform(-max_bound, max_bound)
+        particle_x = rng.uniform(-max_bound, max_bound)
         
         # 1. Measure axes
         s1 = t1.measure(particle_x)
@@ -151,7 +168,7 @@ def run_simulation(fast_mode=False):
         
         full_lock = lock1 and lock2 and lock3
         
-        if tick % 50 == 0 or full_lock:
+        if verbose and (tick % 50 == 0 or full_lock):
             l1 = "L" if lock1 else "-"
             l2 = "L" if lock2 else "-"
             l3 = "L" if lock3 else "-"
@@ -161,9 +178,14 @@ def run_simulation(fast_mode=False):
                 
         if full_lock:
             final_spreads = [spread1, spread2, spread3]
+            lock_tick = tick
             
         tick += 1
 
+    result = {"lock_tick": lock_tick, "s_master": s_master, "size": t1.size, "spreads": final_spreads}
+    if not verbose:
+        return result
+
     print("=" * 70)
     print(" PHASE LOCK ACHIEVED: Full Quantum Containment")
     print("=" * 70)
@@ -187,5 +209,7 @@ def run_simulation(fast_mode=False):
         print("  results in a complete physical collapse at the quantum level.")
         print()
 
+    return result
+
 if __name__ == "__main__":
     run_simulation(fast_mode=False)
@@ -0,0 +1,176 @@
+import argparse
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+import numpy as np
+
+from rid_q_sim import LP_NORMALIZED, START_SIZE, LOCK_SIZE, SPIN_SPREAD, MAX_TICKS
+from rid_q_ensemble import run_ensemble
+
+# ======================================================================
+# RID QUANTUM PI - PARAMETER SWEEP
+# ======================================================================
+# Runs the simulation over a full parameter grid on a process pool.
+#
+#   grid:     {knob: [values]} over PARAMS; configurations are the product,
+#             numbered in row-major (itertools.product) order
+#   tasks:    `chunk` consecutive configurations x `replicates`, run as one
+#             vectorized ensemble (rid_q_ensemble.run_ensemble)
+#   seeds:    task i uses SeedSequence(seed, spawn_key=(i,)), so results do
+#             not depend on worker count or completion order
+#   output:   out_dir/manifest.json + one part-NNNNNN.npz per task (columns:
+#             config, replicate, each knob, lock_tick, final_s_master)
+#   resume:   finished parts are skipped; parts are written to a temp file
+#             and renamed, so an interrupted sweep never leaves a torn part
+
+PARAMS = {
+    "step_size": LP_NORMALIZED,
+    "start_size": START_SIZE,
+    "lock_size": LOCK_SIZE,
+    "spin_spread": SPIN_SPREAD,
+}
+
+
+def grid_columns(grid):
+    """Flattened (n_configs,) columns for every knob, defaults filled in."""
+    unknown = set(grid) - set(PARAMS)
+    if unknown:
+        raise ValueError(f"unknown sweep parameters: {sorted(unknown)}")
+    names = list(PARAMS)
+    axes = [np.asarray(grid.get(name, [PARAMS[name]]), dtype=np.float64) for name in names]
+    mesh = np.meshgrid(*axes, indexing="ij")
+    return {name: m.ravel() for name, m in zip(names, mesh)}
+
+
+def _part_path(out_dir, task):
+    return Path(out_dir) / f"part-{task:06d}.npz"
+
+
+def run_task(out_dir, task, columns, config_start, replicates, seed, max_ticks):
+    """Run one chunk of configurations and write its part file. Returns the row count."""
+    configs = np.arange(config_start, config_start + len(columns["step_size"]))
+    params = {name: np.repeat(col, replicates) for name, col in columns.items()}
+    result = run_ensemble(
+        len(configs) * replicates,
+        seed=int(np.random.SeedSequence(seed, spawn_key=(task,)).generate_state(1)[0]),
+        max_ticks=max_ticks,
+        record=False,
+        **params,
+    )
+    path = _part_path(out_dir, task)
+    tmp = path.with_suffix(".tmp.npz")
+    np.savez(
+        tmp,
+        config=np.repeat(configs, replicates),
+        replicate=np.tile(np.arange(replicates), len(configs)),
+        lock_tick=result.lock_tick,
+        final_s_master=result.final_s_master,
+        **params,
+    )
+    os.replace(tmp, path)
+    return len(result.lock_tick)
+
+
+def run_sweep(grid, out_dir, replicates=16, chunk=256, seed=0, max_ticks=MAX_TICKS, workers=None, log=print):
+    """
+    Sweep `grid` into out_dir, skipping parts already written. Re-running with
+    a different grid, replicates, chunk, seed or max_ticks in the same
+    directory raises ValueError. Returns the number of tasks run.
+    """
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    columns = grid_columns(grid)
+    n_configs = len(columns["step_size"])
+    manifest = {
+        "grid": {name: [float(v) for v in grid.get(name, [PARAMS[name]])] for name in PARAMS},
+        "replicates": replicates,
+        "chunk": chunk,
+        "seed": seed,
+        "max_ticks": max_ticks,
+        "n_configs": n_configs,
+    }
+    manifest_path = out_dir / "manifest.json"
+    if manifest_path.exists():
+        if json.loads(manifest_path.read_text()) != manifest:
+            raise ValueError(f"{out_dir} holds a different sweep; use a new directory")
+    else:
+        manifest_path.write_text(json.dumps(manifest, indent=2))
+
+    n_tasks = -(-n_configs // chunk)
+    todo = [t for t in range(n_tasks) if not _part_path(out_dir, t).exists()]
+    if log:
+        log(f"Sweep: {n_configs} configs x {replicates} replicates, {n_tasks} tasks, {len(todo)} to run")
+    if not todo:
+        return 0
+
+    t0 = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = []
+        for task in todo:
+            lo = task * chunk
+            part = {name: col[lo:lo + chunk] for name, col in columns.items()}
+            futures.append(pool.submit(run_task, out_dir, task, part, lo, replicates, seed, max_ticks))
+        for done, fut in enumerate(as_completed(futures), 1):
+            fut.result()
+            if log and (done % 50 == 0 or done == len(futures)):
+                log(f"  {done}/{len(futures)} tasks | {time.perf_counter() - t0:.1f}s")
+    return len(todo)
+
+
+def load_sweep(out_dir):
+    """All finished parts concatenated into one dict of columns, sorted by (config, replicate)."""
+    parts = sorted(Path(out_dir).glob("part-*[0-9].npz"))
+    if not parts:
+        return {}
+    loaded = []
+    for p in parts:
+        with np.load(p) as d:
+            loaded.append({name: d[name] for name in d.files})
+    columns = {name: np.concatenate([d[name] for d in loaded]) for name in loaded[0]}
+    order = np.lexsort((columns["replicate"], columns["config"]))
+    return {name: col[order] for name, col in columns.items()}
+
+
+def _values(text):
+    """'a,b,c' or 'start:stop:num' (linspace) -> list of floats."""
+    if text.count(":") == 2:
+        start, stop, num = text.split(":")
+        return np.linspace(float(start), float(stop), int(num)).tolist()
+    return [float(v) for v in text.split(",")]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="RID Quantum Pi parameter sweep")
+    parser.add_argument("out_dir")
+    for name in PARAMS:
+        parser.add_argument(f"--{name.replace('_', '-')}", type=_values, metavar="VALUES",
+                            help=f"comma list or start:stop:num (default {PARAMS[name]})")
+    parser.add_argument("--replicates", type=int, default=16)
+    parser.add_argument("--chunk", type=int, default=256, help="configurations per task")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-ticks", type=int, default=MAX_TICKS)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    grid = {name: getattr(args, name) for name in PARAMS if getattr(args, name) is not None}
+    run_sweep(grid, args.out_dir, replicates=args.replicates, chunk=args.chunk, seed=args.seed,
+              max_ticks=args.max_ticks, workers=args.workers)
+
+    data = load_sweep(args.out_dir)
+    locked = data["lock_tick"] >= 0
+    print("=" * 70)
+    print(" RID QUANTUM PI - PARAMETER SWEEP")
+    print("=" * 70)
+    print(f"  Rows:             {locked.size}")
+    print(f"  Locked:           {int(locked.sum())}")
+    if locked.any():
+        print(f"  Lock tick:        min {data['lock_tick'][locked].min()} | max {data['lock_tick'][locked].max()}")
+    print(f"  Final S_MASTER:   mean {data['final_s_master'].mean():.4e}")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
@@ -17,6 +17,7 @@ import numpy as np
 
 from rid import rle_n, ltp_n, rsr_n, stability_scalar, diagnostic_step, discrepancy_01
 from rid.semantic_physics import UnifiedSemanticPhysics
+from rid.sampler import SensorSampler
 
 HW_INFO_DIR = Path(__file__).resolve().parent / "HW-Info"
 if str(HW_INFO_DIR) not in sys.path:
@@ -26,6 +27,16 @@ try:
 except ImportError:
     hw_telemetry = None
 
+
+@st.cache_resource
+def telemetry_sampler():
+    """One sampler per server process; reruns within the TTL reuse its snapshot."""
+    sampler = SensorSampler(ttl=2.0, timeout=1.0)
+    if hw_telemetry:
+        sampler.add_source("hwinfo", hw_telemetry.read_latest)
+    return sampler
+
+
 # ════════════════════════════════════════════════════════════════════════════════
 # PAGE CONFIG
 # ════════════════════════════════════════════════════════════════════════════════
@@ -281,12 +292,16 @@ with st.sidebar:
     gpu_temp = None
     vram_pct = None
     if hw_telemetry:
-        try:
-            live_data = hw_telemetry.read_latest()
+        snap = telemetry_sampler().snapshot()
+        live_data = snap.get("hwinfo")
+        if snap.is_fresh("hwinfo") and live_data is not None:
             gpu_temp = live_data.gpu_hotspot_c
             vram_pct = live_data.vram_used_frac
             st.markdown(f'<div style="font-size:0.75rem;color:#4af5b0;margin-bottom:10px">🟢 LIVE SENSORS: {gpu_temp:.1f}°C | {vram_pct*100:.1f}% VRAM</div>', unsafe_allow_html=True)
-        except Exception:
+        elif live_data is not None:
+            # last good read only: shown for reference, not fed into the model
+            st.markdown(f'<div style="font-size:0.75rem;color:#ffaa00;margin-bottom:10px">⚠ SENSORS STALE (last: {live_data.gpu_hotspot_c:.1f}°C | {live_data.vram_used_frac*100:.1f}% VRAM)</div>', unsafe_allow_html=True)
+        else:
             st.markdown('<div style="font-size:0.75rem;color:#ffaa00;margin-bottom:10px">⚠ SENSORS OFFLINE (CSV Lock)</div>', unsafe_allow_html=True)
             
     gpu_options = {"4 GB (Budget)": 4.0, "8 GB RTX 3060 Ti": 8.0,
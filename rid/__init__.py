@@ -31,6 +31,8 @@ from .triangle import (
 )
 from .ltp_principle import (
     DescentTrigger,
+    DescentTriggerConfig,
+    DescentTriggerMonitor,
     mandatory_descent_triggers,
     canonical_statement,
     compression_baseline_definition,
@@ -46,6 +48,7 @@ from .thermodynamics import (
     lambda_mismatch,
     lambda_total,
     coupling_amplified_loss,
+    coupling_amplified_loss_matrix,
     temporal_mismatch_condition,
     cost_depth_factorial,
 )
@@ -56,6 +59,27 @@ from .seol import (
     voltage_law_violated,
     interface_efficiency,
     SEOLProtocolStep,
+    SEOLChainIndex,
+    SEOLGraph,
+    SEOLNode,
+)
+from .latency import (
+    LatencyHistogram,
+    LoopLagMonitor,
+)
+from .tracing import (
+    FIDF_STAGES,
+    StageTracer,
+)
+from .metrics import (
+    FIDFLoopMetrics,
+    MetricsRegistry,
+    MetricsServer,
+)
+from .trace import (
+    TraceRecorder,
+    TraceReader,
+    trace_to_csv,
 )
 from .fidf import (
     FIDFConfig,
@@ -64,6 +88,90 @@ from .fidf import (
     layer2_logic_gate,
     run_fidf_loop,
 )
+from .governor import (
+    ThreadGovernor,
+    DutyCycleGovernor,
+    DutyCycleWorkerPool,
+    SignalDutyCycler,
+    FURNACE_ACTIONS,
+    TRI_AXIS_ACTIONS,
+)
+from .replay import (
+    ReplayTrace,
+    ReplayDecision,
+    ReplayEngine,
+    load_trace,
+    load_furnace_csv,
+    load_hwinfo_csv,
+    load_binary_trace,
+)
+from .drift import (
+    DriftTracker,
+)
+from .merkle import (
+    MerkleTree,
+    MerkleAnchor,
+    merkle_discrepancy,
+)
+from .sketch import (
+    ProjectionSketcher,
+    SimHasher,
+    MinHasher,
+    sketch_l2_discrepancy,
+    sketch_cosine_discrepancy,
+    simhash_discrepancy,
+    minhash_discrepancy,
+    shingles,
+)
+from .embedding_rsr import (
+    EmbeddingStore,
+    batch_embedding_rsr,
+    cosine_discrepancy,
+    nearest_cosine_discrepancy,
+)
+from .reconstruction import (
+    DelayLine,
+    EWMA,
+    AlphaBeta,
+    Kalman,
+    reconstruction_callbacks,
+    stream_rsr,
+)
+from .distribution import (
+    wasserstein_samples,
+    wasserstein_hist,
+    jensen_shannon,
+    wasserstein_discrepancy,
+    histogram_wasserstein_discrepancy,
+    js_discrepancy,
+    StreamingHistogram,
+)
+from .text_discrepancy import (
+    levenshtein,
+    edit_discrepancy,
+    TextDiscrepancy,
+    batch_edit_discrepancy,
+)
+from .admission import (
+    AdmissionController,
+    Admission,
+    ADMIT,
+    QUEUE,
+    TRUNCATE,
+    REJECT,
+    COLLAPSE_THRESHOLD,
+)
+from .sampler import (
+    SensorSampler,
+    SensorSnapshot,
+)
+from .rle_sources import (
+    PressureCurve,
+    PSISource,
+    CgroupMemorySource,
+    CompositeRLESource,
+    default_memory_rle_source,
+)
 
 __all__ = [
     "Axiom",
@@ -86,6 +194,8 @@ __all__ = [
     "TriangleState",
     "DiagnosticResult",
     "DescentTrigger",
+    "DescentTriggerConfig",
+    "DescentTriggerMonitor",
     "mandatory_descent_triggers",
     "canonical_statement",
     "compression_baseline_definition",
@@ -100,6 +210,7 @@ __all__ = [
     "lambda_mismatch",
     "lambda_total",
     "coupling_amplified_loss",
+    "coupling_amplified_loss_matrix",
     "temporal_mismatch_condition",
     "cost_depth_factorial",
     "operational_protocol",
@@ -108,9 +219,82 @@ __all__ = [
     "voltage_law_violated",
     "interface_efficiency",
     "SEOLProtocolStep",
+    "SEOLChainIndex",
+    "SEOLGraph",
+    "SEOLNode",
+    "LatencyHistogram",
+    "LoopLagMonitor",
+    "FIDF_STAGES",
+    "StageTracer",
+    "FIDFLoopMetrics",
+    "MetricsRegistry",
+    "MetricsServer",
+    "TraceRecorder",
+    "TraceReader",
+    "trace_to_csv",
     "FIDFConfig",
     "FIDFState",
     "layer1_rsr_ltp_rle",
     "layer2_logic_gate",
     "run_fidf_loop",
+    "ThreadGovernor",
+    "DutyCycleGovernor",
+    "DutyCycleWorkerPool",
+    "SignalDutyCycler",
+    "FURNACE_ACTIONS",
+    "TRI_AXIS_ACTIONS",
+    "ReplayTrace",
+    "ReplayDecision",
+    "ReplayEngine",
+    "load_trace",
+    "load_furnace_csv",
+    "load_hwinfo_csv",
+    "load_binary_trace",
+    "DriftTracker",
+    "MerkleTree",
+    "MerkleAnchor",
+    "merkle_discrepancy",
+    "ProjectionSketcher",
+    "SimHasher",
+    "MinHasher",
+    "sketch_l2_discrepancy",
+    "sketch_cosine_discrepancy",
+    "simhash_discrepancy",
+    "minhash_discrepancy",
+    "shingles",
+    "EmbeddingStore",
+    "batch_embedding_rsr",
+    "cosine_discrepancy",
+    "nearest_cosine_discrepancy",
+    "DelayLine",
+    "EWMA",
+    "AlphaBeta",
+    "Kalman",
+    "reconstruction_callbacks",
+    "stream_rsr",
+    "wasserstein_samples",
+    "wasserstein_hist",
+    "jensen_shannon",
+    "wasserstein_discrepancy",
+    "histogram_wasserstein_discrepancy",
+    "js_discrepancy",
+    "StreamingHistogram",
+    "levenshtein",
+    "edit_discrepancy",
+    "TextDiscrepancy",
+    "batch_edit_discrepancy",
+    "AdmissionController",
+    "Admission",
+    "ADMIT",
+    "QUEUE",
+    "TRUNCATE",
+    "REJECT",
+    "COLLAPSE_THRESHOLD",
+    "SensorSampler",
+    "SensorSnapshot",
+    "PressureCurve",
+    "PSISource",
+    "CgroupMemorySource",
+    "CompositeRLESource",
+    "default_memory_rle_source",
 ]
@@ -0,0 +1,240 @@
+# ==========================================
+# RID: S_n-driven admission control for LLM serving ("Option D" token gating)
+# Source: AIOS_V2_VALIDATION.md §9, RID_Complete.md §13
+# ==========================================
+"""
+Sits in front of an inference backend and decides, per request, whether its
+context can be committed without pushing the aggregate S_n through the
+collapse floor:
+
+    RLE   = (capacity − in-flight tokens − request tokens) / capacity
+    S_n   = RSR · LTP · RLE                        (aggregate, after admission)
+    gate  S_n ≥ s_floor  and  not UnifiedSemanticPhysics(...).kernel_descent
+
+    ADMIT      fits now; tokens are counted as in flight until release()
+    QUEUE      would fit once in-flight work drains; admitted by a later release()
+    TRUNCATE   can never fit whole; admitted with the largest context that does
+    REJECT     cannot fit even truncated to min_tokens, is too small to carry the
+               kernel's fixed cost (LTP < 1), or the queue is full
+
+Queued requests are admitted strictly in arrival order (no overtaking), and
+while anything is queued new requests queue behind it. The range of contexts
+that fit an idle backend is computed once per (LTP, RSR), so a decision is a
+few arithmetic operations plus one physics evaluation.
+
+    gate = AdmissionController(capacity_tokens=8192, s_floor=0.40)
+    a = gate.submit(prompt_tokens)
+    if a.action in (ADMIT, TRUNCATE): run(a.tokens); later = gate.release(a.request_id)
+"""
+
+import threading
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from .semantic_physics import UnifiedSemanticPhysics
+
+
+ADMIT, QUEUE, TRUNCATE, REJECT = "ADMIT", "QUEUE", "TRUNCATE", "REJECT"
+COLLAPSE_THRESHOLD = 0.40     # Option D gate (terminal collapse observed near S_n ≈ 0.39)
+
+
+class Admission(NamedTuple):
+    action: str
+    request_id: int
+    requested: int            # tokens asked for
+    tokens: int               # tokens granted (< requested when truncated; 0 on reject)
+    s_n: float                # aggregate S_n after this decision
+    realized_force: float     # physics output for the granted context (0 when not evaluated)
+
+
+class AdmissionController:
+    """
+    capacity_tokens:  context the backend can hold across all in-flight requests
+    s_floor:          minimum aggregate S_n after admission
+    ltp, rsr:         current structural axes (update() when the FIDF loop moves them)
+    min_tokens:       smallest context worth running after truncation
+    allow_truncate:   False turns TRUNCATE into REJECT
+    max_queue:        queued requests beyond this are rejected
+    """
+
+    def __init__(
+        self,
+        capacity_tokens: int = 8192,
+        s_floor: float = COLLAPSE_THRESHOLD,
+        ltp: float = 1.0,
+        rsr: float = 1.0,
+        physics: Optional[UnifiedSemanticPhysics] = None,
+        min_tokens: int = 256,
+        allow_truncate: bool = True,
+        max_queue: int = 64,
+    ):
+        if capacity_tokens <= 0:
+            raise ValueError("capacity_tokens must be positive")
+        self.capacity = int(capacity_tokens)
+        self.s_floor = s_floor
+        self.physics = physics or UnifiedSemanticPhysics()
+        self.min_tokens = min_tokens
+        self.allow_truncate = allow_truncate
+        self.max_queue = max_queue
+        self._lock = threading.Lock()
+        self._in_flight: Dict[int, Tuple[int, int]] = {}     # id → (requested, granted)
+        self._queue: Dict[int, Tuple[int, int, int]] = {}    # id → (requested, grant, floor), FIFO
+        self._next_id = 0
+        self.in_flight_tokens = 0
+        self.counts = {ADMIT: 0, QUEUE: 0, TRUNCATE: 0, REJECT: 0}
+        self._set_axes(ltp, rsr)
+
+    # -- model -----------------------------------------------------------------
+
+    def _set_axes(self, ltp: float, rsr: float) -> None:
+        self.ltp, self.rsr = ltp, rsr
+        self._q = ltp * rsr
+        self._min_idle, self._max_idle = self._fit_range(0, self.capacity)
+
+    def aggregate_s_n(self, in_flight: Optional[int] = None) -> float:
+        """S_n with `in_flight` tokens committed (default: current)."""
+        used = self.in_flight_tokens if in_flight is None else in_flight
+        return self._q * max(0.0, (self.capacity - used) / self.capacity)
+
+    def _check(self, in_flight: int, tokens: int) -> Tuple[bool, float, float]:
+        """(fits, S_n after admission, realized force) for `tokens` on top of `in_flight`."""
+        rle = (self.capacity - in_flight - tokens) / self.capacity
+        if rle <= 0.0:
+            return False, 0.0, 0.0
+        s_n = self._q * rle
+        if s_n < self.s_floor:
+            return False, s_n, 0.0
+        state = self.physics.compute(s_n, 0.0, self.ltp, rle, prompt_tokens=tokens)
+        return not state.kernel_descent, s_n, state.realized_force
+
+    def _fit_range(self, in_flight: int, upper: int) -> Tuple[int, int]:
+        """
+        (smallest, largest) t in [1, upper] that fit on top of in_flight; (0, 0)
+        if none does. The realized force is concave in t, so the fitting sizes
+        form one interval; below LTP = 1 it does not start at 1, since a tiny
+        context cannot carry the kernel's fixed cost.
+        """
+        if self._q <= 0.0:
+            return 0, 0
+        # the S_n floor bounds t in closed form; physics can only tighten it
+        hi = min(upper, int(self.capacity - in_flight - self.capacity * self.s_floor / self._q))
+        if hi < 1:
+            return 0, 0
+        # a point inside the interval: the bound, min_tokens, else a doubling scan
+        probes = [hi, min(max(1, self.min_tokens), hi)]
+        t = 1
+        while t < hi:
+            probes.append(t)
+            t *= 2
+        inside = next((p for p in probes if self._check(in_flight, p)[0]), 0)
+        if not inside:
+            return 0, 0
+        lo, top = inside, hi
+        if not self._check(in_flight, top)[0]:
+            while top - lo > 1:              # fits(lo), not fits(top)
+                mid = (lo + top) // 2
+                if self._check(in_flight, mid)[0]:
+                    lo = mid
+                else:
+                    top = mid
+            top = lo
+        bottom, hi = 1, inside
+        if not self._check(in_flight, bottom)[0]:
+            while hi - bottom > 1:           # not fits(bottom), fits(hi)
+                mid = (bottom + hi) // 2
+                if self._check(in_flight, mid)[0]:
+                    hi = mid
+                else:
+                    bottom = mid
+            bottom = hi
+        return bottom, top
+
+    @property
+    def headroom(self) -> int:
+        """Largest context that would be admitted right now."""
+        return self._fit_range(self.in_flight_tokens, self.capacity)[1]
+
+    # -- decisions ---------------------------------------------------------------
+
+    def submit(self, tokens: int, min_tokens: Optional[int] = None) -> Admission:
+        """Decide on a request of `tokens` context tokens."""
+        if tokens <= 0:
+            raise ValueError("tokens must be positive")
+        if not self.allow_truncate:
+            floor = tokens
+        else:
+            floor = min(tokens, self.min_tokens if min_tokens is None else min_tokens)
+        with self._lock:
+            rid = self._next_id
+            self._next_id += 1
+            grant = tokens if tokens <= self._max_idle else self._max_idle
+            if grant < max(floor, self._min_idle, 1):
+                return self._decide(REJECT, rid, tokens, 0, self.aggregate_s_n(), 0.0)
+            if not self._queue:
+                fits, s_n, force = self._check(self.in_flight_tokens, grant)
+                if fits:
+                    return self._commit(rid, tokens, grant, s_n, force)
+            if len(self._queue) >= self.max_queue:
+                return self._decide(REJECT, rid, tokens, 0, self.aggregate_s_n(), 0.0)
+            self._queue[rid] = (tokens, grant, floor)
+            return self._decide(QUEUE, rid, tokens, grant, self.aggregate_s_n(), 0.0)
+
+    def release(self, request_id: int) -> List[Admission]:
+        """Finish an in-flight request; returns the decisions this makes for queued requests."""
+        with self._lock:
+            _, granted = self._in_flight.pop(request_id)
+            self.in_flight_tokens -= granted
+            return self._drain()
+
+    def cancel(self, request_id: int) -> bool:
+        """Drop a queued request (e.g. its client gave up). False if it is not queued."""
+        with self._lock:
+            return self._queue.pop(request_id, None) is not None
+
+    def update(self, ltp: Optional[float] = None, rsr: Optional[float] = None) -> List[Admission]:
+        """
+        Move the structural axes. Returns the resulting decisions for queued
+        requests: admissions, and REJECT for any that can no longer fit.
+        """
+        with self._lock:
+            self._set_axes(self.ltp if ltp is None else ltp, self.rsr if rsr is None else rsr)
+            decisions = []
+            # grants planned under the old axes are re-planned against an idle backend
+            for rid, (requested, _, floor) in list(self._queue.items()):
+                grant = min(requested, self._max_idle)
+                if grant < max(floor, self._min_idle, 1):
+                    del self._queue[rid]
+                    decisions.append(self._decide(REJECT, rid, requested, 0, self.aggregate_s_n(), 0.0))
+                else:
+                    self._queue[rid] = (requested, grant, floor)
+            return decisions + self._drain()
+
+    def _drain(self) -> List[Admission]:
+        admitted = []
+        while self._queue:
+            rid = next(iter(self._queue))
+            requested, grant, _ = self._queue[rid]
+            fits, s_n, force = self._check(self.in_flight_tokens, grant)
+            if not fits:
+                break
+            del self._queue[rid]
+            admitted.append(self._commit(rid, requested, grant, s_n, force))
+        return admitted
+
+    def _commit(self, rid: int, requested: int, grant: int, s_n: float, force: float) -> Admission:
+        self._in_flight[rid] = (requested, grant)
+        self.in_flight_tokens += grant
+        return self._decide(ADMIT if grant == requested else TRUNCATE, rid, requested, grant, s_n, force)
+
+    def _decide(self, action: str, rid: int, requested: int, grant: int, s_n: float, force: float) -> Admission:
+        self.counts[action] += 1
+        return Admission(action, rid, requested, grant, s_n, force)
+
+    # -- introspection -----------------------------------------------------------
+
+    @property
+    def queued(self) -> int:
+        return len(self._queue)
+
+    @property
+    def active(self) -> int:
+        return len(self._in_flight)
@@ -0,0 +1,159 @@
+# ==========================================
+# RID: Discrepancies between distributions
+# Source: RLE-LTP-RSR_Stability_Equation_Canonical_Spec.pdf
+# RSR_n ≡ 1 − D(y_n, n_n), D range [0, 1], y_n and n_n distributions
+# ==========================================
+"""
+Normalized discrepancies for distribution-valued observables (latency
+histograms, token-probability distributions):
+
+    wasserstein_samples(a, b)    1-D W1 from raw samples, O(n log n) (one sort each)
+    wasserstein_hist(p, q)       1-D W1 from histograms on shared bins, O(bins)
+    jensen_shannon(p, q)         JS divergence, base 2, over fixed bins
+    StreamingHistogram           fixed-bin histogram updated from new samples
+                                 (no resorting; optional exponential forgetting)
+
+W1 is divided by a scale and clipped, so every value is in [0, 1]. For raw
+samples the default scale is the pooled mean |x| (a relative shift, so 10 ms
+vs 10.02 ms is a small discrepancy however narrow the samples are); for
+histograms it is the fixed bin support. Pass `scale` to use a configured
+unit instead. JS in base 2 is already bounded by 1. Each has a two-argument
+DiscrepancyFunc form for rsr_n:
+
+    rsr_n(latencies_now, latencies_baseline, wasserstein_discrepancy)
+    rsr_n(token_probs, reference_probs, js_discrepancy)
+    rsr_n(hist_a.counts, hist_b.counts, js_discrepancy)     # LatencyHistogram
+"""
+
+from typing import Optional
+
+import numpy as np
+
+
+def wasserstein_samples(a, b, scale: Optional[float] = None) -> float:
+    """
+    W1 between the empirical distributions of samples a and b, divided by
+    `scale` (default: mean |x| of the pooled samples). Returns a value in [0, 1].
+    """
+    a = np.sort(np.asarray(a, dtype=np.float64).ravel())
+    b = np.sort(np.asarray(b, dtype=np.float64).ravel())
+    if a.size == 0 or b.size == 0:
+        return 0.0 if a.size == b.size else 1.0
+    pooled = np.concatenate([a, b])
+    pooled.sort()
+    widths = np.diff(pooled)
+    cdf_a = np.searchsorted(a, pooled[:-1], side="right") / a.size
+    cdf_b = np.searchsorted(b, pooled[:-1], side="right") / b.size
+    w1 = float(np.dot(np.abs(cdf_a - cdf_b), widths))
+    span = float(np.mean(np.abs(pooled))) if scale is None else scale
+    return min(1.0, w1 / span) if span > 0 else 0.0
+
+
+def _probabilities(p) -> np.ndarray:
+    p = np.asarray(p, dtype=np.float64).ravel()
+    total = p.sum()
+    return p / total if total > 0 else p
+
+
+def wasserstein_hist(p, q, edges=None, scale: Optional[float] = None) -> float:
+    """
+    W1 between two histograms on the same bins (counts or probabilities),
+    via cumulative sums, with each bin's mass at its center. Divided by
+    `scale` (default: distance between the outer bin centers; unit-width
+    bins when edges is None). Returns a value in [0, 1].
+    """
+    p, q = _probabilities(p), _probabilities(q)
+    if p.shape != q.shape:
+        raise ValueError("histograms must have the same number of bins")
+    if p.sum() == 0 or q.sum() == 0:
+        return 0.0 if p.sum() == q.sum() else 1.0
+    gap = np.abs(np.cumsum(p - q))[:-1]         # CDF difference at each inner edge
+    if edges is None:
+        w1, span = float(gap.sum()), max(1, p.size - 1)
+    else:
+        edges = np.asarray(edges, dtype=np.float64)
+        if edges.size != p.size + 1:
+            raise ValueError("edges must have one more entry than bins")
+        centers = (edges[:-1] + edges[1:]) / 2.0
+        w1, span = float(np.dot(gap, np.diff(centers))), centers[-1] - centers[0]
+    if scale is not None:
+        span = scale
+    return min(1.0, w1 / span) if span > 0 else 0.0
+
+
+def jensen_shannon(p, q) -> float:
+    """Jensen–Shannon divergence in bits between two histograms on the same bins; in [0, 1]."""
+    p, q = _probabilities(p), _probabilities(q)
+    if p.shape != q.shape:
+        raise ValueError("histograms must have the same number of bins")
+    if p.sum() == 0 or q.sum() == 0:
+        return 0.0 if p.sum() == q.sum() else 1.0
+    m = 0.5 * (p + q)
+
+    def kl(x):
+        nz = x > 0
+        return float(np.dot(x[nz], np.log2(x[nz] / m[nz])))
+
+    return min(1.0, max(0.0, 0.5 * kl(p) + 0.5 * kl(q)))
+
+
+def wasserstein_discrepancy(y, n) -> float:
+    """DiscrepancyFunc over raw samples (scalars count as single samples)."""
+    return wasserstein_samples(np.atleast_1d(y), np.atleast_1d(n))
+
+
+def histogram_wasserstein_discrepancy(y, n) -> float:
+    """DiscrepancyFunc over histograms with shared unit-width bins."""
+    return wasserstein_hist(y, n)
+
+
+def js_discrepancy(y, n) -> float:
+    """DiscrepancyFunc: Jensen–Shannon divergence (base 2) over shared bins."""
+    return jensen_shannon(y, n)
+
+
+class StreamingHistogram:
+    """
+    Fixed-bin histogram fed with new samples as they arrive.
+
+    add() bins each batch with one searchsorted, so nothing is resorted or
+    retained. decay in (0, 1] multiplies the existing counts before each add
+    (1.0 = plain cumulative histogram). Samples outside the edges land in the
+    first / last bin.
+    """
+
+    def __init__(self, edges, decay: float = 1.0):
+        self.edges = np.asarray(edges, dtype=np.float64)
+        if self.edges.ndim != 1 or self.edges.size < 2 or np.any(np.diff(self.edges) <= 0):
+            raise ValueError("edges must be strictly increasing with at least two entries")
+        if not 0.0 < decay <= 1.0:
+            raise ValueError("decay must be in (0, 1]")
+        self.decay = decay
+        self.counts = np.zeros(self.edges.size - 1)
+
+    @classmethod
+    def linear(cls, lo: float, hi: float, bins: int = 64, **kwargs) -> "StreamingHistogram":
+        return cls(np.linspace(lo, hi, bins + 1), **kwargs)
+
+    def add(self, samples) -> None:
+        x = np.atleast_1d(np.asarray(samples, dtype=np.float64)).ravel()
+        if self.decay != 1.0:
+            self.counts *= self.decay
+        idx = np.clip(np.searchsorted(self.edges, x, side="right") - 1, 0, self.counts.size - 1)
+        self.counts += np.bincount(idx, minlength=self.counts.size)
+
+    @property
+    def total(self) -> float:
+        return float(self.counts.sum())
+
+    def wasserstein(self, other, scale: Optional[float] = None) -> float:
+        """Normalized W1 to another StreamingHistogram (same edges) or a count vector."""
+        q = other.counts if isinstance(other, StreamingHistogram) else other
+        return wasserstein_hist(self.counts, q, self.edges, scale)
+
+    def jensen_shannon(self, other) -> float:
+        q = other.counts if isinstance(other, StreamingHistogram) else other
+        return jensen_shannon(self.counts, q)
+
+    def reset(self) -> None:
+        self.counts[:] = 0.0
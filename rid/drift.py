@@ -0,0 +1,150 @@
+# ==========================================
+# RID: Incremental RSR drift tracking
+# Source: RLE-LTP-RSR_Stability_Equation_Canonical_Spec.pdf
+# RSR_n ≡ 1 − D(y_n, n_n), maintained under sparse writes
+# ==========================================
+"""
+Keeps the running sums behind discrepancy_l2 / discrepancy_l1 between a
+working state and its baseline (identity anchor), so RSR after a write of k
+elements costs O(k) instead of O(n):
+
+    l2   Σ(w − b)², Σw², Σb²        -> ||w − b|| / (||w|| + ||b||), or ||w − b|| / tolerance
+    l1   Σ min(1, |w − b| / (|w| + |b|))   -> the mean used by discrepancy_l1, or Σ|w − b| / tolerance
+
+Float error from repeated add/subtract is bounded by an exact NumPy recompute
+every `resync_every` element updates (and on demand with resync()).
+
+    drift = DriftTracker(baseline, metric="l2")
+    drift.add(idx, deltas)           # sparse noise / bit flips
+    RSR = drift.rsr()                # == rsr_n(working, baseline, discrepancy_l2)
+"""
+
+from typing import Optional, Sequence, Union
+
+import numpy as np
+
+
+_EPS = 1e-12
+Index = Union[int, Sequence[int], np.ndarray]
+
+
+def _elem_l1(w: np.ndarray, b: np.ndarray) -> np.ndarray:
+    return np.minimum(1.0, np.abs(w - b) / (np.abs(w) + np.abs(b) + _EPS))
+
+
+class DriftTracker:
+    """
+    Working copy of a baseline vector with O(changed) discrepancy upkeep.
+
+    metric:        "l2" (default) or "l1", matching discrepancy_l2 / discrepancy_l1
+    tolerance:     if set, rsr() = 1 − distance / tolerance (absolute drift budget)
+    resync_every:  element updates between exact recomputes
+    """
+
+    def __init__(
+        self,
+        baseline,
+        working=None,
+        metric: str = "l2",
+        tolerance: Optional[float] = None,
+        resync_every: int = 1 << 20,
+    ):
+        if metric not in ("l1", "l2"):
+            raise ValueError("metric must be 'l1' or 'l2'")
+        self.metric = metric
+        self.tolerance = tolerance
+        self.resync_every = max(1, resync_every)
+        self.baseline = np.array(baseline, dtype=np.float64)
+        self.baseline.setflags(write=False)
+        self.working = (self.baseline.copy() if working is None
+                        else np.array(working, dtype=np.float64))
+        if self.working.shape != self.baseline.shape:
+            raise ValueError("working and baseline must have the same shape")
+        self.base_sq = float(np.dot(self.baseline, self.baseline))
+        self.resyncs = 0
+        self.last_resync_error = 0.0
+        self.resync()
+
+    def __len__(self) -> int:
+        return self.baseline.size
+
+    def resync(self) -> float:
+        """Recompute every sum exactly; returns the relative error that had accumulated."""
+        w, b = self.working, self.baseline
+        d = w - b
+        sq, l1 = float(np.dot(d, d)), float(np.abs(d).sum())
+        if hasattr(self, "dist_sq"):
+            self.last_resync_error = abs(self.dist_sq - sq) / (sq + _EPS)
+        self.dist_sq = sq
+        self.dist_l1 = l1
+        self.work_sq = float(np.dot(w, w))
+        self.elem_l1 = float(_elem_l1(w, b).sum())
+        self._pending = 0
+        self.resyncs += 1
+        return self.last_resync_error
+
+    def _apply(self, idx: np.ndarray, new: np.ndarray) -> None:
+        """idx must be unique."""
+        w, b = self.working, self.baseline
+        old = w[idx]
+        base = b[idx]
+        d_old, d_new = old - base, new - base
+        self.dist_sq += float(np.dot(d_new, d_new) - np.dot(d_old, d_old))
+        self.dist_l1 += float(np.abs(d_new).sum() - np.abs(d_old).sum())
+        self.work_sq += float(np.dot(new, new) - np.dot(old, old))
+        self.elem_l1 += float(_elem_l1(new, base).sum() - _elem_l1(old, base).sum())
+        w[idx] = new
+        self._pending += idx.size
+        if self._pending >= self.resync_every:
+            self.resync()
+
+    def _index(self, idx: Index) -> np.ndarray:
+        """Bounds-checked indices, negatives wrapped so -1 and n-1 are the same element."""
+        idx = np.atleast_1d(np.asarray(idx, dtype=np.intp))
+        n = self.baseline.size
+        if idx.size and (idx.min() < -n or idx.max() >= n):
+            raise IndexError(f"index out of range for {n} elements")
+        return idx % n if n else idx
+
+    def write(self, idx: Index, values) -> None:
+        """working[idx] = values. Repeated indices: the last write wins."""
+        idx = self._index(idx)
+        values = np.broadcast_to(np.asarray(values, dtype=np.float64), idx.shape)
+        if idx.size > 1:
+            # last occurrence of each index
+            rev_unique, rev_pos = np.unique(idx[::-1], return_index=True)
+            idx, values = rev_unique, values[::-1][rev_pos]
+        self._apply(idx, np.array(values, dtype=np.float64))
+
+    def add(self, idx: Index, deltas) -> None:
+        """working[idx] += deltas, accumulating repeated indices."""
+        idx = self._index(idx)
+        deltas = np.broadcast_to(np.asarray(deltas, dtype=np.float64), idx.shape)
+        if idx.size > 1:
+            idx, inverse = np.unique(idx, return_inverse=True)
+            deltas = np.bincount(inverse, weights=deltas, minlength=idx.size)
+        self._apply(idx, self.working[idx] + deltas)
+
+    def reset(self) -> None:
+        """Restore the working state to the baseline."""
+        self.working[:] = self.baseline
+        self.dist_sq = self.dist_l1 = self.elem_l1 = 0.0
+        self.work_sq = self.base_sq
+        self._pending = 0
+
+    def distance(self) -> float:
+        """||w − b||₂ for l2, Σ|w − b| for l1."""
+        return float(np.sqrt(max(0.0, self.dist_sq))) if self.metric == "l2" else max(0.0, self.dist_l1)
+
+    def discrepancy(self) -> float:
+        """Normalized D in [0, 1] (discrepancy_l2 / discrepancy_l1 of working vs baseline)."""
+        if self.tolerance is not None:
+            return min(1.0, self.distance() / self.tolerance)
+        if self.metric == "l2":
+            denom = np.sqrt(max(0.0, self.work_sq)) + _EPS + np.sqrt(self.base_sq) + _EPS
+            return min(1.0, float(np.sqrt(max(0.0, self.dist_sq)) / denom))
+        return min(1.0, max(0.0, self.elem_l1) / max(1, self.baseline.size))
+
+    def rsr(self) -> float:
+        """RSR_n = 1 − D."""
+        return max(0.0, min(1.0, 1.0 - self.discrepancy()))
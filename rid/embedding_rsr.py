@@ -0,0 +1,158 @@
+# ==========================================
+# RID: Batched embedding RSR against a store of reconstructions
+# Source: RLE-LTP-RSR_Stability_Equation_Canonical_Spec.pdf
+# RSR_n ≡ 1 − D(y_n, n_n), n_n = nearest stored reconstruction(s)
+# ==========================================
+"""
+For LLM deployments the reconstruction of identity is a set of stored
+embedding vectors. RSR compares each output embedding against its top-k
+nearest stored reconstructions by cosine similarity:
+
+    D = (1 − cos) / 2 ∈ [0, 1]          RSR = 1 − D
+
+    store = EmbeddingStore.open_memmap("memory.f32", dim=768)   # larger than RAM is fine
+    rsr, idx, cos = batch_embedding_rsr(queries, store, k=5)     # (Q,), (Q, k), (Q, k)
+    rsr_n(y, store, nearest_cosine_discrepancy)                  # single query via rsr_n
+
+The store is scanned in row chunks: one (queries × chunk) matrix multiply per
+chunk, top-k candidates with argpartition, merged into a running top-k. Row
+norms are computed once per store (also chunked), so memmapped stores are
+never normalized in place or loaded whole.
+"""
+
+from typing import Optional, Tuple, Union
+
+import numpy as np
+
+
+class EmbeddingStore:
+    """
+    (M, d) reconstruction vectors, in memory or memory-mapped.
+
+    chunk_rows:   store rows per matrix multiply
+    query_block:  queries per matrix multiply (bounds the (Q, chunk) scratch matrix)
+    """
+
+    def __init__(self, vectors: np.ndarray, chunk_rows: int = 16384, query_block: int = 1024):
+        if vectors.ndim != 2:
+            raise ValueError("store must be a 2-D (M, d) array")
+        self.vectors = vectors
+        self.chunk_rows = chunk_rows
+        self.query_block = query_block
+        self.dtype = np.float32 if vectors.dtype == np.float32 else np.float64
+        self._inv_norms: Optional[np.ndarray] = None
+
+    @classmethod
+    def open_memmap(cls, path: str, dim: int, dtype=np.float32, mode: str = "r", **kwargs) -> "EmbeddingStore":
+        """Memory-map a raw row-major (M, dim) file."""
+        mm = np.memmap(path, dtype=dtype, mode=mode)
+        return cls(mm.reshape(-1, dim), **kwargs)
+
+    def __len__(self) -> int:
+        return self.vectors.shape[0]
+
+    @property
+    def dim(self) -> int:
+        return self.vectors.shape[1]
+
+    def inv_norms(self) -> np.ndarray:
+        """1 / ||row||, computed once (zero rows get 0)."""
+        if self._inv_norms is None:
+            out = np.empty(len(self), dtype=self.dtype)
+            for start in range(0, len(self), self.chunk_rows):
+                chunk = np.asarray(self.vectors[start:start + self.chunk_rows], dtype=self.dtype)
+                norms = np.sqrt(np.einsum("ij,ij->i", chunk, chunk))
+                out[start:start + len(chunk)] = np.divide(1.0, norms, out=np.zeros_like(norms), where=norms > 0)
+            self._inv_norms = out
+        return self._inv_norms
+
+    def topk(self, queries: np.ndarray, k: int = 1) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Nearest stored vectors by cosine. Returns (indices (Q, k), cosines (Q, k)),
+        best first. k is capped at the store size (an empty store gives (Q, 0)).
+        """
+        q = np.atleast_2d(np.asarray(queries, dtype=self.dtype))
+        if q.shape[1] != self.dim:
+            raise ValueError(f"queries have dimension {q.shape[1]}, store has {self.dim}")
+        if len(self) == 0:
+            return np.empty((len(q), 0), dtype=np.int64), np.empty((len(q), 0), dtype=self.dtype)
+        k = max(1, min(k, len(self)))
+        qn = np.linalg.norm(q, axis=1, keepdims=True)
+        q = np.divide(q, qn, out=np.zeros_like(q), where=qn > 0)
+        inv = self.inv_norms()
+        idx_out = np.empty((len(q), k), dtype=np.int64)
+        cos_out = np.empty((len(q), k), dtype=self.dtype)
+        for qs in range(0, len(q), self.query_block):
+            qb = q[qs:qs + self.query_block]
+            best_i = np.empty((len(qb), 0), dtype=np.int64)
+            best_c = np.empty((len(qb), 0), dtype=self.dtype)
+            for start in range(0, len(self), self.chunk_rows):
+                chunk = np.asarray(self.vectors[start:start + self.chunk_rows], dtype=self.dtype)
+                sims = (qb @ chunk.T) * inv[start:start + len(chunk)]
+                kk = min(k, sims.shape[1])
+                part = np.argpartition(-sims, kk - 1, axis=1)[:, :kk]
+                cand_c = np.concatenate([best_c, np.take_along_axis(sims, part, axis=1)], axis=1)
+                cand_i = np.concatenate([best_i, part + start], axis=1)
+                if cand_c.shape[1] > k:
+                    keep = np.argpartition(-cand_c, k - 1, axis=1)[:, :k]
+                    cand_c = np.take_along_axis(cand_c, keep, axis=1)
+                    cand_i = np.take_along_axis(cand_i, keep, axis=1)
+                best_c, best_i = cand_c, cand_i
+            order = np.argsort(-best_c, axis=1)
+            idx_out[qs:qs + len(qb)] = np.take_along_axis(best_i, order, axis=1)
+            cos_out[qs:qs + len(qb)] = np.take_along_axis(best_c, order, axis=1)
+        return idx_out, cos_out
+
+
+def cosine_to_discrepancy(cos: Union[float, np.ndarray]):
+    """D = (1 − cos) / 2, clipped to [0, 1]."""
+    return np.clip((1.0 - cos) / 2.0, 0.0, 1.0)
+
+
+def batch_embedding_rsr(
+    queries: np.ndarray,
+    store: EmbeddingStore,
+    k: int = 1,
+    reduce: str = "max",
+    weights: Optional[np.ndarray] = None,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    RSR of each query against its top-k reconstructions.
+
+    reduce: "max" uses the nearest reconstruction; "mean" averages the top-k
+            cosines (optionally weighted, weights shape (k,)).
+    Returns (rsr (Q,), indices (Q, k), cosines (Q, k)); an empty store
+    reconstructs nothing, so every RSR is 0.
+    """
+    if reduce not in ("max", "mean"):
+        raise ValueError("reduce must be 'max' or 'mean'")
+    idx, cos = store.topk(queries, k)
+    if cos.shape[1] == 0:
+        return np.zeros(len(cos)), idx, cos
+    if reduce == "max":
+        c = cos[:, 0]
+    else:
+        c = np.average(cos, axis=1, weights=None if weights is None else np.asarray(weights)[:cos.shape[1]])
+    return 1.0 - cosine_to_discrepancy(c.astype(np.float64)), idx, cos
+
+
+def cosine_discrepancy(y, n) -> float:
+    """DiscrepancyFunc for two vectors: (1 − cos) / 2."""
+    y = np.asarray(y, dtype=np.float64).ravel()
+    n = np.asarray(n, dtype=np.float64).ravel()
+    if y.shape != n.shape:
+        return 1.0
+    ny, nn = np.linalg.norm(y), np.linalg.norm(n)
+    if ny == 0.0 or nn == 0.0:
+        return 0.0 if ny == nn else 0.5
+    return float(cosine_to_discrepancy(np.dot(y, n) / (ny * nn)))
+
+
+def nearest_cosine_discrepancy(y, n) -> float:
+    """DiscrepancyFunc: n may be an EmbeddingStore (nearest stored vector) or a single vector."""
+    if isinstance(n, EmbeddingStore):
+        _, cos = n.topk(y, 1)
+        if cos.shape[1] == 0:
+            return 1.0
+        return float(cosine_to_discrepancy(float(cos[0, 0])))
+    return cosine_discrepancy(y, n)
@@ -16,6 +16,9 @@ from .triangle import (
     DiagnosticResult,
 )
 from .axioms import rle_n
+from .latency import LoopLagMonitor
+from .tracing import StageTracer
+from .trace import TraceRecorder
 
 
 @dataclass
@@ -35,6 +38,7 @@ class FIDFState:
     S_n: float = 1.0
     action: str = "continue"
     message: str = ""
+    temporal_mismatch: bool = False
 
 
 def layer1_rsr_ltp_rle(
@@ -78,6 +82,9 @@ def run_fidf_loop(
     get_capacity: Callable[[int], tuple],
     on_step: Optional[Callable[[int, FIDFState, DiagnosticResult], None]] = None,
     external_reset: Optional[Callable[[int], bool]] = None,
+    lag_monitor: Optional[LoopLagMonitor] = None,
+    tracer: Optional[StageTracer] = None,
+    recorder: Optional[TraceRecorder] = None,
 ) -> FIDFState:
     """
     Layer 3: For-loop over RSR -> LTP -> RLE -> Logic Gate.
@@ -88,8 +95,17 @@ def run_fidf_loop(
     get_capacity(n) -> (E_n, U_n, E_next)
     on_step(n, state, diagnostic) called each step (optional).
     external_reset(n) -> True to exit and goto Layer 0 (optional).
+    lag_monitor: measures sensor latency, control period and intervention -> S_n
+        response latency, and sets state.temporal_mismatch from Law 4 (optional).
+    tracer: times the sensors / layer1 / diagnostic / on_step stages (optional;
+        a disabled tracer is treated as absent).
+    recorder: appends every step to a binary trace (optional; caller closes it).
     """
     import time
+    if tracer is not None and not tracer.enabled:
+        tracer = None
+    if lag_monitor is not None and lag_monitor.control_period is None:
+        lag_monitor.control_period = config.dt if config.dt > 0 else None
     state = FIDFState()
     n = 0
     while True:
@@ -97,17 +113,46 @@ def run_fidf_loop(
             break
         if external_reset and external_reset(n):
             break
+        if lag_monitor is not None:
+            lag_monitor.tick()
+            t_read = time.perf_counter()
+        if tracer is not None:
+            t0 = tracer.begin("sensors")
         y_n = get_observable(n)
         recon_n = get_reconstruction(n)
         n_n, d_n = get_support_demand(n)
         E_n, U_n, E_next = get_capacity(n)
+        if tracer is not None:
+            tracer.end("sensors", t0)
+        if lag_monitor is not None:
+            lag_monitor.sensor_read(time.perf_counter() - t_read)
+        if tracer is not None:
+            t0 = tracer.begin("layer1")
         state = layer1_rsr_ltp_rle(y_n, recon_n, n_n, d_n, E_n, U_n, E_next)
+        if tracer is not None:
+            tracer.end("layer1", t0)
         state.step = n
+        if tracer is not None:
+            t0 = tracer.begin("diagnostic")
         diag = layer2_logic_gate(state, step=n)
+        if tracer is not None:
+            tracer.end("diagnostic", t0)
         state.action = diag.action
         state.message = diag.message
+        if lag_monitor is not None:
+            # Interventions are expected to raise S_n; the response is the first rise.
+            lag_monitor.observe(state.S_n)
+            if diag.action != "continue":
+                lag_monitor.actuate(+1, state.S_n)
+            state.temporal_mismatch = lag_monitor.temporal_mismatch()
         if on_step:
+            if tracer is not None:
+                t0 = tracer.begin("on_step")
             on_step(n, state, diag)
+            if tracer is not None:
+                tracer.end("on_step", t0)
+        if recorder is not None:
+            recorder.record_state(time.time(), state)
         if state.S_n >= 1.0 - 1e-9:
             n += 1
             continue
@@ -0,0 +1,231 @@
+# ==========================================
+# RID: Load governors driven by S_n
+# Shared by the Physical_Validation furnaces and the replay engine
+# ==========================================
+"""
+The furnace governor policy as a pure function of S_n, so the same decision
+logic runs on real hardware and in faster-than-real-time replay.
+
+    S_n >= 1      add load  (ramp up by `ramp` workers per tick)
+    0 < S_n < 1   shed load (active = int(max_workers * S_n))
+    S_n <= 0      critical  (active = 0)
+
+ThreadGovernor switches whole workers (1/max_workers steps). DutyCycleGovernor
+applies the same policy to a continuous load fraction, which an actuator turns
+into run/pause windows:
+
+    DutyCycleWorkerPool   PWM inside each worker process; one shared duty value
+    SignalDutyCycler      SIGSTOP/SIGCONT windows on arbitrary PIDs (POSIX)
+"""
+
+import math
+import multiprocessing
+import os
+import signal
+import threading
+import time
+from typing import Callable, List, Optional, Sequence, Tuple
+
+
+FURNACE_ACTIONS  = ("ADD_FUEL", "SHED_LOAD", "CRITICAL_COOLING")     # cpu_thermal_furnace
+TRI_AXIS_ACTIONS = ("ADD_STRESS", "GOVERN_S_N", "CRITICAL_COLLAPSE")  # tri_axis_furnace
+
+
+class ThreadGovernor:
+    """Whole-worker on/off governor used by the furnaces."""
+
+    def __init__(self, max_workers: int = 16, ramp: int = 2, actions: Tuple[str, str, str] = FURNACE_ACTIONS):
+        self.max_workers = max_workers
+        self.ramp = ramp
+        self.actions = actions
+        self.active = 0
+
+    def step(self, s_n: float) -> Tuple[str, int]:
+        """Apply one tick of the policy; returns (action, active worker count)."""
+        add, shed, critical = self.actions
+        if s_n >= 1.0:
+            action = add
+            self.active += self.ramp
+        elif s_n > 0.0:
+            action = shed
+            self.active = int(self.max_workers * s_n)
+        else:
+            action = critical
+            self.active = 0
+        self.active = max(0, min(self.max_workers, self.active))
+        return action, self.active
+
+
+class DutyCycleGovernor:
+    """
+    Proportional governor over a load fraction in [0, 1].
+
+    S_n >= 1 ramps the duty up by `ramp` per tick, 0 < S_n < 1 sets it to S_n
+    (so S_n = 0.97 trims 3% of the load instead of a whole worker), S_n <= 0
+    drops it to 0. step() returns (action, duty).
+    """
+
+    def __init__(self, ramp: float = 0.125, min_step: float = 0.0, actions: Tuple[str, str, str] = FURNACE_ACTIONS):
+        self.ramp = ramp
+        self.min_step = min_step     # ignore changes smaller than this (actuator deadband)
+        self.actions = actions
+        self.duty = 0.0
+
+    def step(self, s_n: float) -> Tuple[str, float]:
+        add, shed, critical = self.actions
+        if s_n >= 1.0:
+            action = add
+            duty = self.duty + self.ramp
+        elif s_n > 0.0:
+            action = shed
+            duty = s_n
+        else:
+            action = critical
+            duty = 0.0
+        duty = max(0.0, min(1.0, duty))
+        if duty in (0.0, 1.0) or abs(duty - self.duty) >= self.min_step:
+            self.duty = duty
+        return action, self.duty
+
+
+def burn_unit() -> None:
+    """About a millisecond of float work; the default PWM work quantum."""
+    _ = sum(math.sqrt(i) for i in range(20000))
+
+
+def _pwm_worker(duty, wake, index: int, n_workers: int, period: float, work: Callable[[], None]) -> None:
+    # Stagger windows so the workers' on-phases do not coincide.
+    phase = period * index / max(1, n_workers)
+    time.sleep(phase)
+    while True:
+        d = duty.value
+        if d <= 0.0:
+            wake.wait()                         # blocked, not polling, while fully idle
+            continue
+        start = time.perf_counter()
+        on = d * period
+        while time.perf_counter() - start < on:
+            work()
+        remaining = period - (time.perf_counter() - start)
+        if remaining > 0 and d < 1.0:
+            time.sleep(remaining)
+
+
+class DutyCycleWorkerPool:
+    """
+    Worker processes that each run `work` for duty * period out of every period.
+
+    The controller writes one shared double; workers read it once per window.
+    `work` must be a picklable top-level callable lasting much less than `period`.
+    """
+
+    def __init__(
+        self,
+        n_workers: int,
+        period: float = 0.05,
+        work: Callable[[], None] = burn_unit,
+        start: bool = True,
+    ):
+        self.n_workers = n_workers
+        self.period = period
+        self._duty = multiprocessing.Value("d", 0.0, lock=False)
+        self._wake = multiprocessing.Event()
+        self.workers: List[multiprocessing.Process] = [
+            multiprocessing.Process(target=_pwm_worker, daemon=True,
+                                    args=(self._duty, self._wake, i, n_workers, period, work))
+            for i in range(n_workers)
+        ]
+        if start:
+            self.start()
+
+    def start(self) -> None:
+        for p in self.workers:
+            if p.pid is None:
+                p.start()
+
+    @property
+    def duty(self) -> float:
+        return self._duty.value
+
+    def set_duty(self, duty: float) -> None:
+        duty = max(0.0, min(1.0, duty))
+        self._duty.value = duty
+        if duty > 0.0:
+            self._wake.set()
+        else:
+            self._wake.clear()
+
+    def effective_workers(self) -> float:
+        """Load in whole-core equivalents."""
+        return self._duty.value * self.n_workers
+
+    def terminate(self) -> None:
+        for p in self.workers:
+            if p.pid is not None:
+                p.terminate()
+
+
+class SignalDutyCycler:
+    """
+    Duty-cycles arbitrary processes with SIGCONT/SIGSTOP from a controller thread.
+
+    Each period the PIDs run for duty * period and are stopped for the rest;
+    duty 1 leaves them running, duty 0 leaves them stopped. stop() always
+    resumes them. POSIX only.
+    """
+
+    def __init__(self, pids: Sequence[int], period: float = 0.1, kill: Callable[[int, int], None] = None):
+        if not hasattr(signal, "SIGSTOP"):
+            raise OSError("SIGSTOP/SIGCONT duty cycling requires a POSIX platform")
+        self.pids = list(pids)
+        self.period = period
+        self.duty = 1.0
+        self._kill = kill or os.kill
+        self._stopped = False
+        self._halt = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def set_duty(self, duty: float) -> None:
+        self.duty = max(0.0, min(1.0, duty))
+
+    def _signal(self, sig: int) -> None:
+        for pid in list(self.pids):
+            try:
+                self._kill(pid, sig)
+            except ProcessLookupError:
+                self.pids.remove(pid)
+        self._stopped = sig == signal.SIGSTOP
+
+    def _run(self) -> None:
+        while not self._halt.is_set():
+            d = self.duty
+            on = d * self.period
+            if on > 0.0:
+                if self._stopped:
+                    self._signal(signal.SIGCONT)
+                if self._halt.wait(on):
+                    break
+            if d < 1.0:
+                if not self._stopped:
+                    self._signal(signal.SIGSTOP)
+                if self._halt.wait(self.period - on):
+                    break
+
+    def start(self) -> "SignalDutyCycler":
+        self._halt.clear()
+        self._thread = threading.Thread(target=self._run, name="rid-duty-cycler", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._halt.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self._signal(signal.SIGCONT)
+
+    def __enter__(self) -> "SignalDutyCycler":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
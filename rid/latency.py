@@ -0,0 +1,253 @@
+# ==========================================
+# RID: Loop-lag instrumentation (Law 4 inputs)
+# Source: RLE–LTP Framework.pdf (Law 4: tau_response > tau_control -> instability)
+# ==========================================
+"""
+Measures the timescales that temporal_mismatch_condition compares, instead of
+asking the caller to supply them by hand:
+
+    tau_control   measured control period (tick-to-tick interval) or the configured dt
+    tau_response  actuation -> observable effect latency (e.g. thread change -> temperature)
+    tau_lag       tau_response beyond the first tick (what Law 4 compares)
+    sensor        sensor read latency
+
+Every distribution is kept in a LatencyHistogram (log-bucketed, fixed memory) so
+dt can be chosen from data rather than guessed.
+"""
+
+import time
+from typing import Dict, Optional
+
+from .thermodynamics import temporal_mismatch_condition
+
+
+# Sub-buckets per power of two = 2**HIST_SUB_BITS (8 -> ~12.5% relative resolution).
+HIST_SUB_BITS = 3
+HIST_BUCKETS  = 64 << HIST_SUB_BITS
+
+
+class LatencyHistogram:
+    """
+    Log-bucketed latency histogram over integer nanoseconds.
+
+    Values below 2**(HIST_SUB_BITS+1) ns are exact; above that each power of two is
+    split into 2**HIST_SUB_BITS buckets. Memory is fixed; record() is a few integer
+    operations. Quantiles report the bucket midpoint.
+    """
+
+    __slots__ = ("counts", "count", "total_ns", "min_ns", "max_ns")
+
+    def __init__(self):
+        self.counts = [0] * HIST_BUCKETS
+        self.count = 0
+        self.total_ns = 0
+        self.min_ns = 0
+        self.max_ns = 0
+
+    def record_ns(self, ns: int) -> None:
+        """Record one latency in nanoseconds."""
+        if ns < 0:
+            ns = 0
+        shift = ns.bit_length() - HIST_SUB_BITS - 1
+        if shift < 0:
+            shift = 0
+        idx = (shift << HIST_SUB_BITS) + (ns >> shift)
+        if idx >= HIST_BUCKETS:
+            idx = HIST_BUCKETS - 1
+        self.counts[idx] += 1
+        if self.count == 0 or ns < self.min_ns:
+            self.min_ns = ns
+        if ns > self.max_ns:
+            self.max_ns = ns
+        self.count += 1
+        self.total_ns += ns
+
+    def record(self, seconds: float) -> None:
+        """Record one latency in seconds."""
+        self.record_ns(int(seconds * 1e9))
+
+    @staticmethod
+    def _bucket_mid_ns(idx: int) -> float:
+        if idx < (2 << HIST_SUB_BITS):
+            return float(idx)
+        shift = (idx >> HIST_SUB_BITS) - 1
+        mantissa = idx - (shift << HIST_SUB_BITS)
+        return ((mantissa << shift) + ((mantissa + 1) << shift)) / 2.0
+
+    def quantile(self, q: float) -> float:
+        """Approximate q-quantile in seconds (0.0 when empty)."""
+        if self.count == 0:
+            return 0.0
+        rank = max(1, int(q * self.count + 0.5))
+        seen = 0
+        for idx, c in enumerate(self.counts):
+            if c:
+                seen += c
+                if seen >= rank:
+                    mid = self._bucket_mid_ns(idx)
+                    return min(max(mid, self.min_ns), self.max_ns) / 1e9
+        return self.max_ns / 1e9
+
+    def mean(self) -> float:
+        """Mean latency in seconds (0.0 when empty)."""
+        return self.total_ns / self.count / 1e9 if self.count else 0.0
+
+    def summary(self) -> Dict[str, float]:
+        """count, mean, p50, p90, p99, max (seconds)."""
+        return {
+            "count": self.count,
+            "mean":  self.mean(),
+            "p50":   self.quantile(0.50),
+            "p90":   self.quantile(0.90),
+            "p99":   self.quantile(0.99),
+            "max":   self.max_ns / 1e9,
+        }
+
+    def reset(self) -> None:
+        self.__init__()
+
+
+class LoopLagMonitor:
+    """
+    Measures sensor latency, control period and actuation-to-effect latency for a
+    control loop and evaluates Law 4 from them.
+
+    Per tick:
+        mon.tick()                                  # control period sample
+        mon.sensor_read(seconds)                    # time spent reading sensors
+        mon.observe(value)                          # observable after the read
+        mon.actuate(direction, value)               # when the loop changes its output
+
+    direction is the sign the observable is expected to move (+1: a thread increase
+    should raise temperature). The response is registered when the observable has
+    moved by at least `deadband` in that direction; actuations that see no response
+    within `max_wait` seconds are counted as timeouts. While an actuation is
+    pending, further actuations in the same direction keep the earliest timestamp.
+
+    A loop that observes once per tick cannot see an effect sooner than the next
+    tick, so a perfectly healthy loop measures tau_response ≈ one period. With
+    `sampled` (the default) that tick is subtracted before Law 4 is evaluated;
+    pass sampled=False when observe() runs independently of the control tick.
+    """
+
+    def __init__(
+        self,
+        control_period: Optional[float] = None,
+        deadband: float = 0.0,
+        max_wait: float = 60.0,
+        response_quantile: float = 0.9,
+        clock=time.perf_counter,
+        sampled: bool = True,
+    ):
+        self.control_period = control_period
+        self.sampled = sampled
+        self.deadband = deadband
+        self.max_wait = max_wait
+        self.response_quantile = response_quantile
+        self.clock = clock
+        self.sensor = LatencyHistogram()
+        self.period = LatencyHistogram()
+        self.response = LatencyHistogram()
+        self.timeouts = 0
+        self._last_tick: Optional[float] = None
+        self._pending_t: Optional[float] = None
+        self._pending_dir = 0
+        self._pending_base = 0.0
+
+    def tick(self, now: Optional[float] = None) -> None:
+        """Mark the start of a control iteration."""
+        now = self.clock() if now is None else now
+        if self._last_tick is not None:
+            self.period.record(now - self._last_tick)
+        self._last_tick = now
+
+    def sensor_read(self, seconds: float) -> None:
+        """Record the duration of one sensor read."""
+        self.sensor.record(seconds)
+
+    def actuate(self, direction: float, value: float, now: Optional[float] = None) -> None:
+        """Register an actuation; `value` is the observable at the time of actuation."""
+        if direction == 0:
+            return
+        d = 1 if direction > 0 else -1
+        if self._pending_t is not None and d == self._pending_dir:
+            return
+        self._pending_t = self.clock() if now is None else now
+        self._pending_dir = d
+        self._pending_base = value
+
+    def observe(self, value: float, now: Optional[float] = None) -> None:
+        """Feed the current observable; closes a pending actuation once it has responded."""
+        if self._pending_t is None:
+            return
+        now = self.clock() if now is None else now
+        elapsed = now - self._pending_t
+        if (value - self._pending_base) * self._pending_dir >= self.deadband and value != self._pending_base:
+            self.response.record(elapsed)
+            self._pending_t = None
+        elif elapsed > self.max_wait:
+            self.timeouts += 1
+            self._pending_t = None
+
+    @property
+    def tau_control(self) -> float:
+        """Configured control period, else the measured median tick interval."""
+        if self.control_period is not None:
+            return self.control_period
+        return self.period.quantile(0.5)
+
+    @property
+    def tau_response(self) -> float:
+        """response_quantile of the measured actuation-to-effect latency."""
+        return self.response.quantile(self.response_quantile)
+
+    @property
+    def tau_lag(self) -> float:
+        """tau_response minus the one-tick sampling delay (measured period if known)."""
+        if not self.sampled:
+            return self.tau_response
+        tick = self.period.quantile(0.5) if self.period.count else self.tau_control
+        return max(0.0, self.tau_response - tick)
+
+    def temporal_mismatch(self) -> bool:
+        """Law 4 on measured taus; False until a response has been measured."""
+        if self.response.count == 0:
+            return False
+        return temporal_mismatch_condition(self.tau_lag, self.tau_control)
+
+    def suggested_dt(self) -> float:
+        """Smallest period that covers p99 sensor latency and the response quantile."""
+        return max(self.sensor.quantile(0.99), self.tau_response)
+
+    def summary(self) -> Dict[str, object]:
+        """Latency distributions plus the Law 4 verdict."""
+        return {
+            "sensor":             self.sensor.summary(),
+            "period":             self.period.summary(),
+            "response":           self.response.summary(),
+            "response_timeouts":  self.timeouts,
+            "tau_control":        self.tau_control,
+            "tau_response":       self.tau_response,
+            "tau_lag":            self.tau_lag,
+            "temporal_mismatch":  self.temporal_mismatch(),
+            "suggested_dt":       self.suggested_dt(),
+        }
+
+    def describe(self) -> str:
+        """Human-readable latency report."""
+        summary = self.summary()
+        lines = []
+        for name in ("sensor", "period", "response"):
+            d = summary[name]
+            lines.append(
+                f"  {name:<9}: n={d['count']:<6} p50={d['p50'] * 1e3:9.2f} ms  "
+                f"p90={d['p90'] * 1e3:9.2f} ms  p99={d['p99'] * 1e3:9.2f} ms  max={d['max'] * 1e3:9.2f} ms"
+            )
+        lines.append(f"  response timeouts: {summary['response_timeouts']}")
+        lines.append(
+            f"  tau_response={summary['tau_response']:.3f}s (lag beyond one tick {summary['tau_lag']:.3f}s)"
+            f" vs tau_control={summary['tau_control']:.3f}s"
+            f" -> temporal mismatch: {'YES' if summary['temporal_mismatch'] else 'no'}"
+        )
+        lines.append(f"  suggested dt: {summary['suggested_dt']:.3f}s")
+        return "\n".join(lines)
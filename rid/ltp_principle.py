@@ -8,8 +8,11 @@ to remain valid, predictive, and controllable. Descent is mandatory when compres
 invariants fail, phase transitions are approached, or control assumptions break.
 """
 
+from dataclasses import dataclass
 from enum import Enum
-from typing import List, Tuple
+from typing import FrozenSet, List, Optional, Tuple
+
+from .thermodynamics import temporal_mismatch_condition
 
 
 class DescentTrigger(Enum):
@@ -46,6 +49,142 @@ def mandatory_descent_triggers() -> List[Tuple[DescentTrigger, str]]:
     ]
 
 
+@dataclass
+class DescentTriggerConfig:
+    """Thresholds for DescentTriggerMonitor. All detectors use EWMA state (alpha) only."""
+    alpha: float = 0.2                  # EWMA smoothing factor per observation
+    warmup: int = 5                     # observations before trend-based triggers may fire
+    temporal_margin: float = 1.0        # TEMPORAL_MISMATCH when tau_response > margin * tau_control
+    cost_effort_rise: float = 0.01      # smoothed relative effort rise per observation
+    cost_flat_s: float = 1e-3           # smoothed dS_n at or below this counts as "no benefit"
+    control_min_action: float = 1e-9    # |action| at or below this is not an actuation
+    control_min_gain: float = 1e-3      # |dS_n| / |action| below this is an ineffective action
+    control_patience: int = 5           # consecutive ineffective actions for CONTROL_FAILURE
+    strain_threshold: float = 0.05      # smoothed |S_predicted - S_n| for INVARIANT_STRAIN
+    coupling_threshold: float = 0.6     # lag-1 autocorrelation of the de-meaned residual
+    phase_susceptibility: float = 50.0  # |dS_n| / |dx| for PHASE_TRANSITION_ENCOUNTER
+    phase_min_jump: float = 0.05        # minimum |dS_n| for a phase-boundary reading
+
+
+class DescentTriggerMonitor:
+    """
+    Streaming evaluator for the six mandatory descent triggers (LTP Section 5).
+
+    Call observe() once per loop tick. Every detector keeps O(1) state (EWMAs,
+    previous sample, a streak counter), so memory is bounded and a tick costs a
+    few microseconds. All inputs except S_n are optional; a detector only
+    evaluates when its inputs are supplied.
+
+        effort         cost proxy (power, threads)            -> COST_ESCALATION_WITHOUT_BENEFIT
+        action         actuation applied since the last tick  -> CONTROL_FAILURE
+        predicted_S    model prediction of S_n                -> INVARIANT_STRAIN, HIDDEN_COUPLING
+        tau_response   measured response time                 -> TEMPORAL_MISMATCH
+        tau_control    control/observation period
+        control_param  external control parameter x           -> PHASE_TRANSITION_ENCOUNTER
+    """
+
+    def __init__(self, config: Optional[DescentTriggerConfig] = None):
+        self.config = config or DescentTriggerConfig()
+        self.active: FrozenSet[DescentTrigger] = frozenset()
+        self.observations = 0
+        self._prev_s: Optional[float] = None
+        self._prev_effort: Optional[float] = None
+        self._prev_x: Optional[float] = None
+        self._pending_action = 0.0
+        self._ineffective_streak = 0
+        self._ds = 0.0
+        self._d_effort = 0.0
+        self._tau_response: Optional[float] = None
+        self._residual_abs = 0.0
+        self._residual_mean: Optional[float] = None
+        self._prev_residual: Optional[float] = None
+        self._residual_sq = 0.0
+        self._residual_lag = 0.0
+
+    def _ewma(self, old: float, new: float) -> float:
+        return old + self.config.alpha * (new - old)
+
+    def observe(
+        self,
+        S_n: float,
+        effort: Optional[float] = None,
+        action: Optional[float] = None,
+        predicted_S: Optional[float] = None,
+        tau_response: Optional[float] = None,
+        tau_control: Optional[float] = None,
+        control_param: Optional[float] = None,
+    ) -> List[DescentTrigger]:
+        """Fold one tick into the detectors; returns the triggers raised at this tick."""
+        cfg = self.config
+        fired: List[DescentTrigger] = []
+        self.observations += 1
+        warm = self.observations > cfg.warmup
+        ds = 0.0 if self._prev_s is None else S_n - self._prev_s
+        if self._prev_s is not None:
+            self._ds = self._ewma(self._ds, ds)
+
+        # CONTROL_FAILURE: the previous tick's action should have moved S_n.
+        if abs(self._pending_action) > cfg.control_min_action and self._prev_s is not None:
+            if abs(ds) / abs(self._pending_action) < cfg.control_min_gain:
+                self._ineffective_streak += 1
+            else:
+                self._ineffective_streak = 0
+            if self._ineffective_streak >= cfg.control_patience:
+                fired.append(DescentTrigger.CONTROL_FAILURE)
+        self._pending_action = action or 0.0
+
+        # COST_ESCALATION_WITHOUT_BENEFIT: effort keeps rising while S_n is flat or falling.
+        if effort is not None:
+            if self._prev_effort is not None:
+                # Symmetric relative change: bounded in [-2, 2] even when effort starts at 0.
+                rel = (effort - self._prev_effort) / max(abs(self._prev_effort), abs(effort), 1e-12)
+                self._d_effort = self._ewma(self._d_effort, rel)
+                # Effort must still be rising now; a settled step is not escalation.
+                if warm and rel > 0.0 and self._d_effort > cfg.cost_effort_rise and self._ds <= cfg.cost_flat_s:
+                    fired.append(DescentTrigger.COST_ESCALATION_WITHOUT_BENEFIT)
+            self._prev_effort = effort
+
+        # INVARIANT_STRAIN / HIDDEN_COUPLING: prediction residual size and memory.
+        if predicted_S is not None:
+            r = S_n - predicted_S
+            self._residual_abs = self._ewma(self._residual_abs, abs(r))
+            # Autocovariance of the de-meaned residual: a constant bias is strain, not coupling.
+            if self._residual_mean is None:
+                self._residual_mean = r
+            e = r - self._residual_mean
+            self._residual_mean = self._ewma(self._residual_mean, r)
+            self._residual_sq = self._ewma(self._residual_sq, e * e)
+            if self._prev_residual is not None:
+                self._residual_lag = self._ewma(self._residual_lag, e * self._prev_residual)
+            self._prev_residual = e
+            if warm and self._residual_abs > cfg.strain_threshold:
+                fired.append(DescentTrigger.INVARIANT_STRAIN)
+            if warm and self._residual_sq > 1e-12:
+                if self._residual_lag / self._residual_sq > cfg.coupling_threshold:
+                    fired.append(DescentTrigger.HIDDEN_COUPLING_EXPOSURE)
+
+        # TEMPORAL_MISMATCH: smoothed response time vs the control timescale.
+        if tau_response is not None:
+            self._tau_response = (tau_response if self._tau_response is None
+                                  else self._ewma(self._tau_response, tau_response))
+        if self._tau_response is not None and tau_control is not None:
+            if temporal_mismatch_condition(self._tau_response, cfg.temporal_margin * tau_control):
+                fired.append(DescentTrigger.TEMPORAL_MISMATCH)
+
+        # PHASE_TRANSITION_ENCOUNTER: small move in x, large move in S_n (Law 2 E2.1).
+        if control_param is not None:
+            if self._prev_x is not None and self._prev_s is not None:
+                dx = abs(control_param - self._prev_x)
+                if dx > 0.0 and abs(ds) >= cfg.phase_min_jump:
+                    if phase_boundary_divergence_near(dx, abs(ds) / dx, cfg.phase_susceptibility):
+                        fired.append(DescentTrigger.PHASE_TRANSITION_ENCOUNTER)
+            self._prev_x = control_param
+
+        self._prev_s = S_n
+        self.active = frozenset(fired)
+        return fired
+
+
 def compression_baseline_definition() -> str:
     """Compression baseline: bounded region where current layer's invariant remains valid without descent."""
     return (
@@ -0,0 +1,203 @@
+# ==========================================
+# RID: Merkle identity anchor for RSR
+# Source: RLE-LTP-RSR_Stability_Equation_Canonical_Spec.pdf
+# RSR_n ≡ 1 − D(y_n, n_n), D = drifted share of the anchored state
+# ==========================================
+"""
+Hashes a large state (weights shard, memory store, config blob) in fixed-size
+blocks into a binary Merkle tree, so drift can be both measured and located
+without comparing whole states:
+
+    anchor = MerkleAnchor(state_bytes, block_size=4096)
+    anchor.write(offset, new_bytes)        # rehashes touched blocks + ancestors: O(k log n)
+    anchor.drifted()                       # block indices that differ from the anchor: O(k log n)
+    RSR = anchor.rsr()                     # 1 − drifted fraction (blocks or bytes)
+    RSR = rsr_n(working_tree, anchor_tree, merkle_discrepancy)
+
+Leaves and inner nodes use BLAKE2b with distinct personalization, so a leaf
+can never collide with an inner node. The tree is stored as a flat list
+(root at 1, leaves from `size`), padded to a power of two with a fixed hash.
+States have a fixed length; writes past the end raise ValueError.
+"""
+
+import hashlib
+from typing import List, Optional, Union
+
+Buffer = Union[bytes, bytearray, memoryview]
+
+_LEAF = b"rid-merkle-leaf"
+_NODE = b"rid-merkle-node"
+
+
+class MerkleTree:
+    """
+    Block hash tree over a byte buffer.
+
+    copy=True keeps a private bytearray (mutate through write()); copy=False
+    wraps the caller's writable buffer (e.g. a NumPy array), which the caller
+    mutates directly and then reports with touch(offset, length).
+    """
+
+    def __init__(self, data, block_size: int = 4096, digest_size: int = 16, copy: bool = True):
+        if block_size <= 0:
+            raise ValueError("block_size must be positive")
+        view = memoryview(data).cast("B")
+        self.data = bytearray(view) if copy else view
+        self.block_size = block_size
+        self.digest_size = digest_size
+        self.length = len(self.data)
+        self.n_blocks = max(1, -(-self.length // block_size))
+        size = 1
+        while size < self.n_blocks:
+            size <<= 1
+        self.size = size
+        pad = hashlib.blake2b(b"", digest_size=digest_size, person=b"rid-merkle-pad").digest()
+        self.nodes: List[bytes] = [pad] * (2 * size)
+        for i in range(self.n_blocks):
+            self.nodes[size + i] = self._leaf(i)
+        for i in range(size - 1, 0, -1):
+            self.nodes[i] = self._node(i)
+
+    def _leaf(self, block: int) -> bytes:
+        start = block * self.block_size
+        return hashlib.blake2b(self.data[start:start + self.block_size],
+                               digest_size=self.digest_size, person=_LEAF).digest()
+
+    def _node(self, i: int) -> bytes:
+        return hashlib.blake2b(self.nodes[2 * i] + self.nodes[2 * i + 1],
+                               digest_size=self.digest_size, person=_NODE).digest()
+
+    @property
+    def root(self) -> bytes:
+        return self.nodes[1]
+
+    def block_bytes(self, block: int) -> int:
+        """Length of a block (the last one may be short)."""
+        return min(self.block_size, self.length - block * self.block_size)
+
+    def touch(self, offset: int, length: int) -> None:
+        """Rehash the blocks covering [offset, offset + length) and their ancestors."""
+        if length <= 0:
+            return
+        if offset < 0 or offset + length > self.length:
+            raise ValueError("range is outside the anchored state")
+        first = offset // self.block_size
+        last = (offset + length - 1) // self.block_size
+        dirty = set()
+        for b in range(first, last + 1):
+            self.nodes[self.size + b] = self._leaf(b)
+            dirty.add((self.size + b) >> 1)
+        while dirty:
+            parents = set()
+            for i in sorted(dirty, reverse=True):
+                self.nodes[i] = self._node(i)
+                if i > 1:
+                    parents.add(i >> 1)
+            dirty = parents
+
+    def write(self, offset: int, data: Buffer) -> None:
+        """Overwrite bytes at offset and update the tree."""
+        view = memoryview(data).cast("B")
+        if offset < 0 or offset + len(view) > self.length:
+            raise ValueError("write is outside the anchored state")
+        self.data[offset:offset + len(view)] = view
+        self.touch(offset, len(view))
+
+    def diff(self, other: "MerkleTree") -> List[int]:
+        """Indices of blocks whose hashes differ, descending only into differing subtrees."""
+        if other.block_size != self.block_size or other.digest_size != self.digest_size:
+            raise ValueError("trees use different block or digest sizes")
+        if other.size != self.size:
+            # Different shapes: compare leaf by leaf, extra blocks count as drifted.
+            n = max(self.n_blocks, other.n_blocks)
+            return [b for b in range(n)
+                    if b >= self.n_blocks or b >= other.n_blocks
+                    or self.nodes[self.size + b] != other.nodes[other.size + b]]
+        out: List[int] = []
+        stack = [1]
+        a, b, size = self.nodes, other.nodes, self.size
+        while stack:
+            i = stack.pop()
+            if a[i] == b[i]:
+                continue
+            if i >= size:
+                out.append(i - size)
+            else:
+                stack.append(2 * i + 1)
+                stack.append(2 * i)
+        return out
+
+    def copy(self) -> "MerkleTree":
+        """Independent tree over a private copy of the current bytes (no rehashing)."""
+        clone = MerkleTree.__new__(MerkleTree)
+        clone.__dict__.update(self.__dict__)
+        clone.data = bytearray(self.data)
+        clone.nodes = list(self.nodes)
+        return clone
+
+
+def _drift_fraction(working: MerkleTree, anchor: MerkleTree, by: str) -> float:
+    drifted = working.diff(anchor)
+    if by == "bytes":
+        total = max(working.length, anchor.length, 1)
+        changed = sum(max(working.block_bytes(b) if b < working.n_blocks else 0,
+                          anchor.block_bytes(b) if b < anchor.n_blocks else 0) for b in drifted)
+        return min(1.0, changed / total)
+    return min(1.0, len(drifted) / max(working.n_blocks, anchor.n_blocks))
+
+
+def merkle_discrepancy(y: Union[MerkleTree, Buffer], n: Union[MerkleTree, Buffer], block_size: int = 4096) -> float:
+    """
+    DiscrepancyFunc: fraction of blocks of y that differ from n. Raw buffers are
+    hashed on the fly; pass MerkleTrees to reuse maintained hashes.
+    """
+    if not isinstance(y, MerkleTree):
+        y = MerkleTree(y, block_size=getattr(n, "block_size", block_size))
+    if not isinstance(n, MerkleTree):
+        n = MerkleTree(n, block_size=y.block_size)
+    return _drift_fraction(y, n, "blocks")
+
+
+class MerkleAnchor:
+    """
+    A frozen anchor tree plus a working tree that tracks writes.
+
+    by: "blocks" weights every block equally; "bytes" weights by block length.
+    """
+
+    def __init__(self, data, block_size: int = 4096, digest_size: int = 16, by: str = "blocks",
+                 working: Optional[MerkleTree] = None):
+        if by not in ("blocks", "bytes"):
+            raise ValueError("by must be 'blocks' or 'bytes'")
+        self.by = by
+        self.anchor = MerkleTree(data, block_size=block_size, digest_size=digest_size)
+        self.working = working if working is not None else self.anchor.copy()
+
+    def write(self, offset: int, data: Buffer) -> None:
+        self.working.write(offset, data)
+
+    def touch(self, offset: int, length: int) -> None:
+        self.working.touch(offset, length)
+
+    def drifted(self) -> List[int]:
+        """Block indices that differ from the anchor, ascending."""
+        return sorted(self.working.diff(self.anchor))
+
+    def discrepancy(self) -> float:
+        return _drift_fraction(self.working, self.anchor, self.by)
+
+    def rsr(self) -> float:
+        """RSR_n = 1 − drifted share."""
+        return 1.0 - self.discrepancy()
+
+    def reanchor(self) -> None:
+        """Accept the current working state as the new identity anchor."""
+        self.anchor = self.working.copy()
+
+    def restore(self) -> None:
+        """Reset the working state to the anchor."""
+        if isinstance(self.working.data, bytearray):
+            self.working = self.anchor.copy()
+        else:
+            self.working.data[:] = self.anchor.data
+            self.working.nodes = list(self.anchor.nodes)
@@ -0,0 +1,233 @@
+# ==========================================
+# RID: Pull-based metrics exporter (Prometheus text exposition)
+# Standard library only: http.server on a daemon thread
+# ==========================================
+"""
+Publishes live RID state for one or many FIDF loops over HTTP:
+
+    registry = MetricsRegistry()
+    loop = registry.loop("furnace", dt=0.5)
+    server = MetricsServer(registry, port=9464).start()
+    run_fidf_loop(cfg, ..., on_step=loop.observe)      # loop.observe is an on_step callback
+    loop.observe_physics(physics_state)                # optional
+    loop.sensor_updated()                              # optional, for staleness
+
+The control loop only assigns fields and bumps a version counter; it never
+takes a lock or formats text. A scrape re-renders only the loops whose
+version changed since the previous scrape and reuses cached lines for the
+rest; sensor staleness is the only value computed at scrape time.
+"""
+
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+
+from .semantic_physics import PhysicsState
+
+
+AXES = ("RSR", "LTP", "RLE", "S_n")
+PHYSICS_QUANTITIES = ("prompt_mass", "raw_force", "gpu_friction", "hidden_loss", "lambda_total", "realized_force")
+
+# (family, type, help) in exposition order
+FAMILIES: Tuple[Tuple[str, str, str], ...] = (
+    ("rid_axis",                     "gauge",   "Current RID axis value (RSR, LTP, RLE, S_n)."),
+    ("rid_axis_mean",                "gauge",   "Mean RID axis value since start."),
+    ("rid_axis_min",                 "gauge",   "Minimum RID axis value since start."),
+    ("rid_steps_total",              "counter", "FIDF steps observed."),
+    ("rid_actions_total",            "counter", "Diagnostic actions taken, by action."),
+    ("rid_physics",                  "gauge",   "Semantic physics quantities from the last compute."),
+    ("rid_kernel_descent",           "gauge",   "1 when the last physics state demanded kernel descent."),
+    ("rid_temporal_mismatch",        "gauge",   "1 when Law 4 (tau_response > tau_control) is violated."),
+    ("rid_loop_interval_seconds",    "gauge",   "Last measured interval between FIDF steps."),
+    ("rid_loop_jitter_seconds",      "gauge",   "Smoothed |interval - dt| between FIDF steps."),
+    ("rid_loop_jitter_max_seconds",  "gauge",   "Largest |interval - dt| seen."),
+    ("rid_sensor_staleness_seconds", "gauge",   "Seconds since the last sensor update."),
+)
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _fmt(value: float) -> str:
+    """Sample value in exposition format: repr for finite floats, NaN / +Inf / -Inf otherwise."""
+    v = float(value)
+    if v != v:
+        return "NaN"
+    if v in (float("inf"), float("-inf")):
+        return "+Inf" if v > 0 else "-Inf"
+    return repr(v)
+
+
+class FIDFLoopMetrics:
+    """Live and aggregated metrics for one FIDF loop. Written by the loop, read by scrapes."""
+
+    def __init__(self, name: str, dt: Optional[float] = None, clock=time.monotonic):
+        self.name = name
+        self.dt = dt
+        self.clock = clock
+        self.version = 0
+        self.steps = 0
+        self.current = dict.fromkeys(AXES, 1.0)
+        self.sums = dict.fromkeys(AXES, 0.0)
+        self.mins = dict.fromkeys(AXES, 1.0)
+        self.actions: Dict[str, int] = {}
+        self.physics: Optional[PhysicsState] = None
+        self.temporal_mismatch = False
+        self.interval = 0.0
+        self.jitter = 0.0
+        self.jitter_max = 0.0
+        self.last_sensor: Optional[float] = None
+        self._last_step: Optional[float] = None
+        self._label = f'loop="{_escape_label(name)}"'
+        self._cache_version = -1
+        self._cache: Dict[str, List[str]] = {}
+
+    def observe(self, n, state, diag=None) -> None:
+        """on_step-compatible: fold one FIDF state into the metrics."""
+        now = self.clock()
+        if self._last_step is not None:
+            self.interval = now - self._last_step
+            if self.dt is not None:
+                dev = abs(self.interval - self.dt)
+                self.jitter += 0.1 * (dev - self.jitter)
+                if dev > self.jitter_max:
+                    self.jitter_max = dev
+        self._last_step = now
+        values = (state.RSR_n, state.LTP_n, state.RLE_n, state.S_n)
+        for axis, v in zip(AXES, values):
+            self.current[axis] = v
+            self.sums[axis] += v
+            if v < self.mins[axis]:
+                self.mins[axis] = v
+        self.actions[state.action] = self.actions.get(state.action, 0) + 1
+        self.temporal_mismatch = bool(getattr(state, "temporal_mismatch", False))
+        self.steps += 1
+        self.version += 1
+
+    def observe_physics(self, physics: PhysicsState) -> None:
+        """Record the latest UnifiedSemanticPhysics output."""
+        self.physics = physics
+        self.version += 1
+
+    def sensor_updated(self, timestamp: Optional[float] = None) -> None:
+        """Mark a fresh sensor reading (timestamp on this object's clock)."""
+        self.last_sensor = self.clock() if timestamp is None else timestamp
+
+    def _render(self) -> Dict[str, List[str]]:
+        lbl = self._label
+        out: Dict[str, List[str]] = {name: [] for name, _, _ in FAMILIES}
+        steps = max(1, self.steps)
+        for axis in AXES:
+            a = f'{lbl},axis="{axis}"'
+            out["rid_axis"].append(f"rid_axis{{{a}}} {_fmt(self.current[axis])}")
+            out["rid_axis_mean"].append(f"rid_axis_mean{{{a}}} {_fmt(self.sums[axis] / steps)}")
+            out["rid_axis_min"].append(f"rid_axis_min{{{a}}} {_fmt(self.mins[axis])}")
+        out["rid_steps_total"].append(f"rid_steps_total{{{lbl}}} {self.steps}")
+        for action, count in sorted(list(self.actions.items())):   # snapshot: the loop thread adds keys
+            out["rid_actions_total"].append(
+                f'rid_actions_total{{{lbl},action="{_escape_label(action)}"}} {count}')
+        if self.physics is not None:
+            for q in PHYSICS_QUANTITIES:
+                out["rid_physics"].append(
+                    f'rid_physics{{{lbl},quantity="{q}"}} {_fmt(getattr(self.physics, q))}')
+            out["rid_kernel_descent"].append(f"rid_kernel_descent{{{lbl}}} {int(self.physics.kernel_descent)}")
+        out["rid_temporal_mismatch"].append(f"rid_temporal_mismatch{{{lbl}}} {int(self.temporal_mismatch)}")
+        out["rid_loop_interval_seconds"].append(f"rid_loop_interval_seconds{{{lbl}}} {_fmt(self.interval)}")
+        if self.dt is not None:
+            out["rid_loop_jitter_seconds"].append(f"rid_loop_jitter_seconds{{{lbl}}} {_fmt(self.jitter)}")
+            out["rid_loop_jitter_max_seconds"].append(
+                f"rid_loop_jitter_max_seconds{{{lbl}}} {_fmt(self.jitter_max)}")
+        return out
+
+    def lines(self) -> Dict[str, List[str]]:
+        """Sample lines per family; re-rendered only when the loop has changed."""
+        version = self.version
+        if version != self._cache_version:
+            self._cache = self._render()
+            self._cache_version = version
+        cache = self._cache
+        if self.last_sensor is not None:
+            stale = max(0.0, self.clock() - self.last_sensor)
+            cache = dict(cache)
+            cache["rid_sensor_staleness_seconds"] = [
+                f"rid_sensor_staleness_seconds{{{self._label}}} {_fmt(stale)}"]
+        return cache
+
+
+class MetricsRegistry:
+    """Collection of FIDFLoopMetrics rendered together as one exposition."""
+
+    def __init__(self):
+        self._loops: Dict[str, FIDFLoopMetrics] = {}
+        self._lock = threading.Lock()   # guards registration only; never taken by loops
+
+    def loop(self, name: str, dt: Optional[float] = None) -> FIDFLoopMetrics:
+        """Get or create the metrics object for a named loop."""
+        with self._lock:
+            m = self._loops.get(name)
+            if m is None:
+                m = self._loops[name] = FIDFLoopMetrics(name, dt=dt)
+            return m
+
+    def render(self) -> str:
+        """Prometheus text exposition format 0.0.4."""
+        with self._lock:
+            loops = list(self._loops.values())
+        per_loop = [m.lines() for m in loops]
+        chunks: List[str] = []
+        for family, mtype, help_text in FAMILIES:
+            samples = [line for lines in per_loop for line in lines.get(family, ())]
+            if not samples:
+                continue
+            chunks.append(f"# HELP {family} {help_text}")
+            chunks.append(f"# TYPE {family} {mtype}")
+            chunks.extend(samples)
+        return "\n".join(chunks) + "\n"
+
+
+class MetricsServer:
+    """Local HTTP endpoint serving registry.render() at /metrics on a daemon thread."""
+
+    def __init__(self, registry: MetricsRegistry, host: str = "127.0.0.1", port: int = 9464):
+        self.registry = registry
+        self.host = host
+        self.port = port
+        self._httpd: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "MetricsServer":
+        registry = self.registry
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?", 1)[0] not in ("/metrics", "/"):
+                    self.send_error(404)
+                    return
+                body = registry.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, fmt, *args):
+                pass
+
+        self._httpd = ThreadingHTTPServer((self.host, self.port), Handler)
+        self._httpd.daemon_threads = True
+        self.port = self._httpd.server_address[1]
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="rid-metrics", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}/metrics"
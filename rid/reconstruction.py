@@ -0,0 +1,283 @@
+# ==========================================
+# RID: Streaming reconstruction filters (n_n for RSR)
+# Source: RLE-LTP-RSR_Stability_Equation_Canonical_Spec.pdf
+# RSR_n ≡ 1 − D(y_n, n_n), n_n = filtered/delayed echo of prior state
+# ==========================================
+"""
+O(1)-per-sample generators of the reconstruction n_n that rsr_n compares
+against. Every filter predicts y_n from samples up to y_{n−1}, then absorbs
+y_n:
+
+    f = EWMA(alpha=0.2)
+    recon = f.step(y)                    # prediction made before seeing y
+    RSR = rsr_n(y, recon)
+
+    DelayLine(delay)        n_n = y_{n−delay}
+    EWMA(alpha)             exponentially weighted mean
+    AlphaBeta(alpha, beta)  level + trend (g-h filter)
+    Kalman(q, r)            random-walk Kalman predictor; q, r scalar or per-element
+
+Scalars stay Python floats. NumPy vectors keep their state in preallocated
+arrays updated in place; step(y, out=buf) writes the prediction into `buf`
+instead of allocating. run(ys) is the batch-over-time version and returns the
+reconstruction for every row of ys. The first sample has no prior and is
+reconstructed as itself unless `initial` is given.
+
+    get_y, get_recon = reconstruction_callbacks(EWMA(0.2), sensor)
+    run_fidf_loop(cfg, get_y, get_recon, ...)
+"""
+
+from typing import Callable, Optional, Tuple
+
+import numpy as np
+
+from .discrepancy import DiscrepancyFunc, discrepancy_01
+
+
+def _is_array(y) -> bool:
+    return isinstance(y, np.ndarray) and y.ndim > 0
+
+
+class _Filter:
+    """Shared step/run plumbing; subclasses implement _init, _predict and _update."""
+
+    def __init__(self, initial=None):
+        self._ready = False
+        self._vector = False
+        self._initial = initial
+        self.count = 0
+
+    def _emit(self, pred, out):
+        if not self._vector:
+            return pred
+        if out is None:
+            return pred.copy()
+        np.copyto(out, pred)
+        return out
+
+    def predict(self, out: Optional[np.ndarray] = None):
+        """Reconstruction of the next sample (None before any state exists)."""
+        if not self._ready:
+            return None
+        return self._emit(self._predict(), out)
+
+    def step(self, y, out: Optional[np.ndarray] = None):
+        """Return the reconstruction of y (made without y), then absorb y."""
+        if not self._ready:
+            self._vector = _is_array(y)
+            seed = y if self._initial is None else self._initial
+            if self._vector:
+                seed = np.array(np.broadcast_to(seed, np.shape(y)), dtype=np.float64)
+            else:
+                seed = float(seed)
+            self._init(seed)
+            self._ready = True
+        pred = self._emit(self._predict(), out)
+        self._update(y)
+        self.count += 1
+        return pred
+
+    def run(self, ys) -> np.ndarray:
+        """Batch over time: reconstruction for each row of ys (axis 0 is time)."""
+        ys = np.asarray(ys, dtype=np.float64)
+        out = np.empty_like(ys)
+        if ys.ndim == 1:
+            for i, y in enumerate(ys.tolist()):
+                out[i] = self.step(y)
+        else:
+            for i in range(len(ys)):
+                self.step(ys[i], out=out[i])
+        return out
+
+    def reset(self) -> None:
+        self._ready = False
+        self.count = 0
+
+
+class DelayLine(_Filter):
+    """n_n = y_{n−delay}; samples before the first `delay` see the initial value."""
+
+    def __init__(self, delay: int = 1, initial=None):
+        if delay < 1:
+            raise ValueError("delay must be >= 1")
+        super().__init__(initial)
+        self.delay = delay
+
+    def _init(self, seed) -> None:
+        if self._vector:
+            self._buf = np.repeat(seed[None, ...], self.delay, axis=0)
+        else:
+            self._buf = [seed] * self.delay
+        self._pos = 0
+
+    def _predict(self):
+        return self._buf[self._pos]
+
+    def _update(self, y) -> None:
+        if self._vector:
+            np.copyto(self._buf[self._pos], y)
+        else:
+            self._buf[self._pos] = float(y)
+        self._pos = (self._pos + 1) % self.delay
+
+    def run(self, ys) -> np.ndarray:
+        """Vectorized shift when starting fresh."""
+        ys = np.asarray(ys, dtype=np.float64)
+        if self._ready or len(ys) == 0:
+            return super().run(ys)
+        first = ys[0] if self._initial is None else np.broadcast_to(self._initial, ys.shape[1:])
+        out = np.empty_like(ys)
+        d = min(self.delay, len(ys))
+        out[:d] = first
+        out[d:] = ys[:len(ys) - d]
+        # leave the filter primed as if the samples had been streamed
+        self._vector = ys.ndim > 1
+        self._init(np.array(first, dtype=np.float64) if self._vector else float(first))
+        self._ready = True
+        for i in range(max(0, len(ys) - self.delay), len(ys)):
+            if self._vector:
+                np.copyto(self._buf[i % self.delay], ys[i])
+            else:
+                self._buf[i % self.delay] = float(ys[i])
+        self._pos = len(ys) % self.delay
+        self.count += len(ys)
+        return out
+
+
+class EWMA(_Filter):
+    """m ← m + alpha · (y − m); n_n = m."""
+
+    def __init__(self, alpha: float = 0.2, initial=None):
+        if not 0.0 < alpha <= 1.0:
+            raise ValueError("alpha must be in (0, 1]")
+        super().__init__(initial)
+        self.alpha = alpha
+
+    def _init(self, seed) -> None:
+        self.mean = seed
+
+    def _predict(self):
+        return self.mean
+
+    def _update(self, y) -> None:
+        if self._vector:
+            m = self.mean
+            m += self.alpha * (np.asarray(y) - m)
+        else:
+            self.mean += self.alpha * (float(y) - self.mean)
+
+
+class AlphaBeta(_Filter):
+    """
+    Level/trend predictor: n_n = x + v·dt; after y, r = y − n_n,
+    x ← n_n + alpha·r, v ← v + beta·r / dt.
+    """
+
+    def __init__(self, alpha: float = 0.5, beta: float = 0.1, dt: float = 1.0, initial=None):
+        super().__init__(initial)
+        self.alpha, self.beta, self.dt = alpha, beta, dt
+
+    def _init(self, seed) -> None:
+        self.x = seed
+        self.v = np.zeros_like(seed) if self._vector else 0.0
+        if self._vector:
+            self._pred = np.empty_like(seed)
+
+    def _predict(self):
+        if self._vector:
+            np.multiply(self.v, self.dt, out=self._pred)
+            self._pred += self.x
+            return self._pred
+        return self.x + self.v * self.dt
+
+    def _update(self, y) -> None:
+        if self._vector:
+            pred = self._predict()
+            r = np.asarray(y) - pred
+            np.copyto(self.x, pred)
+            self.x += self.alpha * r
+            self.v += (self.beta / self.dt) * r
+        else:
+            pred = self.x + self.v * self.dt
+            r = float(y) - pred
+            self.x = pred + self.alpha * r
+            self.v += self.beta * r / self.dt
+
+
+class Kalman(_Filter):
+    """
+    Random-walk (constant-level) Kalman predictor, scalar or diagonal.
+
+    q: process noise variance, r: measurement noise variance (scalars or
+    per-element arrays). n_n = x; P ← P + q; K = P / (P + r);
+    x ← x + K·(y − x); P ← (1 − K)·P.
+    """
+
+    def __init__(self, q=1e-3, r=1e-2, p0=1.0, initial=None):
+        super().__init__(initial)
+        self.q, self.r, self.p0 = q, r, p0
+
+    def _init(self, seed) -> None:
+        self.x = seed
+        if self._vector:
+            self.P = np.array(np.broadcast_to(self.p0, seed.shape), dtype=np.float64)
+            self._K = np.empty_like(seed)
+        else:
+            self.P = float(self.p0)
+
+    def _predict(self):
+        return self.x
+
+    def _update(self, y) -> None:
+        if self._vector:
+            P, K = self.P, self._K
+            P += self.q
+            np.divide(P, P + self.r, out=K)
+            self.x += K * (np.asarray(y) - self.x)
+            P *= 1.0 - K
+        else:
+            P = self.P + self.q
+            K = P / (P + self.r)
+            self.x += K * (float(y) - self.x)
+            self.P = (1.0 - K) * P
+
+    @property
+    def gain(self):
+        """Gain the next update will apply (None before the first sample)."""
+        if not self._ready:
+            return None
+        P = self.P + self.q
+        return P / (P + self.r)
+
+
+def reconstruction_callbacks(
+    filt: _Filter,
+    get_observable: Callable[[int], object],
+) -> Tuple[Callable[[int], object], Callable[[int], object]]:
+    """
+    Wrap a raw signal for run_fidf_loop: returns (get_observable, get_reconstruction),
+    where the reconstruction of step n is the filter's prediction made before y_n.
+    """
+    pending = {}
+
+    def observable(n):
+        y = get_observable(n)
+        pending[n] = filt.step(y)
+        return y
+
+    def reconstruction(n):
+        return pending.pop(n)
+
+    return observable, reconstruction
+
+
+def stream_rsr(ys, filt: _Filter, D: Optional[DiscrepancyFunc] = None) -> np.ndarray:
+    """RSR_n for every sample of a raw stream (vectors: one row per step)."""
+    D = D or discrepancy_01
+    ys = np.asarray(ys, dtype=np.float64)
+    recon = filt.run(ys)
+    if ys.ndim == 1 and D is discrepancy_01:
+        return np.clip(1.0 - np.minimum(1.0, np.abs(ys - recon)), 0.0, 1.0)
+    rows = ys.tolist() if ys.ndim == 1 else ys
+    recs = recon.tolist() if ys.ndim == 1 else recon
+    return np.array([max(0.0, min(1.0, 1.0 - D(y, r))) for y, r in zip(rows, recs)])
@@ -0,0 +1,251 @@
+# ==========================================
+# RID: Faster-than-real-time replay of recorded telemetry
+# Drives run_fidf_loop, the physics engine and the governors from a trace
+# ==========================================
+"""
+Replays a recorded trace through the control stack with no sleeps, so a
+governor change can be regression-tested or benchmarked on any box.
+
+Sources (load_trace picks by content):
+    binary trace      rid.trace files (.rtrace), what the furnaces record
+    furnace CSV       trace_to_csv output (furnace --csv, python -m rid.trace) or the
+                      older per-tick CSV logs (Tick, Temp_C, LTP, S_n, ...)
+    HWiNFO CSV        wide sensor log; every numeric column is kept under its header name
+
+    trace = load_trace("cpu_thermal_trace.rtrace")
+    engine = ReplayEngine(trace)                       # time_scale=None: as fast as possible
+    decisions = engine.run_governor(ThreadGovernor())  # S_n from the recorded column
+
+time_scale=k replays at k x recorded speed (k=1 is real time).
+"""
+
+import csv
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .fidf import FIDFConfig, FIDFState, run_fidf_loop
+from .semantic_physics import PhysicsState, UnifiedSemanticPhysics
+from .trace import TRACE_MAGIC, TraceReader
+
+
+@dataclass
+class ReplayTrace:
+    """Columnar recorded telemetry: timestamps (s), numeric columns, optional recorded actions."""
+    t: np.ndarray
+    columns: Dict[str, np.ndarray]
+    actions: Optional[List[str]] = None
+    source: str = ""
+
+    def __len__(self) -> int:
+        return len(self.t)
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.columns[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.columns
+
+
+@dataclass
+class ReplayDecision:
+    """One replayed control decision."""
+    tick: int
+    t: float
+    S_n: float
+    action: str
+    threads: Optional[int] = None
+    physics: Optional[PhysicsState] = None
+
+
+def _to_float(cell: str) -> float:
+    try:
+        return float(cell.strip())
+    except (ValueError, AttributeError):
+        return float("nan")
+
+
+def _clock_seconds(cell: str) -> float:
+    """'HH:MM:SS[.fff]' -> seconds of day, NaN if not a clock time."""
+    parts = cell.strip().split(":")
+    if len(parts) != 3:
+        return float("nan")
+    try:
+        return int(parts[0]) * 3600 + int(parts[1]) * 60 + float(parts[2])
+    except ValueError:
+        return float("nan")
+
+
+def _columnar(header: Sequence[str], rows: List[List[str]]) -> Dict[str, np.ndarray]:
+    cols: Dict[str, np.ndarray] = {}
+    for j, name in enumerate(header):
+        values = np.array([_to_float(r[j]) if j < len(r) else float("nan") for r in rows])
+        if not np.all(np.isnan(values)):
+            cols[name] = values
+    return cols
+
+
+def load_furnace_csv(path: str, period: float = 0.5) -> ReplayTrace:
+    """Tick-indexed CSV (furnace trace or trace_to_csv output). t = Time column, else Tick * period."""
+    with open(path, newline="", encoding="utf-8", errors="ignore") as f:
+        reader = csv.reader(f)
+        header = [h.strip() for h in next(reader)]
+        rows = [r for r in reader if r]
+    cols = _columnar(header, rows)
+    actions = [r[header.index("Action")] for r in rows] if "Action" in header else None
+    if "Time" in cols:
+        t = cols["Time"]
+    elif "Tick" in cols:
+        t = cols["Tick"] * period
+    else:
+        t = np.arange(len(rows)) * period
+    return ReplayTrace(t=t, columns=cols, actions=actions, source=str(path))
+
+
+def load_hwinfo_csv(path: str, period: float = 1.0) -> ReplayTrace:
+    """
+    HWiNFO sensor log. Rows are kept only if they have the header's width; the
+    repeated header/footer rows HWiNFO appends are dropped. t comes from the
+    Time column when it parses, else row index * period.
+    """
+    with open(path, newline="", encoding="latin-1") as f:
+        reader = csv.reader(f)
+        header = [h.strip() for h in next(reader)]
+        rows = [r for r in reader if len(r) >= len(header) - 1 and r[0].strip() != header[0]]
+    cols = _columnar(header, rows)
+    t = None
+    if "Time" in header:
+        j = header.index("Time")
+        t = np.array([_clock_seconds(r[j]) for r in rows])
+        if np.any(np.isnan(t)):
+            t = None
+        else:
+            t = np.where(t < t[0], t + 86400.0, t) - t[0]   # midnight wrap
+    if t is None:
+        t = np.arange(len(rows)) * period
+    return ReplayTrace(t=t, columns=cols, source=str(path))
+
+
+def load_binary_trace(path: str) -> ReplayTrace:
+    """rid.trace file; sensor columns are exposed by name."""
+    r = TraceReader(path)
+    cols = {name: np.asarray(r[name], dtype=float) for name in ("RSR", "LTP", "RLE", "S_n", "tick", "threads")}
+    for name in r.sensor_names:
+        cols[name] = np.asarray(r.sensor(name), dtype=float)
+    t = np.asarray(r["t"], dtype=float)
+    return ReplayTrace(t=t - t[0] if len(t) else t, columns=cols, actions=r.actions(), source=str(path))
+
+
+def load_trace(path: str, **kwargs) -> ReplayTrace:
+    """Load any supported trace, dispatching on the file content."""
+    with open(path, "rb") as f:
+        head = f.read(4096)
+    if head[:len(TRACE_MAGIC)] == TRACE_MAGIC:
+        return load_binary_trace(path)
+    first = head.split(b"\n", 1)[0].decode("latin-1")
+    if "Tick" in first.split(","):
+        return load_furnace_csv(path, **kwargs)
+    return load_hwinfo_csv(path, **kwargs)
+
+
+class ReplayEngine:
+    """
+    Drives the control stack from a ReplayTrace.
+
+    time_scale: None replays as fast as the CPU allows; k > 0 paces frames at
+        k x the recorded rate.
+    """
+
+    def __init__(
+        self,
+        trace: ReplayTrace,
+        time_scale: Optional[float] = None,
+        sleep: Callable[[float], None] = time.sleep,
+        clock: Callable[[], float] = time.perf_counter,
+    ):
+        if time_scale is not None and time_scale <= 0:
+            raise ValueError("time_scale must be positive")
+        self.trace = trace
+        self.time_scale = time_scale
+        self._sleep = sleep
+        self._clock = clock
+        self._start: Optional[float] = None
+
+    def _pace(self, n: int) -> None:
+        if self.time_scale is None:
+            return
+        if n == 0 or self._start is None:
+            self._start = self._clock()
+            return
+        target = self._start + (self.trace.t[n] - self.trace.t[0]) / self.time_scale
+        delay = target - self._clock()
+        if delay > 0:
+            self._sleep(delay)
+
+    def run_governor(
+        self,
+        governor,
+        s_n: Optional[Callable[[int], float]] = None,
+        physics: Optional[UnifiedSemanticPhysics] = None,
+        physics_inputs: Optional[Callable[[int, float], Tuple[float, float, float, float]]] = None,
+    ) -> List[ReplayDecision]:
+        """
+        Run a governor (anything with step(s_n) -> (action, threads)) over the trace.
+
+        s_n(n) supplies the stability scalar; default is the recorded S_n column.
+        physics_inputs(n, s_n) -> (stm_load, ltp, rle, prompt_tokens) enables a
+        physics computation per frame.
+        """
+        if s_n is None:
+            recorded = self.trace["S_n"]
+            s_n = lambda n: float(recorded[n])
+        decisions: List[ReplayDecision] = []
+        for n in range(len(self.trace)):
+            self._pace(n)
+            s = s_n(n)
+            action, threads = governor.step(s)
+            ps = None
+            if physics is not None and physics_inputs is not None:
+                stm_load, ltp, rle, tokens = physics_inputs(n, s)
+                ps = physics.compute(s, stm_load, ltp, rle, prompt_tokens=tokens)
+            decisions.append(ReplayDecision(n, float(self.trace.t[n]), s, action, threads, ps))
+        return decisions
+
+    def run_fidf(
+        self,
+        get_observable: Callable[[int], float],
+        get_reconstruction: Callable[[int], float],
+        get_support_demand: Callable[[int], tuple],
+        get_capacity: Callable[[int], tuple],
+        physics: Optional[UnifiedSemanticPhysics] = None,
+        physics_inputs: Optional[Callable[[int, FIDFState], Tuple[float, float]]] = None,
+        on_step: Optional[Callable] = None,
+        **loop_kwargs,
+    ) -> List[ReplayDecision]:
+        """
+        Run run_fidf_loop over every frame with dt=0. Callbacks take the frame index
+        and read from self.trace. physics_inputs(n, state) -> (stm_load, prompt_tokens)
+        enables a physics computation per step. Extra keyword arguments (tracer,
+        lag_monitor, recorder, ...) are passed through to run_fidf_loop.
+        """
+        decisions: List[ReplayDecision] = []
+
+        def observable(n):
+            self._pace(n)
+            return get_observable(n)
+
+        def record(n, state, diag):
+            ps = None
+            if physics is not None and physics_inputs is not None:
+                stm_load, tokens = physics_inputs(n, state)
+                ps = physics.compute(state.S_n, stm_load, state.LTP_n, state.RLE_n, prompt_tokens=tokens)
+            decisions.append(ReplayDecision(n, float(self.trace.t[n]), state.S_n, state.action, physics=ps))
+            if on_step is not None:
+                on_step(n, state, diag)
+
+        cfg = FIDFConfig(dt=0.0, max_steps=len(self.trace))
+        run_fidf_loop(cfg, observable, get_reconstruction, get_support_demand, get_capacity,
+                      on_step=record, **loop_kwargs)
+        return decisions
@@ -0,0 +1,261 @@
+# ==========================================
+# RID: Memory-pressure RLE sources (PSI and cgroup v2)
+# Source: RLE–LTP Framework.pdf (RLE_n = (E_{n+1} − U_n) / E_n)
+# ==========================================
+"""
+Leading RLE signals for memory-driven descent, replacing the lagging
+virtual_memory().percent ramp:
+
+    PSISource            /proc/pressure/{memory,cpu}: share of wall time stalled
+    CgroupMemorySource   cgroup v2 memory.current / memory.max / memory.events
+    CompositeRLESource   worst of several sources
+
+Each source returns RLE inputs (E_n, U_n, E_next) for rle_n(E_next, U_n, E_n);
+the capacity is carried through unchanged (E_next = E_n) and U_n is the part a
+PressureCurve marks unusable. The files are opened once and reread with
+os.pread, so a read is one syscall per file and no allocation beyond the text.
+
+    src = default_memory_rle_source()
+    RLE = src.rle() if src else 1.0
+"""
+
+import os
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Tuple
+
+from .axioms import rle_n
+
+
+RLEInputs = Tuple[float, float, float]   # (E_n, U_n, E_next)
+
+
+@dataclass(frozen=True)
+class PressureCurve:
+    """
+    Maps a pressure signal to a loss fraction in [0, 1]:
+    0 at or below `safe`, 1 at or above `critical`, ((x − safe) / (critical − safe)) ** exponent between.
+    """
+    safe: float
+    critical: float
+    exponent: float = 1.0
+
+    def __post_init__(self):
+        if self.critical <= self.safe:
+            raise ValueError("critical must be greater than safe")
+
+    def __call__(self, x: float) -> float:
+        if x <= self.safe:
+            return 0.0
+        if x >= self.critical:
+            return 1.0
+        return ((x - self.safe) / (self.critical - self.safe)) ** self.exponent
+
+
+class PreadFile:
+    """A file kept open and reread from offset 0 (procfs, sysfs and cgroupfs all support pread)."""
+
+    __slots__ = ("path", "_fd", "size")
+
+    def __init__(self, path: str, size: int = 4096):
+        self.path = path
+        self.size = size
+        self._fd: Optional[int] = os.open(path, os.O_RDONLY)
+
+    def read(self) -> str:
+        return os.pread(self._fd, self.size, 0).decode("ascii", "replace")
+
+    def close(self) -> None:
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+
+def parse_psi(text: str) -> Dict[str, Dict[str, float]]:
+    """'some avg10=1.00 avg60=0.50 avg300=0.10 total=123' lines -> {"some": {...}, "full": {...}}."""
+    out: Dict[str, Dict[str, float]] = {}
+    for line in text.splitlines():
+        kind, _, rest = line.partition(" ")
+        if not rest:
+            continue
+        out[kind] = {k: float(v) for k, v in (f.split("=", 1) for f in rest.split())}
+    return out
+
+
+def parse_flat_keyed(text: str) -> Dict[str, int]:
+    """cgroup flat-keyed file ('oom_kill 3' lines) -> dict."""
+    out: Dict[str, int] = {}
+    for line in text.splitlines():
+        key, _, value = line.partition(" ")
+        if value:
+            out[key] = int(value)
+    return out
+
+
+class PSISource:
+    """
+    Pressure-stall RLE for one resource ("memory", "cpu", "io").
+
+    The stall fraction is the growth of the `total` stall counter (µs) over the
+    wall time since the previous read, so it reacts within one tick rather than
+    the 10 s of avg10 (used for the first read only). `full` stalls (every task
+    stalled) are weighted by `full_weight` against `some` stalls.
+    """
+
+    def __init__(
+        self,
+        resource: str = "memory",
+        proc_root: str = "/proc",
+        curve: PressureCurve = PressureCurve(safe=0.05, critical=0.40),
+        full_weight: float = 2.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.resource = resource
+        self.curve = curve
+        self.full_weight = full_weight
+        self.clock = clock
+        self.stall = 0.0
+        self._file = PreadFile(os.path.join(proc_root, "pressure", resource))
+        self._last: Optional[Tuple[float, float, float]] = None   # (t, some_total, full_total)
+
+    def sample(self) -> float:
+        """Read the file and return the weighted stall fraction in [0, 1]."""
+        now = self.clock()
+        psi = parse_psi(self._file.read())
+        some = psi.get("some", {})
+        full = psi.get("full", {})   # absent for cpu on older kernels
+        some_total = some.get("total", 0.0)
+        full_total = full.get("total", 0.0)
+        if self._last is None or now <= self._last[0]:
+            some_frac = some.get("avg10", 0.0) / 100.0
+            full_frac = full.get("avg10", 0.0) / 100.0
+        else:
+            elapsed_us = (now - self._last[0]) * 1e6
+            some_frac = (some_total - self._last[1]) / elapsed_us
+            full_frac = (full_total - self._last[2]) / elapsed_us
+        self._last = (now, some_total, full_total)
+        self.stall = max(0.0, min(1.0, max(some_frac, self.full_weight * full_frac)))
+        return self.stall
+
+    def read(self) -> RLEInputs:
+        loss = self.curve(self.sample())
+        return 1.0, loss, 1.0
+
+    def rle(self) -> float:
+        E_n, U_n, E_next = self.read()
+        return rle_n(E_next, U_n, E_n)
+
+    def close(self) -> None:
+        self._file.close()
+
+
+def current_cgroup_dir(cgroup_root: str = "/sys/fs/cgroup", proc_root: str = "/proc") -> str:
+    """This process's cgroup v2 directory (the '0::/path' entry of /proc/self/cgroup)."""
+    try:
+        with open(os.path.join(proc_root, "self", "cgroup")) as f:
+            for line in f:
+                if line.startswith("0::"):
+                    return os.path.join(cgroup_root, line[3:].strip().lstrip("/"))
+    except OSError:
+        pass
+    return cgroup_root
+
+
+class CgroupMemorySource:
+    """
+    cgroup v2 memory RLE: usage against the cgroup's own limit, not the host's.
+
+    E_n = E_next = memory.max (or `fallback_limit`, default physical RAM, when
+    unlimited) and U_n = curve(current / limit) · E_n, in bytes. A new `max`
+    event (reclaim at the limit) raises the loss to at least `max_event_loss`;
+    a new `oom` or `oom_kill` event forces total loss.
+    """
+
+    def __init__(
+        self,
+        cgroup_dir: Optional[str] = None,
+        curve: PressureCurve = PressureCurve(safe=0.80, critical=0.95),
+        max_event_loss: float = 0.5,
+        fallback_limit: Optional[float] = None,
+    ):
+        self.cgroup_dir = cgroup_dir or current_cgroup_dir()
+        self.curve = curve
+        self.max_event_loss = max_event_loss
+        if fallback_limit is None:
+            fallback_limit = float(os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES"))
+        self.fallback_limit = fallback_limit
+        self.usage = 0.0
+        self._current = PreadFile(os.path.join(self.cgroup_dir, "memory.current"), 64)
+        self._max = PreadFile(os.path.join(self.cgroup_dir, "memory.max"), 64)
+        path = os.path.join(self.cgroup_dir, "memory.events")
+        self._events = PreadFile(path) if os.path.exists(path) else None
+        self._last_events: Optional[Dict[str, int]] = None
+
+    def limit(self) -> float:
+        raw = self._max.read().strip()
+        return self.fallback_limit if raw == "max" else float(raw)
+
+    def read(self) -> RLEInputs:
+        limit = self.limit()
+        current = float(self._current.read())
+        self.usage = current / limit if limit > 0 else 1.0
+        loss = self.curve(self.usage)
+        if self._events is not None:
+            events = parse_flat_keyed(self._events.read())
+            last = self._last_events
+            if last is not None:
+                if events.get("oom", 0) > last.get("oom", 0) or events.get("oom_kill", 0) > last.get("oom_kill", 0):
+                    loss = 1.0
+                elif events.get("max", 0) > last.get("max", 0):
+                    loss = max(loss, self.max_event_loss)
+            self._last_events = events
+        return limit, loss * limit, limit
+
+    def rle(self) -> float:
+        E_n, U_n, E_next = self.read()
+        return rle_n(E_next, U_n, E_n)
+
+    def close(self) -> None:
+        for f in (self._current, self._max, self._events):
+            if f is not None:
+                f.close()
+
+
+class CompositeRLESource:
+    """Worst (largest loss fraction) of several sources, normalized to E_n = 1."""
+
+    def __init__(self, *sources):
+        if not sources:
+            raise ValueError("at least one source is required")
+        self.sources = sources
+
+    def read(self) -> RLEInputs:
+        loss = 0.0
+        for src in self.sources:
+            E_n, U_n, _ = src.read()
+            loss = max(loss, U_n / E_n if E_n > 0 else 1.0)
+        return 1.0, loss, 1.0
+
+    def rle(self) -> float:
+        E_n, U_n, E_next = self.read()
+        return rle_n(E_next, U_n, E_n)
+
+    def close(self) -> None:
+        for src in self.sources:
+            src.close()
+
+
+def default_memory_rle_source(proc_root: str = "/proc", cgroup_root: str = "/sys/fs/cgroup"):
+    """Memory PSI plus the current cgroup's memory files, whichever exist; None if neither does."""
+    sources = []
+    try:
+        sources.append(PSISource("memory", proc_root=proc_root))
+    except OSError:
+        pass
+    try:
+        sources.append(CgroupMemorySource(current_cgroup_dir(cgroup_root, proc_root)))
+    except OSError:
+        pass
+    if not sources:
+        return None
+    return sources[0] if len(sources) == 1 else CompositeRLESource(*sources)
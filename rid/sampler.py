@@ -0,0 +1,177 @@
+# ==========================================
+# RID: Per-tick sensor snapshot sampler
+# One concurrent read of every telemetry source per tick, shared by all consumers
+# ==========================================
+"""
+Collects every configured source (temperature, RAM, PSI, HWiNFO row, ...) once
+per tick into an immutable SensorSnapshot:
+
+    sampler = SensorSampler(ttl=0.4)
+    sampler.add_source("temp_c",  get_cpu_temperature, timeout=0.4)
+    sampler.add_source("ram_pct", lambda: psutil.virtual_memory().percent)
+    snap = sampler.snapshot()
+    snap["temp_c"], snap["ram_pct"], snap.stale
+
+Sources run concurrently on a small thread pool, each against its own timeout.
+A source that raises or misses its deadline keeps its last good value and is
+listed in snap.stale; a source that is still running from an earlier tick is
+not started again until it returns. Within `ttl` seconds of the last sample,
+snapshot() returns the cached snapshot instead of touching the sensors.
+"""
+
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Callable, Dict, FrozenSet, Mapping, Optional
+
+
+@dataclass(frozen=True)
+class SensorSnapshot:
+    """Values of every source at one sampling instant. Read-only."""
+    t: float                                   # sampler clock at the start of sampling
+    values: Mapping[str, Any]
+    stale: FrozenSet[str] = frozenset()        # sources that fell back to last-good (or default)
+    latency: Mapping[str, float] = field(default_factory=dict)   # seconds, fresh reads only
+    seq: int = 0                               # increments on every real sample
+
+    def __getitem__(self, name: str) -> Any:
+        return self.values[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.values
+
+    def get(self, name: str, default: Any = None) -> Any:
+        return self.values.get(name, default)
+
+    def is_fresh(self, name: str) -> bool:
+        return name in self.values and name not in self.stale
+
+
+class _Source:
+    __slots__ = ("name", "fn", "timeout", "default", "value", "has_value", "pending", "errors", "timeouts")
+
+    def __init__(self, name: str, fn: Callable[[], Any], timeout: float, default: Any):
+        self.name = name
+        self.fn = fn
+        self.timeout = timeout
+        self.default = default
+        self.value = default
+        self.has_value = False
+        self.pending: Optional[Future] = None
+        self.errors = 0
+        self.timeouts = 0
+
+
+def _timed(fn: Callable[[], Any]):
+    t0 = time.perf_counter()
+    value = fn()
+    return value, time.perf_counter() - t0
+
+
+class SensorSampler:
+    """
+    ttl:          seconds a snapshot is reused (set just under the control period)
+    timeout:      default per-source deadline in seconds
+    max_workers:  pool size (default: one thread per source, capped at 8)
+    """
+
+    def __init__(
+        self,
+        ttl: float = 0.5,
+        timeout: float = 0.25,
+        max_workers: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.ttl = ttl
+        self.timeout = timeout
+        self.max_workers = max_workers
+        self.clock = clock
+        self._sources: Dict[str, _Source] = {}
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._snapshot: Optional[SensorSnapshot] = None
+        self._seq = 0
+
+    def add_source(self, name: str, fn: Callable[[], Any], timeout: Optional[float] = None,
+                   default: Any = None) -> "SensorSampler":
+        """Register a zero-argument reader. `default` is reported until a first read succeeds."""
+        with self._lock:
+            self._sources[name] = _Source(name, fn, self.timeout if timeout is None else timeout, default)
+            self._snapshot = None
+            if self._pool is not None:       # resize on next sample
+                self._pool.shutdown(wait=False)
+                self._pool = None
+        return self
+
+    def snapshot(self, max_age: Optional[float] = None) -> SensorSnapshot:
+        """Cached snapshot if younger than max_age (default ttl), else a fresh sample."""
+        limit = self.ttl if max_age is None else max_age
+        snap = self._snapshot
+        if snap is not None and self.clock() - snap.t < limit:
+            return snap
+        with self._lock:
+            snap = self._snapshot              # another consumer may have sampled meanwhile
+            if snap is not None and self.clock() - snap.t < limit:
+                return snap
+            return self._sample_locked()
+
+    def sample(self) -> SensorSnapshot:
+        """Force a fresh sample regardless of the TTL."""
+        with self._lock:
+            return self._sample_locked()
+
+    def _sample_locked(self) -> SensorSnapshot:
+        t = self.clock()
+        if self._pool is None:
+            workers = self.max_workers or max(1, min(8, len(self._sources)))
+            self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="rid-sampler")
+        started = time.perf_counter()
+        for src in self._sources.values():
+            if src.pending is None:
+                src.pending = self._pool.submit(_timed, src.fn)
+
+        values: Dict[str, Any] = {}
+        latency: Dict[str, float] = {}
+        stale = set()
+        for src in self._sources.values():
+            remaining = src.timeout - (time.perf_counter() - started)
+            fut = src.pending
+            done, _ = wait((fut,), timeout=max(0.0, remaining))
+            if done:
+                src.pending = None
+                try:
+                    src.value, latency[src.name] = fut.result()
+                    src.has_value = True
+                except Exception:
+                    src.errors += 1
+                    stale.add(src.name)
+            else:
+                src.timeouts += 1              # keep waiting on it next tick; never stack calls
+                stale.add(src.name)
+            if not src.has_value:
+                stale.add(src.name)
+            values[src.name] = src.value
+
+        self._seq += 1
+        snap = SensorSnapshot(t=t, values=MappingProxyType(values), stale=frozenset(stale),
+                              latency=MappingProxyType(latency), seq=self._seq)
+        self._snapshot = snap
+        return snap
+
+    def health(self) -> Dict[str, Dict[str, int]]:
+        """Per-source error and timeout counts."""
+        return {s.name: {"errors": s.errors, "timeouts": s.timeouts} for s in self._sources.values()}
+
+    def close(self) -> None:
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=False, cancel_futures=True)
+                self._pool = None
+
+    def __enter__(self) -> "SensorSampler":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -7,8 +7,13 @@ Operational state relative to peak potential. Healthy system: internal RLE chain
 equals Input LTP. Target System Efficiency = 1.0. Efficiency cannot exceed Input LTP.
 """
 
+import heapq
+import math
+from collections import deque
 from dataclasses import dataclass
-from typing import List, Optional, Tuple
+from typing import Dict, Hashable, List, Optional, Tuple
+
+from .triangle import stability_scalar
 
 
 @dataclass
@@ -62,3 +67,278 @@ def interface_efficiency(LTP_n: float, X: float) -> float:
     if X <= 0:
         raise ValueError("X (coupling count) must be positive")
     return max(0.0, min(1.0, LTP_n / X))
+
+
+def _log_coupling(v: float) -> float:
+    return math.log(v) if v > 0.0 else -math.inf
+
+
+class SEOLChainIndex:
+    """
+    Segment tree over a multiplicative SEOL chain (interface efficiencies or local S values).
+
+    Backs the Locate -> Identify steps of the operational protocol without rescanning:
+        update(i, value)        O(log n)  point update
+        chain_log_product()     O(1)      sum_i log value_i (never underflows)
+        chain_product()         O(1)      SEOL of the whole chain
+        first_non_unitary()     O(log n)  leftmost coupling below 1.0 (Locate)
+        worst_coupling()        O(log n)  index and value of the minimum coupling (Identify)
+
+    The product is kept as a sum of log-couplings, so a long chain of values
+    just below 1 does not underflow to 0.0. Leaves are padded with 1.0
+    (log 0.0), the unit of both the product and the min.
+    """
+
+    def __init__(self, values: List[float]):
+        n = len(values)
+        size = 1
+        while size < max(1, n):
+            size *= 2
+        self._n = n
+        self._size = size
+        self._log = [0.0] * (2 * size)
+        self._min = [1.0] * (2 * size)
+        for i, v in enumerate(values):
+            v = max(0.0, min(1.0, float(v)))
+            self._log[size + i] = _log_coupling(v)
+            self._min[size + i] = v
+        for node in range(size - 1, 0, -1):
+            self._pull(node)
+
+    def _pull(self, node: int) -> None:
+        left, right = 2 * node, 2 * node + 1
+        self._log[node] = self._log[left] + self._log[right]
+        a, b = self._min[left], self._min[right]
+        self._min[node] = a if a <= b else b
+
+    def __len__(self) -> int:
+        return self._n
+
+    def value(self, i: int) -> float:
+        """Current efficiency of coupling i."""
+        if not 0 <= i < self._n:
+            raise IndexError("coupling index out of range")
+        return self._min[self._size + i]
+
+    def update(self, i: int, value: float) -> None:
+        """Set coupling i to value (clamped to [0, 1]) and repair the path to the root."""
+        if not 0 <= i < self._n:
+            raise IndexError("coupling index out of range")
+        v = max(0.0, min(1.0, float(value)))
+        node = self._size + i
+        self._log[node] = _log_coupling(v)
+        self._min[node] = v
+        node //= 2
+        while node:
+            self._pull(node)
+            node //= 2
+
+    def chain_log_product(self) -> float:
+        """log SEOL of the full chain: sum_i log value_i (-inf if any coupling is 0)."""
+        return self._log[1]
+
+    def chain_product(self) -> float:
+        """SEOL of the full chain: prod_i value_i, as exp of the log sum."""
+        return math.exp(self._log[1])
+
+    def first_non_unitary(self, tol: float = 1e-9) -> Optional[int]:
+        """Locate: index of the leftmost coupling with value < 1 - tol, or None if the chain is unitary."""
+        limit = 1.0 - tol
+        if self._min[1] >= limit:
+            return None
+        node = 1
+        while node < self._size:
+            node = 2 * node if self._min[2 * node] < limit else 2 * node + 1
+        return node - self._size
+
+    def worst_coupling(self) -> Tuple[int, float]:
+        """Identify: (index, value) of the minimum coupling; leftmost on ties."""
+        if self._n == 0:
+            raise ValueError("empty chain")
+        node = 1
+        target = self._min[1]
+        while node < self._size:
+            node = 2 * node if self._min[2 * node] <= target else 2 * node + 1
+        return node - self._size, target
+
+
+@dataclass
+class SEOLNode:
+    """
+    One node of a coupling DAG. Inputs: local triangle (LTP, RLE, RSR), coupling count X,
+    and LTP_input (source quality; only used when the node has no upstream inputs, where
+    it scales the node's raw efficiency and sets the ceiling).
+    Propagated outputs are filled in by SEOLGraph.propagate().
+    """
+    node_id: Hashable
+    LTP: float = 1.0
+    RLE: float = 1.0
+    RSR: float = 1.0
+    X: float = 1.0
+    LTP_input: float = 1.0
+    local_efficiency: float = 1.0
+    raw_efficiency: float = 1.0
+    ceiling: float = 1.0
+    effective_efficiency: float = 1.0
+    violated: bool = False
+
+
+_SEOL_NODE_INPUTS = ("LTP", "RLE", "RSR", "X", "LTP_input")
+
+
+class SEOLGraph:
+    """
+    Incremental SEOL efficiency propagation over a coupling DAG.
+
+    Per node:
+        local     = RSR * interface_efficiency(LTP, X) * RLE
+        raw       = local * min(raw of inputs)          (LTP_input upstream of a source)
+        ceiling   = min(ceiling of inputs)              (LTP_input at a source)
+        effective = effective_system_efficiency(raw, ceiling)
+        violated  = voltage_law_violated(raw, ceiling)
+
+Because a source's raw efficiency already carries its input quality and local
+efficiency is at most 1, raw never exceeds the ceiling in a lawful graph;
+violated is the voltage-law guard and flags a node only if that breaks.
+
+    Merging inputs by min is the conservative reading of the voltage law: a shared
+    manifold is only as clean as its dirtiest source. Edges that would close a
+    cycle are rejected when added. Changes mark nodes dirty;
+    propagate() recomputes them in topological order and only continues into a
+    node's outputs when its raw efficiency or ceiling actually changed.
+    """
+
+    def __init__(self):
+        self._nodes: Dict[Hashable, SEOLNode] = {}
+        self._parents: Dict[Hashable, List[Hashable]] = {}
+        self._children: Dict[Hashable, List[Hashable]] = {}
+        self._order: Dict[Hashable, int] = {}
+        self._order_valid = True
+        self._dirty = set()
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def __contains__(self, node_id: Hashable) -> bool:
+        return node_id in self._nodes
+
+    def add_node(self, node_id: Hashable, **inputs: float) -> None:
+        """Add a node; keyword inputs are any of LTP, RLE, RSR, X, LTP_input."""
+        if node_id in self._nodes:
+            raise ValueError(f"node {node_id!r} already exists")
+        node = SEOLNode(node_id=node_id)
+        self._nodes[node_id] = node
+        self._parents[node_id] = []
+        self._children[node_id] = []
+        self._order_valid = False
+        self._set_inputs(node, inputs)
+        self._dirty.add(node_id)
+
+    def add_edge(self, src: Hashable, dst: Hashable) -> None:
+        """Couple src's output into dst. An edge that would close a cycle raises ValueError."""
+        if src not in self._nodes or dst not in self._nodes:
+            raise KeyError("both endpoints must be added before the edge")
+        if self._reaches(dst, src):
+            raise ValueError(f"edge {src!r} -> {dst!r} would close a cycle")
+        self._children[src].append(dst)
+        self._parents[dst].append(src)
+        self._order_valid = False
+        self._dirty.add(dst)
+
+    def _reaches(self, start: Hashable, target: Hashable) -> bool:
+        """True if target is start or downstream of it."""
+        if start == target:
+            return True
+        seen = {start}
+        stack = [start]
+        while stack:
+            for child in self._children[stack.pop()]:
+                if child == target:
+                    return True
+                if child not in seen:
+                    seen.add(child)
+                    stack.append(child)
+        return False
+
+    def update_node(self, node_id: Hashable, **inputs: float) -> None:
+        """Change a node's local inputs; its downstream subgraph is refreshed on propagate()."""
+        self._set_inputs(self._nodes[node_id], inputs)
+        self._dirty.add(node_id)
+
+    def _set_inputs(self, node: SEOLNode, inputs: Dict[str, float]) -> None:
+        for key, value in inputs.items():
+            if key not in _SEOL_NODE_INPUTS:
+                raise ValueError(f"unknown SEOL node input {key!r}")
+            if key == "X" and value <= 0:
+                raise ValueError("X (coupling count) must be positive")
+            setattr(node, key, float(value))
+
+    def _rebuild_order(self) -> None:
+        indegree = {nid: len(ps) for nid, ps in self._parents.items()}
+        queue = deque(nid for nid, deg in indegree.items() if deg == 0)
+        order: Dict[Hashable, int] = {}
+        while queue:
+            nid = queue.popleft()
+            order[nid] = len(order)
+            for child in self._children[nid]:
+                indegree[child] -= 1
+                if indegree[child] == 0:
+                    queue.append(child)
+        if len(order) != len(self._nodes):
+            raise ValueError("SEOL coupling graph contains a cycle")
+        self._order = order
+        self._order_valid = True
+
+    def _recompute(self, node: SEOLNode) -> bool:
+        parents = self._parents[node.node_id]
+        if parents:
+            upstream = min(self._nodes[p].raw_efficiency for p in parents)
+            ceiling = min(self._nodes[p].ceiling for p in parents)
+        else:
+            ceiling = max(0.0, min(1.0, node.LTP_input))
+            upstream = ceiling
+        node.local_efficiency = stability_scalar(node.RSR, interface_efficiency(node.LTP, node.X), node.RLE)
+        raw = upstream * node.local_efficiency
+        changed = raw != node.raw_efficiency or ceiling != node.ceiling
+        node.raw_efficiency = raw
+        node.ceiling = ceiling
+        node.effective_efficiency = effective_system_efficiency(raw, ceiling)
+        node.violated = voltage_law_violated(raw, ceiling)
+        return changed
+
+    def propagate(self) -> int:
+        """Refresh dirty nodes and whatever downstream they affect. Returns nodes recomputed."""
+        if not self._dirty:
+            return 0
+        if not self._order_valid:
+            self._rebuild_order()
+        order = self._order
+        heap = [(order[nid], nid) for nid in self._dirty]
+        heapq.heapify(heap)
+        queued = set(self._dirty)
+        self._dirty.clear()
+        count = 0
+        while heap:
+            _, nid = heapq.heappop(heap)
+            count += 1
+            if self._recompute(self._nodes[nid]):
+                for child in self._children[nid]:
+                    if child not in queued:
+                        queued.add(child)
+                        heapq.heappush(heap, (order[child], child))
+        return count
+
+    def node(self, node_id: Hashable) -> SEOLNode:
+        """Node with up-to-date propagated values."""
+        self.propagate()
+        return self._nodes[node_id]
+
+    def outputs(self) -> List[SEOLNode]:
+        """Nodes with no downstream couplings (realized work)."""
+        self.propagate()
+        return [self._nodes[nid] for nid, ch in self._children.items() if not ch]
+
+    def violations(self) -> List[Hashable]:
+        """Ids of nodes whose raw efficiency exceeds their input-LTP ceiling."""
+        self.propagate()
+        return [nid for nid, node in self._nodes.items() if node.violated]
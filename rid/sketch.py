@@ -0,0 +1,167 @@
+# ==========================================
+# RID: Sketch-based approximate discrepancy for RSR
+# Source: RLE-LTP-RSR_Stability_Equation_Canonical_Spec.pdf
+# RSR_n ≡ 1 − D(y_n, n_n), D estimated from fixed-size sketches
+# ==========================================
+"""
+Each state is sketched once (O(d)); two sketches compare in O(k) regardless of
+the state's dimension, so RSR over 100k-dimensional states costs microseconds.
+
+    sk = ProjectionSketcher(dim=100_000, k=256)
+    a, b = sk.sketch(x), sk.sketch(y)
+    rsr_n(a, b, sketch_l2_discrepancy)          # ≈ rsr_n(x, y, discrepancy_l2)
+
+Sketches and their error bounds (z = x − y, one standard deviation):
+
+    ProjectionSketcher   CountSketch projection (each coordinate hashed to one of
+                         k buckets with a random sign) plus the exact norm.
+                         ||Sz||² is unbiased for ||z||² with Var ≤ 2||z||⁴ / k, so
+                         sketch_l2_discrepancy and sketch_cosine_discrepancy have
+                         relative error ≈ sqrt(1 / 2k) and sqrt(2 / k) respectively.
+                         The error is relative to D itself, so it shrinks as the
+                         states converge (the regime RSR cares about).
+    SimHasher            `bits` sign bits of Gaussian projections of the CountSketch.
+                         Hamming / bits estimates θ / π with std ≤ 1 / (2 sqrt(bits)).
+    MinHasher            `num_perm` minimum hashes of a set (e.g. text shingles).
+                         Matching slots estimate Jaccard J with std ≤ 1 / (2 sqrt(num_perm));
+                         minhash_discrepancy = 1 − J.
+
+Sketches from different sketchers (dimension, size or seed) are not comparable;
+comparing them raises ValueError.
+"""
+
+import hashlib
+import math
+from dataclasses import dataclass
+from typing import Iterable, List, Tuple
+
+import numpy as np
+
+
+_MERSENNE_61 = (1 << 61) - 1
+
+
+@dataclass(frozen=True)
+class VectorSketch:
+    values: np.ndarray      # (k,) CountSketch of the state
+    norm: float             # exact ||x||₂
+    key: Tuple              # sketcher identity
+
+
+@dataclass(frozen=True)
+class SimHashSketch:
+    bits: int               # packed sign bits
+    n_bits: int
+    key: Tuple
+
+
+@dataclass(frozen=True)
+class MinHashSketch:
+    values: np.ndarray      # (num_perm,) uint64 minimum hashes
+    key: Tuple
+
+
+def _check(a, b) -> None:
+    if a.key != b.key:
+        raise ValueError("sketches come from different sketchers")
+
+
+class ProjectionSketcher:
+    """CountSketch random projection R^dim -> R^k."""
+
+    def __init__(self, dim: int, k: int = 256, seed: int = 0):
+        self.dim = dim
+        self.k = k
+        self.seed = seed
+        rng = np.random.default_rng(seed)
+        self._bucket = rng.integers(0, k, size=dim)
+        self._sign = rng.choice(np.array([-1.0, 1.0]), size=dim)
+        self.key = ("projection", dim, k, seed)
+
+    def project(self, x) -> np.ndarray:
+        x = np.asarray(x, dtype=np.float64).ravel()
+        if x.size != self.dim:
+            raise ValueError(f"expected a state of dimension {self.dim}, got {x.size}")
+        return np.bincount(self._bucket, weights=x * self._sign, minlength=self.k)
+
+    def sketch(self, x) -> VectorSketch:
+        x = np.asarray(x, dtype=np.float64).ravel()
+        return VectorSketch(self.project(x), float(np.sqrt(np.dot(x, x))), self.key)
+
+
+def sketch_l2_discrepancy(a: VectorSketch, b: VectorSketch) -> float:
+    """Estimate of discrepancy_l2: ||x − y|| / (||x|| + ||y||)."""
+    _check(a, b)
+    d = a.values - b.values
+    return min(1.0, math.sqrt(float(np.dot(d, d))) / (a.norm + b.norm + 2e-12))
+
+
+def sketch_cosine_discrepancy(a: VectorSketch, b: VectorSketch) -> float:
+    """Estimate of (1 − cos(x, y)) / 2 = ||x/|x| − y/|y|||² / 4, in [0, 1]."""
+    _check(a, b)
+    if a.norm == 0.0 or b.norm == 0.0:
+        return 0.0 if a.norm == b.norm else 0.5
+    d = a.values / a.norm - b.values / b.norm
+    return min(1.0, float(np.dot(d, d)) / 4.0)
+
+
+class SimHasher:
+    """Sign-bit (SimHash) sketches of the CountSketch projection; angle estimate in O(1) popcounts."""
+
+    def __init__(self, dim: int, bits: int = 256, k: int = 256, seed: int = 0):
+        self.projection = ProjectionSketcher(dim, k=k, seed=seed)
+        self.n_bits = bits
+        rng = np.random.default_rng((seed, 1))
+        self._planes = rng.standard_normal((bits, k))
+        self.key = ("simhash", dim, bits, k, seed)
+
+    def sketch(self, x) -> SimHashSketch:
+        signs = (self._planes @ self.projection.project(x)) >= 0.0
+        packed = int.from_bytes(np.packbits(signs, bitorder="little").tobytes(), "little")
+        return SimHashSketch(packed, self.n_bits, self.key)
+
+
+def simhash_discrepancy(a: SimHashSketch, b: SimHashSketch) -> float:
+    """(1 − cos θ) / 2 with θ = π · hamming / bits."""
+    _check(a, b)
+    theta = math.pi * (a.bits ^ b.bits).bit_count() / a.n_bits
+    return (1.0 - math.cos(theta)) / 2.0
+
+
+def shingles(text: str, k: int = 5, words: bool = False) -> List[str]:
+    """Character (or word) k-shingles of a text, for MinHash."""
+    units = text.split() if words else text
+    if len(units) <= k:
+        return [" ".join(units) if words else units]
+    if words:
+        return [" ".join(units[i:i + k]) for i in range(len(units) - k + 1)]
+    return [units[i:i + k] for i in range(len(units) - k + 1)]
+
+
+class MinHasher:
+    """MinHash over sets of str/bytes items with num_perm universal hash functions."""
+
+    def __init__(self, num_perm: int = 128, seed: int = 0):
+        self.num_perm = num_perm
+        self.seed = seed
+        rng = np.random.default_rng(seed)
+        # a, b < 2**32 and 32-bit item hashes keep a*h + b inside uint64
+        self._a = rng.integers(1, 1 << 32, size=num_perm, dtype=np.uint64)
+        self._b = rng.integers(0, 1 << 32, size=num_perm, dtype=np.uint64)
+        self.key = ("minhash", num_perm, seed)
+
+    def sketch(self, items: Iterable) -> MinHashSketch:
+        hashes = np.fromiter(
+            (int.from_bytes(hashlib.blake2b(i.encode() if isinstance(i, str) else bytes(i),
+                                            digest_size=4).digest(), "little") for i in set(items)),
+            dtype=np.uint64)
+        if hashes.size == 0:
+            return MinHashSketch(np.full(self.num_perm, _MERSENNE_61, dtype=np.uint64), self.key)
+        perm = (np.outer(hashes, self._a) + self._b) % np.uint64(_MERSENNE_61)
+        return MinHashSketch(perm.min(axis=0), self.key)
+
+
+def minhash_discrepancy(a: MinHashSketch, b: MinHashSketch) -> float:
+    """1 − estimated Jaccard similarity of the two sets."""
+    _check(a, b)
+    return 1.0 - float(np.count_nonzero(a.values == b.values)) / a.values.size
@@ -3,7 +3,9 @@
 # Lambda_min = T_c/T_h (Carnot); Lambda = Lambda_min + Lambda_mismatch
 # ==========================================
 
-from typing import List
+from typing import List, Tuple
+
+import numpy as np
 
 
 def lambda_min_carnot(T_c: float, T_h: float) -> float:
@@ -53,6 +55,44 @@ def coupling_amplified_loss(lambdas: List[float]) -> float:
     return min(1.0, 1.0 - p)
 
 
+def coupling_amplified_loss_matrix(lambdas) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Batched Law 3 over a (T, K) matrix of local losses (T time steps, K couplings).
+
+    Lambda_system[t] = 1 - prod_k (1 - Lambda[t, k]), evaluated in log space:
+        log R[t] = sum_k log1p(-Lambda[t, k]),  Lambda_system[t] = -expm1(log R[t]).
+    This keeps small losses from vanishing when thousands of couplings are chained.
+
+    NaN entries mark absent couplings and are skipped. Inputs are clamped to [0, 1].
+    A 1-D input is treated as a single time step.
+
+    Returns (system_loss, shares):
+        system_loss  shape (T,)   in [0, 1]
+        shares       shape (T, K) fraction of each step's log-retention lost at coupling k;
+                     rows sum to 1 when the step has any loss, 0 otherwise (NaN/absent -> 0).
+                     A coupling with Lambda = 1 takes the whole share of its step.
+    """
+    lam = np.atleast_2d(np.asarray(lambdas, dtype=float))
+    if lam.ndim != 2:
+        raise ValueError("lambdas must be a (T, K) matrix")
+    absent = np.isnan(lam)
+    lam = np.clip(np.where(absent, 0.0, lam), 0.0, 1.0)
+
+    with np.errstate(divide="ignore"):
+        log_r = np.log1p(-lam)  # -inf where Lambda = 1
+    total = log_r.sum(axis=1)
+    system_loss = -np.expm1(total)
+
+    dead = np.isneginf(log_r)
+    n_dead = dead.sum(axis=1)
+    shares = np.zeros_like(lam)
+    finite_rows = (n_dead == 0) & (total < 0.0)
+    shares[finite_rows] = log_r[finite_rows] / total[finite_rows, None]
+    dead_rows = n_dead > 0
+    shares[dead_rows] = dead[dead_rows] / n_dead[dead_rows, None]
+    return np.clip(system_loss, 0.0, 1.0), shares
+
+
 def temporal_mismatch_condition(tau_response: float, tau_control: float) -> bool:
     """
     Law 4: Control mismatch condition. Instability from lag.
@@ -0,0 +1,252 @@
+# ==========================================
+# RID: Binary trace recorder for FIDF and furnace runs
+# Fixed-width records in a memory-mapped, append-only segment file
+# ==========================================
+"""
+Replaces per-tick CSV formatting and f.flush() with fixed-width binary records.
+
+File layout (little-endian):
+    [0, 512)     header
+                 0   8s  magic b"RIDTRACE"
+                 8   u4  format version
+                 12  u4  number of sensor columns
+                 16  u4  record size in bytes
+                 24  u8  durable record count (updated at each durability point)
+                 64  ... sensor names, utf-8, comma separated, NUL padded
+    [512, ...)   records (see trace_dtype)
+
+Records are written into the mapping directly. The header count is only
+advanced at durability points (every `sync_every` records or `sync_interval`
+seconds, and on close), after the records it covers have been flushed, so a
+reader never sees a partially written record and a crash loses at most the
+last window. TraceReader exposes the columns as
+NumPy views over a read-only memmap; trace_to_csv converts for humans.
+
+    python -m rid.trace run.rtrace run.csv
+"""
+
+import csv
+import mmap
+import os
+import struct
+import time
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+TRACE_MAGIC   = b"RIDTRACE"
+TRACE_VERSION = 1
+HEADER_SIZE   = 512
+_HEADER_FMT   = "<8sIII"
+_COUNT_OFFSET = 24
+_NAMES_OFFSET = 64
+
+# Fixed action vocabulary: FIDF diagnostic actions, then furnace governor actions.
+ACTIONS: Tuple[str, ...] = (
+    "continue", "check_ltp", "mandatory_descent", "intervene_rsr", "intervene_ltp", "intervene_rle",
+    "ADD_FUEL", "SHED_LOAD", "CRITICAL_COOLING", "ADD_STRESS", "GOVERN_S_N", "CRITICAL_COLLAPSE",
+)
+ACTION_CODES: Dict[str, int] = {a: i for i, a in enumerate(ACTIONS)}
+ACTION_OTHER = 0xFFFF
+
+
+def trace_dtype(n_sensors: int) -> np.dtype:
+    """Record layout; 8-byte aligned, 64 + 8 * n_sensors bytes."""
+    return np.dtype([
+        ("t",        "<f8"),
+        ("RSR",      "<f8"),
+        ("LTP",      "<f8"),
+        ("RLE",      "<f8"),
+        ("S_n",      "<f8"),
+        ("tick",     "<i8"),
+        ("sensors",  "<f8", (n_sensors,)),
+        ("action",   "<u2"),
+        ("threads",  "<i2"),
+        ("reserved", "<u4"),
+    ])
+
+
+def action_code(action: str) -> int:
+    return ACTION_CODES.get(action, ACTION_OTHER)
+
+
+def action_name(code: int) -> str:
+    return ACTIONS[code] if code < len(ACTIONS) else "other"
+
+
+class TraceRecorder:
+    """
+    Append-only binary trace writer.
+
+    sensor_names:   names of the fixed sensor columns (e.g. ("temp_c", "ram_pct"))
+    capacity:       records preallocated per mapping; the file grows by doubling
+    sync_every:     records between durability points
+    sync_interval:  seconds between durability points
+    """
+
+    def __init__(
+        self,
+        path: str,
+        sensor_names: Sequence[str] = (),
+        capacity: int = 65536,
+        sync_every: int = 1024,
+        sync_interval: float = 1.0,
+    ):
+        self.path = str(path)
+        self.sensor_names = tuple(sensor_names)
+        self.dtype = trace_dtype(len(self.sensor_names))
+        self.sync_every = max(1, sync_every)
+        self.sync_interval = sync_interval
+        self.count = 0
+        self._synced = 0
+        self._last_sync = time.monotonic()
+        self._capacity = max(1, capacity)
+        self._n_sensors = len(self.sensor_names)
+        self._zeros = (0.0,) * self._n_sensors
+
+        names = ",".join(self.sensor_names).encode("utf-8")
+        if len(names) > HEADER_SIZE - _NAMES_OFFSET:
+            raise ValueError("sensor names do not fit in the trace header")
+        header = bytearray(HEADER_SIZE)
+        struct.pack_into(_HEADER_FMT, header, 0, TRACE_MAGIC, TRACE_VERSION,
+                         self._n_sensors, self.dtype.itemsize)
+        header[_NAMES_OFFSET:_NAMES_OFFSET + len(names)] = names
+
+        self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT | os.O_TRUNC, 0o644)
+        os.write(self._fd, bytes(header))
+        self._map(self._capacity)
+
+    def _map(self, capacity: int) -> None:
+        os.ftruncate(self._fd, HEADER_SIZE + capacity * self.dtype.itemsize)
+        self._mm = mmap.mmap(self._fd, HEADER_SIZE + capacity * self.dtype.itemsize)
+        self._rec = np.ndarray((capacity,), dtype=self.dtype, buffer=self._mm, offset=HEADER_SIZE)
+        self._capacity = capacity
+
+    def _unmap(self) -> None:
+        self._rec = None
+        self._mm.close()
+
+    def append(
+        self,
+        t: float,
+        tick: int,
+        RSR: float,
+        LTP: float,
+        RLE: float,
+        S_n: float,
+        action: str = "continue",
+        threads: int = 0,
+        sensors: Sequence[float] = (),
+    ) -> None:
+        """Write one record. Missing sensor values are stored as 0.0."""
+        if self.count == self._capacity:
+            self.sync()
+            self._unmap()
+            self._map(self._capacity * 2)
+        if len(sensors) != self._n_sensors:
+            sensors = (tuple(sensors) + self._zeros)[:self._n_sensors]
+        self._rec[self.count] = (t, RSR, LTP, RLE, S_n, tick, sensors,
+                                 ACTION_CODES.get(action, ACTION_OTHER), threads, 0)
+        self.count += 1
+        if (self.count - self._synced >= self.sync_every
+                or time.monotonic() - self._last_sync >= self.sync_interval):
+            self.sync()
+
+    def record_state(self, t: float, state, threads: int = 0, sensors: Sequence[float] = ()) -> None:
+        """Append an FIDFState."""
+        self.append(t, state.step, state.RSR_n, state.LTP_n, state.RLE_n, state.S_n,
+                    state.action, threads, sensors)
+
+    def sync(self) -> None:
+        """
+        Durability point: flush the new records, then publish their count and
+        flush the header. The header page never reaches disk ahead of the
+        records it counts.
+        """
+        if self.count > self._synced:
+            start = HEADER_SIZE + self._synced * self.dtype.itemsize
+            aligned = start - start % mmap.ALLOCATIONGRANULARITY
+            self._mm.flush(aligned, HEADER_SIZE + self.count * self.dtype.itemsize - aligned)
+        struct.pack_into("<Q", self._mm, _COUNT_OFFSET, self.count)
+        self._mm.flush(0, min(mmap.ALLOCATIONGRANULARITY, len(self._mm)))
+        self._synced = self.count
+        self._last_sync = time.monotonic()
+
+    def close(self) -> None:
+        """Final durability point; trims the file to the records written."""
+        if self._fd is None:
+            return
+        self.sync()
+        self._unmap()
+        os.ftruncate(self._fd, HEADER_SIZE + self.count * self.dtype.itemsize)
+        os.close(self._fd)
+        self._fd = None
+
+    def __enter__(self) -> "TraceRecorder":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class TraceReader:
+    """Read-only view of a trace file; columns are NumPy views over a memmap."""
+
+    def __init__(self, path: str):
+        self.path = str(path)
+        with open(self.path, "rb") as f:
+            header = f.read(HEADER_SIZE)
+        if len(header) < HEADER_SIZE or header[:8] != TRACE_MAGIC:
+            raise ValueError(f"{self.path} is not a RID trace")
+        _, version, n_sensors, rec_size = struct.unpack_from(_HEADER_FMT, header, 0)
+        if version != TRACE_VERSION:
+            raise ValueError(f"unsupported trace version {version}")
+        (count,) = struct.unpack_from("<Q", header, _COUNT_OFFSET)
+        names = header[_NAMES_OFFSET:].rstrip(b"\0").decode("utf-8")
+        self.sensor_names = tuple(names.split(",")) if names else ()
+        self.dtype = trace_dtype(n_sensors)
+        if self.dtype.itemsize != rec_size:
+            raise ValueError("record size does not match the trace header")
+        self.records = (np.memmap(self.path, dtype=self.dtype, mode="r", offset=HEADER_SIZE, shape=(count,))
+                        if count else np.zeros(0, dtype=self.dtype))
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def __getitem__(self, column: str) -> np.ndarray:
+        """Column view: t, RSR, LTP, RLE, S_n, tick, action, threads, or a sensor name."""
+        if column in self.sensor_names:
+            return self.sensor(column)
+        return self.records[column]
+
+    def sensor(self, name: str) -> np.ndarray:
+        return self.records["sensors"][:, self.sensor_names.index(name)]
+
+    def actions(self) -> list:
+        """Decoded action names."""
+        return [action_name(int(c)) for c in self.records["action"]]
+
+
+def trace_to_csv(src: str, dst: str) -> int:
+    """Convert a binary trace to CSV. Returns the number of rows written."""
+    reader = TraceReader(src)
+    rec = reader.records
+    with open(dst, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["Time", "Tick", "RSR", "LTP", "RLE", "S_n", "Threads", "Action", *reader.sensor_names])
+        sensors = rec["sensors"].tolist()
+        for i, row in enumerate(zip(rec["t"].tolist(), rec["tick"].tolist(), rec["RSR"].tolist(),
+                                    rec["LTP"].tolist(), rec["RLE"].tolist(), rec["S_n"].tolist(),
+                                    rec["threads"].tolist(), reader.actions())):
+            writer.writerow([*row, *sensors[i]])
+    return len(rec)
+
+
+if __name__ == "__main__":
+    import sys
+    if len(sys.argv) != 3:
+        print("usage: python -m rid.trace <trace.rtrace> <out.csv>")
+        sys.exit(2)
+    n = trace_to_csv(sys.argv[1], sys.argv[2])
+    print(f"wrote {n} rows to {sys.argv[2]}")
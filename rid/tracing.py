@@ -0,0 +1,120 @@
+# ==========================================
+# RID: Per-stage latency tracing for the FIDF hot path
+# ==========================================
+"""
+Optional stage timers for the RID control loop. Each stage feeds a
+LatencyHistogram (see latency.py) and can notify user tracers through
+begin/end hooks.
+
+Stages timed by run_fidf_loop:
+    sensors      get_observable / get_reconstruction / get_support_demand / get_capacity
+    layer1       layer1_rsr_ltp_rle
+    diagnostic   layer2_logic_gate (diagnostic_step)
+    on_step      the user callback
+
+Other calls (e.g. UnifiedSemanticPhysics.compute inside on_step) are timed by
+wrapping them: physics.compute = tracer.wrap("physics", physics.compute).
+
+Cost: the loop checks `tracer is not None` once per stage when tracing is off;
+when on, a stage is two perf_counter_ns() calls plus a bucket increment.
+"""
+
+import time
+from typing import Callable, Dict, List, Optional
+
+from .latency import LatencyHistogram
+
+
+FIDF_STAGES = ("sensors", "layer1", "diagnostic", "on_step")
+
+BeginHook = Callable[[str], None]
+EndHook = Callable[[str, int], None]   # (stage, elapsed_ns)
+
+_now_ns = time.perf_counter_ns
+
+
+class StageTracer:
+    """
+    Per-stage monotonic timers with log-bucketed histograms and tracer hooks.
+
+        t0 = tracer.begin("layer1")
+        ...
+        tracer.end("layer1", t0)
+
+    stats() reports count / p50 / p99 / max per stage in seconds.
+    """
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self.histograms: Dict[str, LatencyHistogram] = {}
+        self._begin_hooks: List[BeginHook] = []
+        self._end_hooks: List[EndHook] = []
+
+    def add_hook(self, on_begin: Optional[BeginHook] = None, on_end: Optional[EndHook] = None) -> None:
+        """Attach a tracer: on_begin(stage) before a stage, on_end(stage, elapsed_ns) after it."""
+        if on_begin is not None:
+            self._begin_hooks.append(on_begin)
+        if on_end is not None:
+            self._end_hooks.append(on_end)
+
+    def clear_hooks(self) -> None:
+        self._begin_hooks.clear()
+        self._end_hooks.clear()
+
+    def begin(self, stage: str) -> int:
+        """Start timing a stage; returns the start timestamp to hand to end()."""
+        if self._begin_hooks:
+            for hook in self._begin_hooks:
+                hook(stage)
+        return _now_ns()
+
+    def end(self, stage: str, t0: int) -> int:
+        """Stop timing a stage started at t0; returns elapsed nanoseconds."""
+        elapsed = _now_ns() - t0
+        hist = self.histograms.get(stage)
+        if hist is None:
+            hist = self.histograms[stage] = LatencyHistogram()
+        hist.record_ns(elapsed)
+        if self._end_hooks:
+            for hook in self._end_hooks:
+                hook(stage, elapsed)
+        return elapsed
+
+    def wrap(self, stage: str, fn: Callable) -> Callable:
+        """Return fn timed as `stage` (pass-through while the tracer is disabled)."""
+        def traced(*args, **kwargs):
+            if not self.enabled:
+                return fn(*args, **kwargs)
+            t0 = self.begin(stage)
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                self.end(stage, t0)
+        traced.__wrapped__ = fn
+        return traced
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """{stage: {count, p50, p99, max}} with latencies in seconds."""
+        return {
+            stage: {
+                "count": h.count,
+                "p50":   h.quantile(0.50),
+                "p99":   h.quantile(0.99),
+                "max":   h.max_ns / 1e9,
+            }
+            for stage, h in self.histograms.items()
+        }
+
+    def reset(self) -> None:
+        """Drop all recorded samples (hooks are kept)."""
+        self.histograms.clear()
+
+    def describe(self) -> str:
+        """Human-readable per-stage table (microseconds)."""
+        lines = [f"  {'stage':<12} {'count':>8} {'p50 us':>10} {'p99 us':>10} {'max us':>10}"]
+        for stage, d in self.stats().items():
+            lines.append(
+                f"  {stage:<12} {d['count']:>8} {d['p50'] * 1e6:>10.2f} "
+                f"{d['p99'] * 1e6:>10.2f} {d['max'] * 1e6:>10.2f}"
+            )
+        return "\n".join(lines)
@@ -0,0 +1,143 @@
+"""
+RID — Test: S_n Admission Controller
+=====================================
+The Option D gate as a reusable component: requests are admitted, queued,
+truncated or rejected so the aggregate S_n never drops below the floor and
+the physics kernel never descends; released capacity drains the queue in
+arrival order.
+
+Run: pytest tests/test_admission_controller.py -v -s
+"""
+
+import random, sys, time
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pytest
+
+from rid import ADMIT, QUEUE, REJECT, TRUNCATE, AdmissionController
+from rid.semantic_physics import UnifiedSemanticPhysics
+
+
+def _fits(gate, in_flight, tokens):
+    rle = (gate.capacity - in_flight - tokens) / gate.capacity
+    s_n = gate.ltp * gate.rsr * rle
+    state = UnifiedSemanticPhysics().compute(s_n, 0.0, gate.ltp, rle, prompt_tokens=tokens)
+    return rle > 0 and s_n >= gate.s_floor and not state.kernel_descent
+
+
+def test_idle_limit_is_the_largest_fitting_context():
+    gate = AdmissionController(capacity_tokens=8192, s_floor=0.40)
+    limit = gate.headroom
+    assert _fits(gate, 0, limit)
+    assert not _fits(gate, 0, limit + 1)
+    # the physics kernel is stricter than the bare S_n floor here
+    assert limit < 8192 * 0.6
+
+
+def test_admit_then_queue_then_drain_in_order():
+    gate = AdmissionController(capacity_tokens=8192)
+    a = gate.submit(2000)
+    b = gate.submit(2000)
+    assert (a.action, b.action) == (ADMIT, ADMIT)
+    assert b.s_n == pytest.approx(1 - 4000 / 8192)
+    c = gate.submit(2000)
+    d = gate.submit(100)                         # would fit, but must not overtake c
+    assert (c.action, d.action) == (QUEUE, QUEUE)
+    assert gate.queued == 2 and gate.in_flight_tokens == 4000
+
+    released = gate.release(a.request_id)
+    assert [(x.request_id, x.action) for x in released] == [(c.request_id, ADMIT), (d.request_id, ADMIT)]
+    assert gate.in_flight_tokens == 4100 and gate.queued == 0
+    assert gate.aggregate_s_n() >= gate.s_floor
+
+
+def test_truncate_and_reject():
+    gate = AdmissionController(capacity_tokens=8192, min_tokens=256)
+    limit = gate.headroom
+    big = gate.submit(20000)
+    assert big.action == TRUNCATE
+    assert (big.requested, big.tokens) == (20000, limit)
+    assert gate.submit(100).action == QUEUE
+    gate.release(big.request_id)
+
+    strict = AdmissionController(capacity_tokens=8192, allow_truncate=False)
+    assert strict.submit(20000).action == REJECT
+    tiny = AdmissionController(capacity_tokens=1000, min_tokens=900)
+    assert tiny.submit(5000).action == REJECT
+
+
+def test_queue_limit_and_cancel():
+    gate = AdmissionController(capacity_tokens=8192, max_queue=2)
+    held = gate.submit(4000)
+    assert held.action == ADMIT
+    q1, q2 = gate.submit(3000), gate.submit(3000)
+    assert (q1.action, q2.action) == (QUEUE, QUEUE)
+    assert gate.submit(10).action == REJECT
+    assert gate.cancel(q1.request_id) and not gate.cancel(q1.request_id)
+    assert [x.request_id for x in gate.release(held.request_id)] == [q2.request_id]
+    assert gate.counts[REJECT] == 1 and gate.counts[QUEUE] == 2
+
+
+def test_axis_update_shrinks_queue_and_releases():
+    gate = AdmissionController(capacity_tokens=8192, min_tokens=2000)
+    held = gate.submit(3000)
+    queued = gate.submit(4000)
+    assert queued.action == QUEUE
+    # LTP falls: the queued request can no longer fit even an idle backend
+    decisions = gate.update(ltp=0.5)
+    assert [(x.request_id, x.action) for x in decisions] == [(queued.request_id, REJECT)]
+    assert gate.queued == 0
+    gate.release(held.request_id)
+    assert gate.update(ltp=1.0) == []
+
+
+def test_low_ltp_admits_mid_size_requests():
+    # Below LTP = 1 the smallest contexts descend (fixed kernel cost), so the
+    # admissible sizes are an interval that does not start at 1.
+    gate = AdmissionController(capacity_tokens=8192, ltp=0.6)
+    assert not _fits(gate, 0, 1) and _fits(gate, 0, 300)
+    limit = gate.headroom
+    assert 300 < limit and _fits(gate, 0, limit) and not _fits(gate, 0, limit + 1)
+    a = gate.submit(300)
+    assert a.action == ADMIT and a.s_n >= gate.s_floor and a.realized_force > 0
+    assert gate.submit(2).action == REJECT               # too small to ever fit: must not block the queue
+    gate.release(a.request_id)
+
+    moved = AdmissionController(capacity_tokens=8192)
+    held = moved.submit(4000)
+    queued = moved.submit(4000)
+    assert queued.action == QUEUE
+    decisions = moved.update(ltp=0.6)
+    assert [(x.request_id, x.action) for x in decisions] == []
+    assert moved.queued == 1
+    assert [(x.request_id, x.action, x.tokens) for x in moved.release(held.request_id)] == [
+        (queued.request_id, TRUNCATE, limit)]
+
+
+def test_invariant_holds_under_random_load():
+    rng = random.Random(0)
+    gate = AdmissionController(capacity_tokens=16384, s_floor=0.4, max_queue=32)
+    running = []
+    for _ in range(5000):
+        if running and rng.random() < 0.45:
+            admitted = gate.release(running.pop(rng.randrange(len(running))))
+        else:
+            a = gate.submit(rng.randint(50, 12000))
+            admitted = [a] if a.action in (ADMIT, TRUNCATE) else []
+        for x in admitted:
+            assert x.s_n >= gate.s_floor and x.realized_force > 0
+            running.append(x.request_id)
+        assert gate.aggregate_s_n() >= gate.s_floor
+    assert gate.counts[ADMIT] > 0 and gate.counts[TRUNCATE] > 0 and gate.counts[QUEUE] > 0
+
+
+def test_decisions_take_microseconds():
+    gate = AdmissionController()
+    n = 20000
+    t0 = time.perf_counter()
+    for _ in range(n):
+        gate.release(gate.submit(500).request_id)
+    per = (time.perf_counter() - t0) / n
+    print(f"\n  submit + release: {per * 1e6:.2f} µs")
+    assert per < 100e-6
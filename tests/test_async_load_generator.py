@@ -0,0 +1,137 @@
+"""
+RID — Test: Async Load Generator
+=================================
+The generator must decode chunked SSE streams split at arbitrary points,
+reuse keep-alive connections, record TTFT / inter-token latency / TPS per
+request tagged with S_n, and drive closed-loop and Poisson arrivals against
+a minimal in-process streaming server.
+
+Run: pytest tests/test_async_load_generator.py -v
+"""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "HW-Info"))
+
+import asyncio
+import json
+import random
+
+import pytest
+
+from async_load_generator import (
+    LoadGenerator, SSEParser, context_s_n, delta_text, find_knee, make_prompt, summarize,
+)
+
+
+def _event(text):
+    return f"data: {json.dumps({'choices': [{'delta': {'content': text}}]})}\n\n".encode()
+
+
+async def _serve(reader, writer, tokens=4, gap=0.005, status=200):
+    """Keep-alive chat-completions server streaming `tokens` deltas as chunked SSE."""
+    while True:
+        try:
+            head = await reader.readuntil(b"\r\n\r\n")
+        except asyncio.IncompleteReadError:
+            break
+        length = 0
+        for line in head.split(b"\r\n"):
+            if line.lower().startswith(b"content-length:"):
+                length = int(line.split(b":")[1])
+        await reader.readexactly(length)
+        if status != 200:
+            body = b'{"error": "busy"}'
+            writer.write(b"HTTP/1.1 %d Busy\r\nContent-Length: %d\r\n\r\n" % (status, len(body)) + body)
+            await writer.drain()
+            continue
+        writer.write(b"HTTP/1.1 200 OK\r\nContent-Type: text/event-stream\r\nTransfer-Encoding: chunked\r\n\r\n")
+        payload = b'data: {"choices": [{"delta": {"role": "assistant"}}]}\n\n'
+        payload += b"".join(_event(f"t{i} ") for i in range(tokens)) + b"data: [DONE]\n\n"
+        # split events across chunks at awkward offsets
+        for i in range(0, len(payload), 37):
+            piece = payload[i:i + 37]
+            writer.write(b"%x\r\n" % len(piece) + piece + b"\r\n")
+            await writer.drain()
+            await asyncio.sleep(gap)
+        writer.write(b"0\r\n\r\n")
+        await writer.drain()
+    writer.close()
+
+
+async def _with_server(fn, **kwargs):
+    server = await asyncio.start_server(lambda r, w: _serve(r, w, **kwargs), "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    try:
+        async with LoadGenerator(f"http://127.0.0.1:{port}/v1/chat/completions", "stub",
+                                 pool_size=8, timeout=5.0) as gen:
+            return await fn(gen)
+    finally:
+        server.close()
+        await server.wait_closed()
+
+
+def test_sse_parser_handles_arbitrary_splits():
+    stream = b": comment\r\n" + _event("a") + b"event: x\ndata: line1\ndata: line2\n\n" + _event("b")
+    for step in (1, 3, 7, len(stream)):
+        p = SSEParser()
+        events = [e for i in range(0, len(stream), step) for e in p.feed(stream[i:i + step])]
+        assert [delta_text(e) for e in events[::2]] == ["a", "b"]
+        assert events[1] == "line1\nline2"
+    assert delta_text("not json") is None
+    assert delta_text('{"choices": []}') is None
+
+
+def test_s_n_and_prompt_length():
+    assert context_s_n(0) == 1.0
+    assert context_s_n(4096, 8192) == 0.5
+    assert context_s_n(9000, 8192) == 0.0
+    assert len(make_prompt(1000, random.Random(0))) == 4000
+
+
+def test_stream_metrics_and_keep_alive():
+    async def run(gen):
+        return await gen.run_closed_loop([1000, 2000, 3000], concurrency=1), gen.pool.opened
+
+    results, opened = asyncio.run(_with_server(run, tokens=5))
+    assert opened == 1                                      # one connection reused for every request
+    for r in results:
+        assert r.status == "OK"
+        assert r.tokens == 5 and len(r.itl) == 4
+        assert 0 < r.ttft < r.duration
+        assert r.tps > 0
+    assert [r.s_n for r in results] == [context_s_n(c) for c in (1000, 2000, 3000)]
+
+
+def test_closed_loop_bounds_connections_and_poisson_runs():
+    async def run(gen):
+        closed = await gen.run_closed_loop([1000] * 12, concurrency=4)
+        opened = gen.pool.opened
+        poisson = await gen.run_poisson([1000] * 6, rate=200.0, seed=1)
+        return closed, opened, poisson
+
+    closed, opened, poisson = asyncio.run(_with_server(run, tokens=3))
+    assert len(closed) == 12 and all(r.status == "OK" for r in closed)
+    assert opened == 4
+    assert len(poisson) == 6 and all(r.status == "OK" for r in poisson)
+    starts = [r.start for r in poisson]
+    assert starts == sorted(starts) and starts[0] > 0
+    s = summarize(closed)
+    assert s["ok"] == 12 and s["tokens_per_s"] > 0
+
+
+def test_http_errors_are_reported_and_connection_kept():
+    async def run(gen):
+        return await gen.run_closed_loop([1000, 1000], concurrency=1), gen.pool.opened
+
+    results, opened = asyncio.run(_with_server(run, status=503))
+    assert [r.status for r in results] == ["HTTP 503", "HTTP 503"]
+    assert opened == 1
+
+
+def test_find_knee():
+    levels = [(1, {"tokens_per_s": 100.0}), (2, {"tokens_per_s": 190.0}),
+              (4, {"tokens_per_s": 350.0}), (8, {"tokens_per_s": 360.0})]
+    assert find_knee(levels) == 4
+    assert find_knee(levels[:1]) == 1
+    assert find_knee([]) is None
@@ -0,0 +1,62 @@
+"""
+RID — Test: Batched Coupling-Amplified Loss (Law 3, log space)
+===============================================================
+coupling_amplified_loss_matrix must agree with the scalar Law 3 reference,
+stay resolvable where the naive product collapses, honour NaN masks for
+absent couplings, and return per-coupling shares that sum to one.
+
+Run: pytest tests/test_coupling_matrix.py -v
+"""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import numpy as np
+
+from rid import coupling_amplified_loss, coupling_amplified_loss_matrix
+
+
+def test_matches_scalar_law3():
+    rng = np.random.default_rng(26)
+    lam = rng.random((50, 12)) * 0.3
+    loss, _ = coupling_amplified_loss_matrix(lam)
+    for t in range(lam.shape[0]):
+        assert abs(loss[t] - coupling_amplified_loss(list(lam[t]))) < 1e-12
+
+
+def test_tiny_losses_do_not_vanish():
+    """10k couplings of 1e-17 each: naive 1 - prod underflows to 0, log space does not."""
+    lam = np.full((1, 10_000), 1e-17)
+    loss, _ = coupling_amplified_loss_matrix(lam)
+    assert coupling_amplified_loss(list(lam[0])) == 0.0
+    assert abs(loss[0] - 1e-13) < 1e-18
+
+
+def test_nan_mask_skips_absent_couplings():
+    lam = np.array([[0.1, np.nan, 0.1], [np.nan, np.nan, np.nan]])
+    loss, shares = coupling_amplified_loss_matrix(lam)
+    assert abs(loss[0] - 0.19) < 1e-12
+    assert loss[1] == 0.0
+    assert shares[0, 1] == 0.0
+    assert np.all(shares[1] == 0.0)
+
+
+def test_shares_sum_to_one_and_rank_losses():
+    lam = np.array([[0.01, 0.5, 0.1]])
+    _, shares = coupling_amplified_loss_matrix(lam)
+    assert abs(shares[0].sum() - 1.0) < 1e-12
+    assert int(np.argmax(shares[0])) == 1
+
+
+def test_total_loss_coupling_takes_full_share():
+    lam = np.array([[0.2, 1.0, 0.3]])
+    loss, shares = coupling_amplified_loss_matrix(lam)
+    assert loss[0] == 1.0
+    assert list(shares[0]) == [0.0, 1.0, 0.0]
+
+
+def test_one_dimensional_input_is_single_step():
+    loss, shares = coupling_amplified_loss_matrix([0.1, 0.1])
+    assert loss.shape == (1,) and shares.shape == (1, 2)
+    assert abs(loss[0] - 0.19) < 1e-12
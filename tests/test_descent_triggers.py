@@ -0,0 +1,94 @@
+"""
+RID — Test: Streaming Mandatory-Descent Trigger Detection
+==========================================================
+Feeds synthetic FIDF/telemetry streams into DescentTriggerMonitor and checks
+that each scenario raises its specific trigger and a healthy loop raises none.
+
+Run: pytest tests/test_descent_triggers.py -v
+"""
+
+import math, sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from rid import DescentTrigger, DescentTriggerMonitor
+
+
+def _run(steps):
+    mon = DescentTriggerMonitor()
+    seen = set()
+    for kw in steps:
+        seen.update(mon.observe(**kw))
+    return seen
+
+
+def test_healthy_loop_raises_nothing():
+    steps = [dict(S_n=1.0, effort=100.0, action=0.0, predicted_S=1.0,
+                  tau_response=0.2, tau_control=0.5, control_param=0.0)] * 50
+    assert _run(steps) == set()
+
+
+def test_temporal_mismatch():
+    steps = [dict(S_n=0.9, tau_response=2.0, tau_control=0.5)] * 3
+    assert DescentTrigger.TEMPORAL_MISMATCH in _run(steps)
+
+
+def test_cost_escalation_without_benefit():
+    steps = [dict(S_n=0.8, effort=50.0 * (1.05 ** i)) for i in range(30)]
+    assert DescentTrigger.COST_ESCALATION_WITHOUT_BENEFIT in _run(steps)
+
+
+def test_effort_with_benefit_is_not_escalation():
+    steps = [dict(S_n=min(1.0, 0.5 + 0.02 * i), effort=50.0 * (1.05 ** i)) for i in range(20)]
+    assert DescentTrigger.COST_ESCALATION_WITHOUT_BENEFIT not in _run(steps)
+
+
+def test_effort_step_from_zero_is_not_repeated_escalation():
+    # Furnace threads go 0 -> 1 once, then stay put.
+    mon = DescentTriggerMonitor()
+    efforts = [0.0] * 10 + [1.0] * 190
+    raised = [DescentTrigger.COST_ESCALATION_WITHOUT_BENEFIT in mon.observe(0.8, effort=e) for e in efforts]
+    assert sum(raised) <= 1
+    assert not any(raised[11:])
+
+
+def test_control_failure():
+    steps = [dict(S_n=0.7, action=2.0) for _ in range(10)]
+    assert DescentTrigger.CONTROL_FAILURE in _run(steps)
+
+
+def test_effective_control_resets_streak():
+    steps = [dict(S_n=0.5 + 0.05 * (i % 2), action=2.0) for i in range(20)]
+    assert DescentTrigger.CONTROL_FAILURE not in _run(steps)
+
+
+def test_constant_bias_is_strain_only():
+    # A fixed prediction offset is a wrong invariant, not hidden history.
+    steps = [dict(S_n=0.6, predicted_S=0.9) for _ in range(20)]
+    seen = _run(steps)
+    assert DescentTrigger.INVARIANT_STRAIN in seen
+    assert DescentTrigger.HIDDEN_COUPLING_EXPOSURE not in seen
+
+
+def test_hidden_coupling():
+    # Slowly wandering, self-correlated prediction error around a zero mean.
+    steps = [dict(S_n=0.8 + 0.1 * math.sin(0.3 * i), predicted_S=0.8) for i in range(40)]
+    assert DescentTrigger.HIDDEN_COUPLING_EXPOSURE in _run(steps)
+
+
+def test_uncorrelated_residual_is_not_coupling():
+    steps = [dict(S_n=0.8 + 0.1 * (-1) ** i, predicted_S=0.8) for i in range(40)]
+    assert DescentTrigger.HIDDEN_COUPLING_EXPOSURE not in _run(steps)
+
+
+def test_phase_transition_encounter():
+    steps = [dict(S_n=0.95, control_param=1.0), dict(S_n=0.3, control_param=1.001)]
+    assert DescentTrigger.PHASE_TRANSITION_ENCOUNTER in _run(steps)
+
+
+def test_active_reflects_last_tick():
+    mon = DescentTriggerMonitor()
+    mon.observe(0.9, tau_response=2.0, tau_control=0.5)
+    assert DescentTrigger.TEMPORAL_MISMATCH in mon.active
+    mon.observe(0.9, tau_response=0.1, tau_control=5.0)
+    assert mon.active == frozenset()
@@ -0,0 +1,105 @@
+"""
+RID — Test: Distribution Discrepancies
+=======================================
+Wasserstein (samples and histograms), Jensen–Shannon and the streaming
+histogram must match their definitions, stay in [0, 1], and work as
+DiscrepancyFuncs in rsr_n.
+
+Run: pytest tests/test_distribution_discrepancy.py -v
+"""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import numpy as np
+import pytest
+
+from rid import (
+    LatencyHistogram, StreamingHistogram, histogram_wasserstein_discrepancy, jensen_shannon, js_discrepancy,
+    rsr_n, wasserstein_discrepancy, wasserstein_hist, wasserstein_samples,
+)
+
+
+def test_samples_match_sorted_difference_definition():
+    rng = np.random.default_rng(0)
+    a, b = rng.normal(size=500), rng.normal(0.5, 1.2, size=500)
+    w1 = np.mean(np.abs(np.sort(a) - np.sort(b)))       # equal sizes: W1 = mean |a_(i) − b_(i)|
+    assert wasserstein_samples(a, b, scale=1.0) == pytest.approx(w1)
+    scale = np.mean(np.abs(np.concatenate([a, b])))
+    assert wasserstein_samples(a, b) == pytest.approx(w1 / scale)
+
+
+def test_samples_unequal_sizes_and_bounds():
+    assert wasserstein_samples([0.0], [1.0, 1.0, 1.0]) == 1.0
+    assert wasserstein_samples([0.0, 1.0], [0.0, 1.0]) == 0.0
+    assert wasserstein_samples([0.0, 0.0, 1.0, 1.0], [0.0, 1.0], scale=1.0) == pytest.approx(0.0)
+    assert wasserstein_samples([0.0, 0.0, 0.0, 1.0], [0.0, 1.0], scale=1.0) == pytest.approx(0.25)
+    assert wasserstein_samples([], []) == 0.0
+    assert wasserstein_samples([0.0, 0.0], [0.0]) == 0.0
+
+
+def test_samples_default_scale_is_relative():
+    # Disjoint but nearby samples are close, not maximally different.
+    assert wasserstein_samples([10.0, 10.01], [10.02, 10.03]) == pytest.approx(0.02 / 10.015)
+    assert wasserstein_samples([10.0, 10.01], [10.02, 10.03], scale=0.01) == 1.0
+    assert wasserstein_discrepancy(1.0, 1.0001) == pytest.approx(0.0001 / 1.00005)
+    assert wasserstein_discrepancy(1.0, 3.0) == 1.0
+
+
+def test_histogram_w1():
+    assert wasserstein_hist([1, 0, 0, 0], [0, 0, 0, 1]) == 1.0
+    assert wasserstein_hist([1, 0, 0, 0], [0, 1, 0, 0]) == pytest.approx(1 / 3)
+    assert wasserstein_hist([2, 2], [1, 1]) == 0.0
+    edges = [0.0, 1.0, 3.0]                             # centers 0.5 and 2.0
+    assert wasserstein_hist([1, 0], [0.5, 0.5], edges, scale=1.0) == pytest.approx(0.75)
+    with pytest.raises(ValueError):
+        wasserstein_hist([1, 0], [1, 0, 0])
+
+
+def test_jensen_shannon():
+    assert jensen_shannon([1, 0], [0, 1]) == pytest.approx(1.0)
+    assert jensen_shannon([0.3, 0.7], [3, 7]) == pytest.approx(0.0)
+    p, q = np.array([0.5, 0.5]), np.array([0.9, 0.1])
+    m = (p + q) / 2
+    expected = 0.5 * np.sum(p * np.log2(p / m)) + 0.5 * np.sum(q * np.log2(q / m))
+    assert jensen_shannon(p, q) == pytest.approx(expected)
+
+
+def test_streaming_histogram_tracks_samples():
+    rng = np.random.default_rng(1)
+    ref = StreamingHistogram.linear(-5, 5, bins=200)
+    live = StreamingHistogram.linear(-5, 5, bins=200)
+    a, b = rng.normal(size=20000), rng.normal(1.0, 1.0, size=20000)
+    for chunk in np.array_split(a, 50):
+        ref.add(chunk)
+    for chunk in np.array_split(b, 50):
+        live.add(chunk)
+    assert ref.total == 20000
+    # unit shift over a span of ~10 -> W1 / span ≈ 0.1
+    assert live.wasserstein(ref) == pytest.approx(wasserstein_samples(a, b, scale=10.0), abs=0.01)
+    assert 0.0 < live.jensen_shannon(ref) < 1.0
+
+
+def test_streaming_decay_forgets():
+    h = StreamingHistogram([0.0, 1.0, 2.0], decay=0.5)
+    h.add([0.5] * 8)
+    h.add([1.5] * 8)
+    assert h.counts.tolist() == [4.0, 8.0]
+    h.add([-10.0, 10.0])                                # out of range clamps to edge bins
+    assert h.counts.tolist() == [3.0, 5.0]
+    with pytest.raises(ValueError):
+        StreamingHistogram([1.0, 0.0])
+
+
+def test_discrepancy_funcs_in_rsr_n():
+    assert rsr_n([1.0, 2.0, 3.0], [1.0, 2.0, 3.0], wasserstein_discrepancy) == 1.0
+    assert rsr_n([0.2, 0.8], [0.8, 0.2], js_discrepancy) < 1.0
+    assert rsr_n([1, 0, 0], [0, 0, 1], histogram_wasserstein_discrepancy) == 0.0
+
+    fast, slow = LatencyHistogram(), LatencyHistogram()
+    for _ in range(100):
+        fast.record_ns(1_000)
+        slow.record_ns(1_000_000)
+    assert rsr_n(fast.counts, fast.counts, js_discrepancy) == 1.0
+    assert rsr_n(fast.counts, slow.counts, js_discrepancy) == pytest.approx(0.0)
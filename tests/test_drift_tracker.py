@@ -0,0 +1,121 @@
+"""
+RID — Test: Incremental RSR Drift Tracking
+===========================================
+DriftTracker must agree with discrepancy_l2 / discrepancy_l1 and the
+furnace's absolute-tolerance RSR after arbitrary sparse writes, handle
+repeated indices, bound float drift with resyncs, and keep per-write cost
+independent of the vector length.
+
+Run: pytest tests/test_drift_tracker.py -v -s
+"""
+
+import math, random, sys, time
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import numpy as np
+import pytest
+
+from rid import DriftTracker, discrepancy_l1, discrepancy_l2, rsr_n
+
+
+def test_l2_matches_discrepancy_l2():
+    rng = np.random.default_rng(0)
+    base = rng.normal(size=300)
+    tracker = DriftTracker(base)
+    working = base.copy()
+    for _ in range(50):
+        idx = rng.integers(0, 300, size=10)
+        deltas = rng.normal(size=10)
+        tracker.add(idx, deltas)
+        np.add.at(working, idx, deltas)
+    np.testing.assert_allclose(tracker.working, working)
+    expected = rsr_n(working.tolist(), base.tolist(), discrepancy_l2)
+    assert tracker.rsr() == pytest.approx(expected, rel=1e-9)
+    assert tracker.distance() == pytest.approx(np.linalg.norm(working - base))
+
+
+def test_l1_matches_discrepancy_l1():
+    rng = np.random.default_rng(1)
+    base = rng.normal(size=200)
+    tracker = DriftTracker(base, metric="l1")
+    tracker.write([3, 3, 7], [5.0, 6.0, -1.0])          # last write wins for index 3
+    working = base.copy()
+    working[3], working[7] = 6.0, -1.0
+    np.testing.assert_allclose(tracker.working, working)
+    assert tracker.discrepancy() == pytest.approx(discrepancy_l1(working.tolist(), base.tolist()))
+    assert tracker.distance() == pytest.approx(np.abs(working - base).sum())
+
+
+def test_tolerance_matches_furnace_rsr():
+    tol = 1000.0
+    base = [1.0] * 500
+    working = list(base)
+    tracker = DriftTracker(base, tolerance=tol)
+    random.seed(3)
+    for _ in range(20):
+        flips = [random.randint(0, 499) for _ in range(100)]
+        deltas = [random.uniform(-10.0, 10.0) for _ in flips]
+        tracker.add(flips, deltas)
+        for i, d in zip(flips, deltas):
+            working[i] += d
+    dist = math.sqrt(sum((w - b) ** 2 for w, b in zip(working, base)))
+    assert tracker.rsr() == pytest.approx(max(0.0, 1.0 - dist / tol), abs=1e-9)
+    tracker.reset()
+    assert tracker.rsr() == 1.0 and tracker.distance() == 0.0
+
+
+def test_resync_bounds_accumulated_error():
+    rng = np.random.default_rng(2)
+    tracker = DriftTracker(np.zeros(1000), resync_every=5000)
+    for _ in range(1000):
+        tracker.add(rng.integers(0, 1000, size=10), rng.normal(scale=1e3, size=10))
+    assert tracker.resyncs >= 2
+    assert tracker.last_resync_error < 1e-9
+    exact = float(np.sum(tracker.working ** 2))
+    assert tracker.dist_sq == pytest.approx(exact, rel=1e-9)
+
+
+def test_million_element_update_is_sparse():
+    n = 1_000_000
+    tracker = DriftTracker(np.ones(n))
+    rng = np.random.default_rng(4)
+    idx = rng.integers(0, n, size=100)
+    deltas = rng.uniform(-10, 10, size=100)
+    reps = 200
+    t = time.perf_counter()
+    for _ in range(reps):
+        tracker.add(idx, deltas)
+        tracker.rsr()
+    per_update = (time.perf_counter() - t) / reps
+    t = time.perf_counter()
+    full = np.linalg.norm(tracker.working - tracker.baseline)
+    full_cost = time.perf_counter() - t
+    print(f"\n  100-element update on 1e6 vector: {per_update * 1e6:.1f} us  (full recompute {full_cost * 1e6:.0f} us)")
+    assert tracker.distance() == pytest.approx(full, rel=1e-9)
+    assert per_update < 1e-3
+
+
+def test_negative_indices_alias_their_elements():
+    base = np.arange(10, dtype=np.float64)
+    tracker = DriftTracker(base, metric="l1")
+    tracker.add([-1, 9, -10], [1.0, 2.0, 0.5])          # -1 and 9 are the same element
+    tracker.write([4, -6], [7.0, 8.0])                   # last write wins across the alias
+    working = base.copy()
+    working[9] += 3.0
+    working[0] += 0.5
+    working[4] = 8.0
+    np.testing.assert_allclose(tracker.working, working)
+    assert tracker.distance() == pytest.approx(np.abs(working - base).sum())
+    assert tracker.resync() == pytest.approx(0.0, abs=1e-12)
+    with pytest.raises(IndexError):
+        tracker.add(-11, 1.0)
+    with pytest.raises(IndexError):
+        tracker.write([10], [1.0])
+
+
+def test_shape_and_metric_validation():
+    with pytest.raises(ValueError):
+        DriftTracker([1.0, 2.0], working=[1.0])
+    with pytest.raises(ValueError):
+        DriftTracker([1.0], metric="cosine")
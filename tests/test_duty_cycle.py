@@ -0,0 +1,112 @@
+"""
+RID — Test: Proportional Duty-Cycle Load Governor
+==================================================
+DutyCycleGovernor must map S_n to a continuous load fraction with the
+furnace policy bands; DutyCycleWorkerPool must turn that fraction into
+measured CPU time; SignalDutyCycler must alternate SIGCONT/SIGSTOP windows
+and always leave its processes running when stopped.
+
+Run: pytest tests/test_duty_cycle.py -v -s
+"""
+
+import os, signal, subprocess, sys, time
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pytest
+
+from rid import DutyCycleGovernor, DutyCycleWorkerPool, SignalDutyCycler, ThreadGovernor, TRI_AXIS_ACTIONS
+
+
+def test_policy_bands_are_continuous():
+    gov = DutyCycleGovernor(ramp=0.125)
+    assert gov.step(1.0) == ("ADD_FUEL", 0.125)
+    assert gov.step(1.0) == ("ADD_FUEL", 0.25)
+    assert gov.step(0.97) == ("SHED_LOAD", 0.97)
+    assert gov.step(0.0) == ("CRITICAL_COOLING", 0.0)
+    for _ in range(20):
+        gov.step(1.0)
+    assert gov.duty == 1.0
+
+
+def test_finer_than_thread_steps():
+    """A 3% trim moves the duty by 3%; the thread governor drops a whole worker (6.25%)."""
+    duty, threads = DutyCycleGovernor(), ThreadGovernor(max_workers=16)
+    _, d = duty.step(0.97)
+    _, n = threads.step(0.97)
+    assert 1.0 - d == pytest.approx(0.03)
+    assert 1.0 - n / 16 == pytest.approx(0.0625)
+
+
+def test_min_step_deadband_and_actions():
+    gov = DutyCycleGovernor(min_step=0.05, actions=TRI_AXIS_ACTIONS)
+    assert gov.step(0.5) == ("GOVERN_S_N", 0.5)
+    assert gov.step(0.52)[1] == 0.5          # below the deadband: unchanged
+    assert gov.step(0.6)[1] == 0.6
+    assert gov.step(-1.0) == ("CRITICAL_COLLAPSE", 0.0)
+
+
+def _cpu_seconds(pid: int) -> float:
+    with open(f"/proc/{pid}/stat") as f:
+        fields = f.read().rsplit(")", 1)[1].split()
+    return (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="reads /proc/<pid>/stat")
+def test_worker_pool_cpu_time_tracks_duty():
+    pool = DutyCycleWorkerPool(1, period=0.02)
+    pid = pool.workers[0].pid
+    try:
+        time.sleep(0.1)
+        c0 = _cpu_seconds(pid)
+        time.sleep(0.5)
+        idle = _cpu_seconds(pid) - c0
+
+        pool.set_duty(0.3)
+        c0, t0 = _cpu_seconds(pid), time.perf_counter()
+        time.sleep(1.0)
+        frac = (_cpu_seconds(pid) - c0) / (time.perf_counter() - t0)
+        print(f"\n  idle cpu: {idle:.3f}s   duty 0.30 -> measured {frac:.2f}")
+        assert idle < 0.05
+        assert 0.1 < frac < 0.6
+        assert pool.effective_workers() == pytest.approx(0.3)
+    finally:
+        pool.terminate()
+
+
+def test_signal_cycler_windows_with_fake_kill():
+    sent = []
+    cycler = SignalDutyCycler([101, 102], period=0.02, kill=lambda pid, sig: sent.append((pid, sig)))
+    cycler.set_duty(0.5)
+    cycler.start()
+    time.sleep(0.1)
+    cycler.stop()
+    sigs = [sig for _, sig in sent]
+    assert signal.SIGSTOP in sigs and signal.SIGCONT in sigs
+    assert sent[-2:] == [(101, signal.SIGCONT), (102, signal.SIGCONT)]
+
+
+def test_signal_cycler_zero_duty_holds_stopped():
+    sent = []
+    with SignalDutyCycler([7], period=0.01, kill=lambda pid, sig: sent.append(sig)) as cycler:
+        cycler.set_duty(0.0)
+        time.sleep(0.05)
+        n = len(sent)
+        time.sleep(0.05)
+        assert len(sent) == n and sent[-1] == signal.SIGSTOP   # no further signals while held
+    assert sent[-1] == signal.SIGCONT
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="reads /proc/<pid>/stat")
+def test_signal_cycler_real_child_is_resumed():
+    child = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(5)"])
+    try:
+        with SignalDutyCycler([child.pid], period=0.02) as cycler:
+            cycler.set_duty(0.5)
+            time.sleep(0.1)
+        with open(f"/proc/{child.pid}/stat") as f:
+            state = f.read().rsplit(")", 1)[1].split()[0]
+        assert state != "T"
+    finally:
+        child.kill()
+        child.wait()
@@ -0,0 +1,102 @@
+"""
+RID — Test: Batched Embedding RSR
+==================================
+EmbeddingStore.topk must match a brute-force cosine ranking across chunk and
+query-block boundaries, batch_embedding_rsr must map cosines to RSR via
+D = (1 − cos) / 2, memmapped stores must work without loading, and the
+single-query path must plug into rsr_n as a DiscrepancyFunc.
+
+Run: pytest tests/test_embedding_rsr.py -v -s
+"""
+
+import sys, time
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import numpy as np
+import pytest
+
+from rid import EmbeddingStore, batch_embedding_rsr, cosine_discrepancy, nearest_cosine_discrepancy, rsr_n
+
+
+def _brute(q, store, k):
+    qn = q / np.linalg.norm(q, axis=1, keepdims=True)
+    sn = store / np.linalg.norm(store, axis=1, keepdims=True)
+    sims = qn @ sn.T
+    order = np.argsort(-sims, axis=1)[:, :k]
+    return order, np.take_along_axis(sims, order, axis=1)
+
+
+def test_topk_matches_brute_force_across_chunks():
+    rng = np.random.default_rng(0)
+    vecs = rng.normal(size=(1000, 32))
+    q = rng.normal(size=(77, 32))
+    store = EmbeddingStore(vecs, chunk_rows=128, query_block=20)
+    idx, cos = store.topk(q, k=5)
+    bidx, bcos = _brute(q, vecs, 5)
+    np.testing.assert_array_equal(idx, bidx)
+    np.testing.assert_allclose(cos, bcos, rtol=1e-10)
+
+
+def test_rsr_from_cosine():
+    vecs = np.array([[1.0, 0.0], [0.0, 1.0]])
+    store = EmbeddingStore(vecs)
+    q = np.array([[1.0, 0.0], [-1.0, 0.0], [1.0, 1.0]])
+    rsr, idx, cos = batch_embedding_rsr(q, store, k=2)
+    np.testing.assert_allclose(rsr, [1.0, 0.5, (1 + np.sqrt(0.5)) / 2])
+    assert idx[0, 0] == 0
+    rsr_mean, _, _ = batch_embedding_rsr(q[:1], store, k=2, reduce="mean")
+    assert rsr_mean[0] == pytest.approx(1 - (1 - 0.5) / 2)
+
+
+def test_memmapped_store(tmp_path):
+    rng = np.random.default_rng(1)
+    vecs = rng.normal(size=(5000, 16)).astype(np.float32)
+    path = tmp_path / "store.f32"
+    vecs.tofile(path)
+    store = EmbeddingStore.open_memmap(str(path), dim=16, chunk_rows=1000)
+    assert isinstance(store.vectors, np.memmap) and len(store) == 5000
+    q = vecs[[10, 4000]] + 0.01
+    idx, cos = store.topk(q, k=3)
+    assert idx[:, 0].tolist() == [10, 4000]
+    assert cos.dtype == np.float32
+
+
+def test_discrepancy_funcs_plug_into_rsr_n():
+    store = EmbeddingStore(np.eye(4))
+    y = np.array([0.0, 0.0, 2.0, 0.0])
+    assert rsr_n(y, store, nearest_cosine_discrepancy) == 1.0
+    assert rsr_n([1.0, 0.0], [0.0, 1.0], cosine_discrepancy) == 0.5
+    assert cosine_discrepancy([1.0, 0.0], [1.0, 0.0, 0.0]) == 1.0
+
+
+def test_thousands_of_queries_per_call():
+    rng = np.random.default_rng(2)
+    store = EmbeddingStore(rng.normal(size=(20000, 128)).astype(np.float32))
+    q = rng.normal(size=(2000, 128)).astype(np.float32)
+    store.inv_norms()
+    t = time.perf_counter()
+    rsr, idx, _ = batch_embedding_rsr(q, store, k=10)
+    elapsed = time.perf_counter() - t
+    print(f"\n  2000 queries x 20000 x 128 store, k=10: {elapsed * 1e3:.0f} ms")
+    assert rsr.shape == (2000,) and idx.shape == (2000, 10)
+    assert np.all((rsr >= 0) & (rsr <= 1))
+
+
+def test_empty_store():
+    store = EmbeddingStore(np.empty((0, 4), dtype=np.float32))
+    idx, cos = store.topk(np.ones((3, 4)), k=5)
+    assert idx.shape == (3, 0) and cos.shape == (3, 0)
+    rsr, _, _ = batch_embedding_rsr(np.ones((3, 4)), store)
+    assert rsr.tolist() == [0.0, 0.0, 0.0]
+    assert nearest_cosine_discrepancy(np.ones(4), store) == 1.0
+
+
+def test_validation():
+    store = EmbeddingStore(np.ones((3, 4)))
+    with pytest.raises(ValueError):
+        store.topk(np.ones(5))
+    with pytest.raises(ValueError):
+        batch_embedding_rsr(np.ones(4), store, reduce="median")
+    with pytest.raises(ValueError):
+        EmbeddingStore(np.ones(4))
@@ -0,0 +1,108 @@
+"""
+RID — Test: Loop-Lag Instrumentation (Law 4 inputs)
+====================================================
+LatencyHistogram quantiles must stay within bucket resolution, LoopLagMonitor
+must turn actuation -> response timing into tau_response and feed
+temporal_mismatch_condition, and run_fidf_loop must publish the verdict.
+
+Run: pytest tests/test_loop_lag.py -v
+"""
+
+import sys, random
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from rid import LatencyHistogram, LoopLagMonitor, FIDFConfig, run_fidf_loop
+
+
+def test_histogram_quantiles_within_resolution():
+    rnd = random.Random(30)
+    samples = sorted(rnd.uniform(1e-4, 1e-1) for _ in range(5000))
+    h = LatencyHistogram()
+    for s in samples:
+        h.record(s)
+    for q in (0.5, 0.9, 0.99):
+        exact = samples[int(q * len(samples)) - 1]
+        assert abs(h.quantile(q) - exact) / exact < 0.07
+    assert h.count == 5000
+    assert abs(h.max_ns / 1e9 - samples[-1]) < 1e-9
+
+
+def test_histogram_small_values_exact():
+    h = LatencyHistogram()
+    for ns in (0, 3, 7, 15):
+        h.record_ns(ns)
+    assert h.quantile(0.25) == 0.0
+    assert h.quantile(1.0) == 15e-9
+
+
+def test_response_latency_and_mismatch():
+    mon = LoopLagMonitor(control_period=0.5, deadband=0.5)
+    t = 0.0
+    temp = 60.0
+    for cycle in range(10):
+        mon.actuate(+1, temp, now=t)
+        # Temperature reacts 2 s after the thread change; the loop ticks every 0.5 s.
+        for k in range(1, 5):
+            t += 0.5
+            if k == 4:
+                temp += 1.0
+            mon.observe(temp, now=t)
+    assert mon.response.count == 10
+    assert abs(mon.tau_response - 2.0) < 0.15
+    assert mon.temporal_mismatch() is True
+    assert mon.suggested_dt() >= 2.0 - 0.15
+
+
+def test_wrong_direction_and_timeouts():
+    mon = LoopLagMonitor(deadband=0.5, max_wait=1.0)
+    mon.actuate(-1, 80.0, now=0.0)
+    mon.observe(82.0, now=0.5)      # moved the wrong way
+    assert mon.response.count == 0
+    mon.observe(82.0, now=2.0)      # past max_wait
+    assert mon.timeouts == 1
+    assert mon.temporal_mismatch() is False
+
+
+def _fidf_with_clock(obs):
+    """run_fidf_loop against a monitor whose clock advances 20 ms per tick."""
+    now = [0.0]
+    mon = LoopLagMonitor(clock=lambda: now[0])
+
+    def rec(n):  return 0.5
+    def sd(n):   return (10.0, 10.0)
+    def cf(n):   return (1.0, 0.0, 1.0)
+    def step(n, s, d):  now[0] += 0.02
+
+    final = run_fidf_loop(FIDFConfig(dt=0.0, max_steps=40), obs, rec, sd, cf,
+                          on_step=step, lag_monitor=mon)
+    return mon, final
+
+
+def test_fidf_loop_feeds_monitor():
+    # Every intervention shows its effect on the very next tick: a healthy loop.
+    mon, final = _fidf_with_clock(lambda n: 0.2 if n % 4 == 0 else 0.5)
+    assert mon.period.count == 39
+    assert mon.sensor.count == 40
+    assert mon.response.count > 0
+    assert abs(mon.tau_response - 0.02) < 0.003
+    assert mon.tau_lag < 0.003
+    assert final.temporal_mismatch is False
+    assert "temporal mismatch: no" in mon.describe()
+
+
+def test_fidf_loop_slow_response_is_mismatch():
+    # The effect of an intervention appears four ticks later.
+    mon, final = _fidf_with_clock(lambda n: 0.2 if n % 8 < 4 else 0.5)
+    assert mon.response.count > 0
+    assert abs(mon.tau_response - 0.08) < 0.01
+    assert final.temporal_mismatch is True
+    assert "temporal mismatch: YES" in mon.describe()
+
+
+def test_unsampled_monitor_compares_raw_response():
+    mon = LoopLagMonitor(control_period=0.5, sampled=False)
+    mon.actuate(+1, 1.0, now=0.0)
+    mon.observe(2.0, now=0.6)
+    assert mon.tau_lag == mon.tau_response
+    assert mon.temporal_mismatch() is True
@@ -0,0 +1,106 @@
+"""
+RID — Test: Merkle Identity Anchor
+===================================
+MerkleTree / MerkleAnchor must keep their hashes consistent under
+incremental writes, localize drifted blocks by tree descent while visiting
+only O(k log n) nodes, report RSR by blocks or bytes, and plug into rsr_n
+as a DiscrepancyFunc.
+
+Run: pytest tests/test_merkle_anchor.py -v
+"""
+
+import os, sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import numpy as np
+import pytest
+
+from rid import MerkleAnchor, MerkleTree, merkle_discrepancy, rsr_n
+
+
+def test_incremental_matches_rebuild():
+    data = bytearray(os.urandom(10_000))
+    tree = MerkleTree(data, block_size=256)
+    tree.write(1000, b"x" * 700)                 # spans several blocks
+    tree.write(9990, b"tail")
+    data[1000:1700] = b"x" * 700
+    data[9990:9994] = b"tail"
+    assert tree.root == MerkleTree(data, block_size=256).root
+
+
+def test_drifted_blocks_and_rsr():
+    anchor = MerkleAnchor(bytes(64 * 100), block_size=64)
+    assert anchor.rsr() == 1.0 and anchor.drifted() == []
+    anchor.write(64 * 7 + 3, b"\x01")
+    anchor.write(64 * 42, b"\x02" * 65)          # blocks 42 and 43
+    assert anchor.drifted() == [7, 42, 43]
+    assert anchor.rsr() == pytest.approx(1.0 - 3 / 100)
+    anchor.write(64 * 7 + 3, b"\x00")            # reverting a write heals the block
+    assert anchor.drifted() == [42, 43]
+    anchor.restore()
+    assert anchor.rsr() == 1.0
+
+
+def test_bytes_weighting_counts_short_tail_block():
+    anchor = MerkleAnchor(bytes(250), block_size=100, by="bytes")   # blocks 100, 100, 50
+    anchor.write(240, b"\xff")
+    assert anchor.rsr() == pytest.approx(1.0 - 50 / 250)
+
+
+def test_descent_visits_log_nodes():
+    n_blocks = 1 << 14
+    a = MerkleTree(bytes(n_blocks * 16), block_size=16)
+    b = a.copy()
+    b.write(16 * 12345, b"\x01")
+    visited = []
+    nodes_a = a.nodes
+
+    class Spy(list):
+        def __getitem__(self, i):
+            visited.append(i)
+            return list.__getitem__(self, i)
+
+    a.nodes = Spy(nodes_a)
+    assert a.diff(b) == [12345]
+    assert len(visited) <= 2 * 15 + 1            # one root-to-leaf path plus siblings
+
+
+def test_reanchor_accepts_current_state():
+    anchor = MerkleAnchor(b"a" * 1024, block_size=128)
+    anchor.write(0, b"b")
+    anchor.reanchor()
+    assert anchor.rsr() == 1.0
+    anchor.write(0, b"a")
+    assert anchor.drifted() == [0]
+
+
+def test_wrapped_numpy_buffer_with_touch():
+    weights = np.zeros(4096, dtype=np.float32)
+    anchor = MerkleAnchor(weights, block_size=1024,
+                          working=MerkleTree(weights, block_size=1024, copy=False))
+    weights[300] = 1.5                            # element 300 -> byte 1200 -> block 1
+    anchor.touch(300 * 4, 4)
+    assert anchor.drifted() == [1]
+    anchor.restore()
+    assert weights[300] == 0.0 and anchor.rsr() == 1.0
+
+
+def test_discrepancy_func_plugs_into_rsr_n():
+    base = bytes(4096)
+    changed = bytearray(base)
+    changed[0] = 1
+    assert merkle_discrepancy(bytes(changed), base, block_size=1024) == 0.25
+    anchor = MerkleAnchor(base, block_size=1024)
+    anchor.write(2048, b"\x07")
+    assert rsr_n(anchor.working, anchor.anchor, merkle_discrepancy) == 0.75
+
+
+def test_length_mismatch_and_bounds():
+    a = MerkleTree(bytes(300), block_size=100)
+    b = MerkleTree(bytes(500), block_size=100)
+    assert a.diff(b) == [3, 4]
+    with pytest.raises(ValueError):
+        a.write(299, b"ab")
+    with pytest.raises(ValueError):
+        a.diff(MerkleTree(bytes(300), block_size=50))
@@ -0,0 +1,94 @@
+"""
+RID — Test: Prometheus Metrics Exporter
+========================================
+FIDFLoopMetrics must plug into run_fidf_loop as on_step, the registry must
+render valid grouped text exposition for many loops, unchanged loops must be
+served from cache, and the HTTP endpoint must serve /metrics.
+
+Run: pytest tests/test_metrics_exporter.py -v
+"""
+
+import sys, urllib.request
+from types import SimpleNamespace
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from rid import FIDFConfig, MetricsRegistry, MetricsServer, run_fidf_loop
+from rid.semantic_physics import UnifiedSemanticPhysics
+
+
+def _run(metrics, steps=20):
+    run_fidf_loop(FIDFConfig(dt=0.0, max_steps=steps),
+                  lambda n: 0.2 if n % 5 == 0 else 0.5, lambda n: 0.5,
+                  lambda n: (10.0, 10.0), lambda n: (1.0, 0.0, 1.0),
+                  on_step=metrics.observe)
+
+
+def _samples(text):
+    out = {}
+    for line in text.splitlines():
+        if line and not line.startswith("#"):
+            key, value = line.rsplit(" ", 1)
+            out[key] = float(value)
+    return out
+
+
+def test_loop_metrics_render():
+    reg = MetricsRegistry()
+    m = reg.loop("furnace", dt=0.0)
+    _run(m)
+    m.observe_physics(UnifiedSemanticPhysics().compute(0.9, 0.1, 1.0, 0.9, prompt_tokens=100))
+    m.sensor_updated()
+    s = _samples(reg.render())
+    assert s['rid_steps_total{loop="furnace"}'] == 20
+    assert s['rid_axis_min{loop="furnace",axis="RSR"}'] < 1.0
+    assert s['rid_actions_total{loop="furnace",action="continue"}'] == 16
+    assert 'rid_physics{loop="furnace",quantity="realized_force"}' in s
+    assert 'rid_sensor_staleness_seconds{loop="furnace"}' in s
+
+
+def test_special_values_use_exposition_spelling():
+    reg = MetricsRegistry()
+    m = reg.loop("odd")
+    m.observe(0, SimpleNamespace(RSR_n=1.0, LTP_n=float("inf"), RLE_n=float("-inf"),
+                                 S_n=float("nan"), action="continue"))
+    text = reg.render()
+    assert 'rid_axis{loop="odd",axis="S_n"} NaN' in text
+    assert 'rid_axis{loop="odd",axis="LTP"} +Inf' in text
+    assert 'rid_axis{loop="odd",axis="RLE"} -Inf' in text
+    assert " nan" not in text and " inf" not in text
+
+
+def test_families_grouped_across_loops():
+    reg = MetricsRegistry()
+    for name in ("a", "b", 'we"ird'):
+        _run(reg.loop(name), steps=3)
+    text = reg.render()
+    assert text.count("# TYPE rid_axis gauge") == 1
+    lines = text.splitlines()
+    start = lines.index("# TYPE rid_steps_total counter")
+    assert all(l.startswith("rid_steps_total") for l in lines[start + 1:start + 4])
+    assert 'loop="we\\"ird"' in text
+
+
+def test_unchanged_loop_served_from_cache():
+    reg = MetricsRegistry()
+    m = reg.loop("a")
+    _run(m, steps=2)
+    first = m.lines()
+    assert m.lines() is first
+    _run(m, steps=1)
+    assert m.lines() is not first
+
+
+def test_http_endpoint():
+    reg = MetricsRegistry()
+    _run(reg.loop("live"), steps=5)
+    server = MetricsServer(reg, port=0).start()
+    try:
+        with urllib.request.urlopen(server.url, timeout=5) as resp:
+            body = resp.read().decode()
+            assert resp.headers["Content-Type"].startswith("text/plain")
+        assert 'rid_steps_total{loop="live"} 5' in body
+    finally:
+        server.stop()
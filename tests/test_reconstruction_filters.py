@@ -0,0 +1,105 @@
+"""
+RID — Test: Streaming Reconstruction Filters
+=============================================
+DelayLine, EWMA, AlphaBeta and Kalman must predict each sample before
+absorbing it, agree between scalar, in-place vector and batch modes, track
+the signals they model, and feed run_fidf_loop through
+reconstruction_callbacks.
+
+Run: pytest tests/test_reconstruction_filters.py -v
+"""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import numpy as np
+import pytest
+
+from rid import (
+    AlphaBeta, DelayLine, EWMA, FIDFConfig, Kalman, reconstruction_callbacks, rsr_n, run_fidf_loop, stream_rsr,
+)
+
+FILTERS = [
+    lambda: DelayLine(3),
+    lambda: EWMA(0.3),
+    lambda: AlphaBeta(0.5, 0.1),
+    lambda: Kalman(q=1e-3, r=1e-2),
+]
+
+
+def test_delay_line_echo():
+    f = DelayLine(2)
+    assert [f.step(y) for y in [1.0, 2.0, 3.0, 4.0]] == [1.0, 1.0, 1.0, 2.0]
+    assert DelayLine(1, initial=0.0).run([5.0, 6.0]).tolist() == [0.0, 5.0]
+
+
+def test_ewma_predicts_before_update():
+    f = EWMA(0.5)
+    assert f.step(1.0) == 1.0          # no prior: reconstructed as itself
+    assert f.step(3.0) == 1.0
+    assert f.step(3.0) == 2.0
+    assert f.predict() == 2.5
+
+
+def test_alpha_beta_tracks_ramp():
+    f = AlphaBeta(0.5, 0.3)
+    ramp = np.arange(200, dtype=float)
+    recon = f.run(ramp)
+    assert abs(recon[-1] - ramp[-1]) < 1e-3
+
+
+def test_kalman_converges_to_level():
+    rng = np.random.default_rng(0)
+    ys = 0.7 + 0.05 * rng.normal(size=2000)
+    f = Kalman(q=1e-6, r=0.05 ** 2)
+    f.run(ys)
+    assert f.predict() == pytest.approx(0.7, abs=0.01)
+    assert 0.0 < f.gain < 0.1
+
+
+@pytest.mark.parametrize("make", FILTERS)
+def test_scalar_vector_and_batch_agree(make):
+    rng = np.random.default_rng(1)
+    ys = rng.random((50, 4))
+    batch = make().run(ys)
+
+    vec = make()
+    buf = np.empty(4)
+    stepped = np.array([vec.step(y, out=buf).copy() for y in ys])
+
+    per_elem = np.column_stack([make().run(ys[:, j]) for j in range(4)])
+    np.testing.assert_allclose(batch, stepped)
+    np.testing.assert_allclose(batch, per_elem)
+
+
+@pytest.mark.parametrize("make", FILTERS)
+def test_batch_then_stream_continues(make):
+    ys = np.sin(np.linspace(0, 6, 40))
+    full = make().run(ys)
+    f = make()
+    head = f.run(ys[:25])
+    tail = [f.step(y) for y in ys[25:]]
+    np.testing.assert_allclose(np.concatenate([head, tail]), full)
+
+
+def test_vector_state_is_updated_in_place():
+    f = EWMA(0.5)
+    f.step(np.zeros(3))
+    state = f.mean
+    f.step(np.ones(3))
+    assert f.mean is state and np.allclose(state, 0.5)
+
+
+def test_stream_rsr_and_fidf_callbacks():
+    ys = [0.5] * 10 + [0.9] * 10
+    rsr = stream_rsr(ys, DelayLine(1))
+    assert rsr[10] == pytest.approx(0.6) and rsr[11] == 1.0
+    assert rsr[10] == pytest.approx(rsr_n(0.9, 0.5))
+
+    get_y, get_recon = reconstruction_callbacks(DelayLine(1), lambda n: ys[n])
+    seen = []
+    run_fidf_loop(FIDFConfig(dt=0.0, max_steps=len(ys)), get_y, get_recon,
+                  lambda n: (1.0, 1.0), lambda n: (1.0, 0.0, 1.0),
+                  on_step=lambda n, s, d: seen.append(s.RSR_n))
+    np.testing.assert_allclose(seen, rsr)
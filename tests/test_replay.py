@@ -0,0 +1,79 @@
+"""
+RID — Test: Faster-than-Real-Time Replay
+=========================================
+Recorded traces (furnace CSV, HWiNFO CSV, binary trace) must load into a
+columnar ReplayTrace and drive the governors, run_fidf_loop and the physics
+engine with no sleeps; time_scale must pace frames when requested.
+
+Run: pytest tests/test_replay.py -v
+"""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import numpy as np
+
+from rid import ReplayEngine, ThreadGovernor, TraceRecorder, load_trace
+from rid.semantic_physics import UnifiedSemanticPhysics
+
+ROOT = Path(__file__).resolve().parent.parent
+FURNACE_CSV = ROOT / "Physical_Validation" / "cpu_thermal_trace.csv"
+
+
+def test_governor_reproduces_recorded_furnace_run():
+    trace = load_trace(FURNACE_CSV)
+    decisions = ReplayEngine(trace).run_governor(ThreadGovernor(max_workers=16))
+    assert [d.threads for d in decisions] == [int(x) for x in trace["Active_Threads"]]
+    assert [d.action for d in decisions] == trace.actions
+    assert decisions[1].t == 0.5
+
+
+def test_modified_governor_on_synthetic_thermal_trace(tmp_path):
+    temps = np.concatenate([np.linspace(60, 90, 50), np.linspace(90, 70, 50)])
+    path = tmp_path / "furnace.rtrace"
+    with TraceRecorder(path, sensor_names=("temp_c",)) as rec:
+        for i, temp in enumerate(temps):
+            rec.append(i * 0.5, i, 1.0, 1.0, 1.0, 1.0, sensors=(temp,))
+    trace = load_trace(path)
+    ltp = lambda n: min(1.0, max(0.0, (95.0 - trace["temp_c"][n]) / 20.0))
+    physics = UnifiedSemanticPhysics()
+    decisions = ReplayEngine(trace).run_governor(
+        ThreadGovernor(max_workers=16, ramp=4), s_n=ltp, physics=physics,
+        physics_inputs=lambda n, s: (0.1, s, 1.0, 200.0))
+    assert len(decisions) == 100
+    assert decisions[0].action == "ADD_FUEL"
+    assert min(d.threads for d in decisions[40:60]) < 16
+    assert all(d.physics is not None for d in decisions)
+
+
+def test_hwinfo_csv_and_fidf_replay(tmp_path):
+    path = tmp_path / "hwinfo.CSV"
+    lines = ['Date,Time,CPU Package [\xb0C],Memory Load [%],']
+    for i in range(120):
+        lines.append(f"25.2.2026,12:00:{i // 2:02d}.{(i % 2) * 5}00,{60 + i * 0.3:.1f},{40 + i * 0.4:.1f},")
+    lines.append(lines[0])   # HWiNFO repeats the header as a footer
+    path.write_text("\n".join(lines) + "\n", encoding="latin-1")
+    trace = load_trace(path)
+    assert len(trace) == 120
+    assert abs(trace.t[-1] - 59.5) < 1e-9
+    temp = trace["CPU Package [\xb0C]"]
+    mem = trace["Memory Load [%]"]
+    decisions = ReplayEngine(trace).run_fidf(
+        lambda n: 0.5, lambda n: 0.5,
+        lambda n: (95.0 - temp[n], 20.0),
+        lambda n: (1.0, max(0.0, mem[n] - 80.0) / 100.0, 1.0))
+    assert len(decisions) == 120
+    assert decisions[0].action == "continue"
+    assert decisions[-1].S_n < 1.0 and decisions[-1].action == "intervene_ltp"
+
+
+def test_time_scale_paces_frames():
+    trace = load_trace(FURNACE_CSV)
+    fake = {"now": 0.0, "slept": 0.0}
+    def clock():   return fake["now"]
+    def sleep(dt):
+        fake["now"] += dt
+        fake["slept"] += dt
+    ReplayEngine(trace, time_scale=10.0, sleep=sleep, clock=clock).run_governor(ThreadGovernor())
+    assert abs(fake["slept"] - (trace.t[-1] - trace.t[0]) / 10.0) < 1e-9
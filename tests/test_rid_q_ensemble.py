@@ -0,0 +1,82 @@
+"""
+RID — Test: Quantum-Pi Ensemble Engine
+=======================================
+The vectorized ensemble must reproduce the serial QuantumTriangle axes and
+lock tick, keep a correctly ordered hit ring buffer, be reproducible per
+seed, and honor per-member parameters.
+
+Run: pytest tests/test_rid_q_ensemble.py -v
+"""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "Simulations" / "RID_Q_Pi"))
+
+import numpy as np
+import pytest
+
+import rid_q_sim
+from rid_q_ensemble import axes, run_ensemble
+
+
+def _serial_lock(start=rid_q_sim.START_SIZE):
+    """Lock tick and final S_MASTER of the serial engine (sizes are deterministic)."""
+    tris = [rid_q_sim.QuantumTriangle(f"T{i}") for i in range(3)]
+    for t in tris:
+        t.size = start
+    tick = 0
+    while True:
+        s_master = np.prod([t.measure(0.0) for t in tris])
+        for t in tris:
+            t.step()
+        if all(t.check_lock()[0] for t in tris):
+            return tick, s_master
+        tick += 1
+
+
+def test_axes_match_quantum_triangle():
+    t = rid_q_sim.QuantumTriangle("T")
+    sizes = np.array([1.0, 0.7, 0.2, 0.01, 0.0])
+    rle, ltp, rsr = axes(sizes)
+    for i, size in enumerate(sizes):
+        t.size = float(size)
+        assert rle[i] == pytest.approx(t._calc_rle_q())
+        assert ltp[i] == pytest.approx(t._calc_ltp_q())
+        assert rsr[i] == pytest.approx(t._calc_rsr_q())
+
+
+def test_lock_tick_and_final_s_match_serial_engine():
+    tick, s_master = _serial_lock()
+    result = run_ensemble(64, seed=1)
+    assert result.locked.all()
+    assert np.all(result.lock_tick == tick)
+    np.testing.assert_allclose(result.final_s_master, s_master, rtol=1e-9)
+    assert result.s_master.shape == (tick + 1, 64)
+    assert result.axes.shape == (tick + 1, 64, 3, 3)
+
+
+def test_seeded_runs_are_reproducible():
+    a = run_ensemble(32, seed=7, record=False)
+    b = run_ensemble(32, seed=7, record=False)
+    c = run_ensemble(32, seed=8, record=False)
+    np.testing.assert_array_equal(a.hit_buffer, b.hit_buffer)
+    assert not np.array_equal(a.hit_buffer, c.hit_buffer)
+    assert a.s_master is None and a.axes is None
+
+
+def test_hit_buffer_is_chronological_and_bounded():
+    result = run_ensemble(16, seed=2, buffer_len=8)
+    assert result.hit_buffer.shape == (16, 8)
+    # hits shrink with the containment, so the newest hit is bounded by the last sizes
+    last_size = result.final_size.min(axis=1) + rid_q_sim.LP_NORMALIZED
+    assert np.all(np.abs(result.hit_buffer[:, -1]) <= last_size + 1e-12)
+
+
+def test_per_member_parameters_and_frozen_members():
+    starts = np.array([0.5, 1.0])
+    result = run_ensemble(2, seed=0, start_size=starts)
+    assert result.lock_tick[0] == _serial_lock(0.5)[0]
+    assert result.lock_tick[1] == _serial_lock(1.0)[0]
+    assert np.isnan(result.s_master[result.lock_tick[0] + 1:, 0]).all()
+    unlocked = run_ensemble(4, seed=0, max_ticks=10)
+    assert not unlocked.locked.any()
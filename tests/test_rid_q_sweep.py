@@ -0,0 +1,67 @@
+"""
+RID — Test: Quantum-Pi Parameter Sweep
+=======================================
+The sweep must expand the grid in product order, give results that do not
+depend on the worker count, resume by skipping finished parts, refuse to mix
+sweeps in one directory, and the serial engine must return its results.
+
+Run: pytest tests/test_rid_q_sweep.py -v
+"""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "Simulations" / "RID_Q_Pi"))
+
+import itertools
+
+import numpy as np
+import pytest
+
+import rid_q_sim
+from rid_q_sweep import PARAMS, grid_columns, load_sweep, run_sweep
+
+GRID = {"start_size": [0.5, 0.8, 1.0], "spin_spread": [0.05, 0.2], "lock_size": [0.005, 0.02]}
+
+
+def test_grid_columns_follow_product_order():
+    cols = grid_columns(GRID)
+    names = list(PARAMS)
+    expected = list(itertools.product(*[GRID.get(n, [PARAMS[n]]) for n in names]))
+    got = list(zip(*[cols[n] for n in names]))
+    assert got == expected
+    with pytest.raises(ValueError):
+        grid_columns({"not_a_knob": [1.0]})
+
+
+def test_results_independent_of_workers(tmp_path):
+    run_sweep(GRID, tmp_path / "a", replicates=3, chunk=4, workers=1, log=None)
+    run_sweep(GRID, tmp_path / "b", replicates=3, chunk=4, workers=2, log=None)
+    a, b = load_sweep(tmp_path / "a"), load_sweep(tmp_path / "b")
+    assert len(a["config"]) == 12 * 3
+    for name in a:
+        np.testing.assert_array_equal(a[name], b[name])
+    assert np.all(a["lock_tick"] >= 0)
+    # smaller starting containment locks sooner
+    by_start = {s: a["lock_tick"][a["start_size"] == s].mean() for s in GRID["start_size"]}
+    assert by_start[0.5] < by_start[0.8] < by_start[1.0]
+
+
+def test_resume_skips_finished_parts(tmp_path):
+    assert run_sweep(GRID, tmp_path, replicates=2, chunk=4, workers=1, log=None) == 3
+    first = load_sweep(tmp_path)
+    (tmp_path / "part-000001.npz").unlink()
+    assert run_sweep(GRID, tmp_path, replicates=2, chunk=4, workers=1, log=None) == 1
+    assert run_sweep(GRID, tmp_path, replicates=2, chunk=4, workers=1, log=None) == 0
+    again = load_sweep(tmp_path)
+    for name in first:
+        np.testing.assert_array_equal(first[name], again[name])
+    with pytest.raises(ValueError):
+        run_sweep(GRID, tmp_path, replicates=2, chunk=4, seed=1, workers=1, log=None)
+
+
+def test_run_simulation_returns_results_quietly(capsys):
+    result = rid_q_sim.run_simulation(start_size=0.5, seed=3, verbose=False)
+    assert capsys.readouterr().out == ""
+    assert result["lock_tick"] > 0
+    assert result["size"] < rid_q_sim.LOCK_SIZE
+    assert result == rid_q_sim.run_simulation(start_size=0.5, seed=3, verbose=False)
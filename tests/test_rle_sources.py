@@ -0,0 +1,132 @@
+"""
+RID — Test: PSI and cgroup v2 RLE Sources
+==========================================
+PSISource and CgroupMemorySource must parse fake /proc/pressure and cgroup
+files, reread them through persistent handles, map stall time and usage
+through their curves into (E_n, U_n, E_next), and react to memory.events.
+
+Run: pytest tests/test_rle_sources.py -v
+"""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pytest
+
+from rid import (
+    CgroupMemorySource,
+    CompositeRLESource,
+    PressureCurve,
+    PSISource,
+    default_memory_rle_source,
+)
+from rid.rle_sources import parse_psi
+
+
+def _psi(some_avg10=0.0, some_total=0, full_avg10=0.0, full_total=0):
+    return (f"some avg10={some_avg10:.2f} avg60=0.00 avg300=0.00 total={some_total}\n"
+            f"full avg10={full_avg10:.2f} avg60=0.00 avg300=0.00 total={full_total}\n")
+
+
+def _rewrite(path: Path, text: str) -> None:
+    with open(path, "r+") as f:        # same inode, as the kernel presents it
+        f.truncate(0)
+        f.write(text)
+
+
+def test_pressure_curve():
+    c = PressureCurve(safe=0.2, critical=0.6)
+    assert c(0.1) == 0.0 and c(0.6) == 1.0
+    assert c(0.4) == pytest.approx(0.5)
+    assert PressureCurve(0.2, 0.6, exponent=2.0)(0.4) == pytest.approx(0.25)
+    with pytest.raises(ValueError):
+        PressureCurve(0.5, 0.5)
+
+
+def test_parse_psi():
+    psi = parse_psi(_psi(some_avg10=1.5, some_total=42))
+    assert psi["some"]["avg10"] == 1.5 and psi["some"]["total"] == 42
+    assert psi["full"]["avg10"] == 0.0
+
+
+def test_psi_uses_stall_delta(tmp_path):
+    (tmp_path / "pressure").mkdir()
+    f = tmp_path / "pressure" / "memory"
+    f.write_text(_psi(some_avg10=10.0))
+    now = [0.0]
+    src = PSISource("memory", proc_root=str(tmp_path), curve=PressureCurve(0.05, 0.45),
+                    clock=lambda: now[0])
+    E_n, U_n, E_next = src.read()                       # first read: avg10 = 10%
+    assert (E_n, E_next) == (1.0, 1.0)
+    assert U_n == pytest.approx(0.125)
+
+    now[0] = 1.0                                        # 250 ms of `some` stall in 1 s
+    _rewrite(f, _psi(some_avg10=10.0, some_total=250_000))
+    assert src.stall == 0.1
+    assert src.rle() == pytest.approx(1.0 - 0.5)
+
+    now[0] = 2.0                                        # 100 ms of `full` stall, weighted x2
+    _rewrite(f, _psi(some_total=350_000, full_total=100_000))
+    src.read()
+    assert src.stall == pytest.approx(0.2)
+    src.close()
+
+
+def _cgroup(tmp_path, current, limit, events="low 0\nhigh 0\nmax 0\noom 0\noom_kill 0\n"):
+    (tmp_path / "memory.current").write_text(f"{current}\n")
+    (tmp_path / "memory.max").write_text(f"{limit}\n")
+    (tmp_path / "memory.events").write_text(events)
+
+
+def test_cgroup_usage_against_own_limit(tmp_path):
+    _cgroup(tmp_path, current=875, limit=1000)
+    src = CgroupMemorySource(str(tmp_path), curve=PressureCurve(0.80, 0.95))
+    E_n, U_n, E_next = src.read()
+    assert (E_n, E_next) == (1000.0, 1000.0)
+    assert U_n == pytest.approx(500.0)
+    assert src.rle() == pytest.approx(0.5)
+
+    _rewrite(tmp_path / "memory.current", "100\n")
+    assert src.rle() == 1.0
+    src.close()
+
+
+def test_cgroup_unlimited_uses_fallback(tmp_path):
+    _cgroup(tmp_path, current=900, limit="max")
+    src = CgroupMemorySource(str(tmp_path), fallback_limit=1000.0)
+    assert src.read()[0] == 1000.0
+    assert src.usage == pytest.approx(0.9)
+    src.close()
+
+
+def test_cgroup_events_force_loss(tmp_path):
+    _cgroup(tmp_path, current=100, limit=1000)
+    src = CgroupMemorySource(str(tmp_path), max_event_loss=0.5)
+    assert src.rle() == 1.0
+    _rewrite(tmp_path / "memory.events", "low 0\nhigh 0\nmax 3\noom 0\noom_kill 0\n")
+    assert src.rle() == pytest.approx(0.5)
+    assert src.rle() == 1.0                             # no new events
+    _rewrite(tmp_path / "memory.events", "low 0\nhigh 0\nmax 3\noom 1\noom_kill 1\n")
+    assert src.rle() == 0.0
+    src.close()
+
+
+def test_composite_takes_worst(tmp_path):
+    cg = tmp_path / "cg"
+    cg.mkdir()
+    _cgroup(cg, current=875, limit=1000)
+    (tmp_path / "pressure").mkdir()
+    (tmp_path / "pressure" / "memory").write_text(_psi(some_avg10=0.0))
+    composite = CompositeRLESource(PSISource(proc_root=str(tmp_path)), CgroupMemorySource(str(cg)))
+    assert composite.read() == (1.0, pytest.approx(0.5), 1.0)
+    composite.close()
+
+
+def test_default_source_discovery(tmp_path):
+    assert default_memory_rle_source(str(tmp_path), str(tmp_path)) is None
+    (tmp_path / "pressure").mkdir()
+    (tmp_path / "pressure" / "memory").write_text(_psi())
+    src = default_memory_rle_source(str(tmp_path), str(tmp_path))
+    assert isinstance(src, PSISource)
+    src.close()
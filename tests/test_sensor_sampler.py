@@ -0,0 +1,122 @@
+"""
+RID — Test: Per-Tick Sensor Snapshot Sampler
+=============================================
+SensorSampler must read all sources concurrently, bound each by its own
+timeout with last-good fallback, never stack calls to a hung source, and
+serve the cached snapshot to every consumer within the TTL.
+
+Run: pytest tests/test_sensor_sampler.py -v
+"""
+
+import sys, threading, time
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pytest
+
+from rid import SensorSampler, SensorSnapshot
+
+
+class Counter:
+    def __init__(self, value=1.0, delay=0.0):
+        self.calls = 0
+        self.value = value
+        self.delay = delay
+
+    def __call__(self):
+        self.calls += 1
+        if self.delay:
+            time.sleep(self.delay)
+        return self.value
+
+
+def test_snapshot_is_immutable():
+    with SensorSampler() as s:
+        s.add_source("a", Counter(3.0))
+        snap = s.sample()
+    assert isinstance(snap, SensorSnapshot)
+    assert snap["a"] == 3.0 and snap.is_fresh("a")
+    with pytest.raises(TypeError):
+        snap.values["a"] = 4.0
+    with pytest.raises(AttributeError):
+        snap.t = 0.0
+
+
+def test_sources_run_concurrently():
+    with SensorSampler(timeout=1.0) as s:
+        for name in "abcd":
+            s.add_source(name, Counter(delay=0.1))
+        t = time.perf_counter()
+        snap = s.sample()
+        elapsed = time.perf_counter() - t
+    assert not snap.stale
+    assert elapsed < 0.3
+
+
+def test_ttl_cache_shared_between_consumers():
+    now = [0.0]
+    a = Counter()
+    with SensorSampler(ttl=0.5, clock=lambda: now[0]) as s:
+        s.add_source("a", a)
+        first = s.snapshot()
+        now[0] = 0.3
+        assert s.snapshot() is first
+        assert a.calls == 1
+        now[0] = 0.6
+        second = s.snapshot()
+    assert second is not first and second.seq == first.seq + 1
+    assert a.calls == 2
+
+
+def test_concurrent_consumers_trigger_one_read():
+    a = Counter(delay=0.05)
+    with SensorSampler(ttl=10.0, timeout=1.0) as s:
+        s.add_source("a", a)
+        snaps = []
+        threads = [threading.Thread(target=lambda: snaps.append(s.snapshot())) for _ in range(8)]
+        for th in threads:
+            th.start()
+        for th in threads:
+            th.join()
+    assert a.calls == 1
+    assert all(sn is snaps[0] for sn in snaps)
+
+
+def test_timeout_falls_back_to_last_good_without_stacking():
+    slow = Counter(value=50.0)
+    with SensorSampler(timeout=0.05) as s:
+        s.add_source("slow", slow)
+        s.add_source("fast", Counter(2.0))
+        assert s.sample()["slow"] == 50.0
+
+        slow.value, slow.delay = 60.0, 0.3
+        snap = s.sample()
+        assert snap["slow"] == 50.0 and "slow" in snap.stale
+        assert snap.is_fresh("fast")
+        s.sample()                                # still in flight: not started again
+        assert slow.calls == 2
+        assert s.health()["slow"]["timeouts"] == 2
+
+        time.sleep(0.35)
+        slow.delay = 0.0
+        assert s.sample()["slow"] == 60.0         # late result is picked up
+
+
+def test_error_keeps_last_good_and_default_before_first_read():
+    state = {"fail": True}
+
+    def flaky():
+        if state["fail"]:
+            raise OSError("sensor gone")
+        return 7.0
+
+    with SensorSampler() as s:
+        s.add_source("t", flaky, default=-1.0)
+        snap = s.sample()
+        assert snap["t"] == -1.0 and "t" in snap.stale
+        state["fail"] = False
+        assert s.sample()["t"] == 7.0
+        state["fail"] = True
+        snap = s.sample()
+        assert snap["t"] == 7.0 and "t" in snap.stale
+        assert s.health()["t"]["errors"] == 2
@@ -0,0 +1,80 @@
+"""
+RID — Test: SEOL Chain Index (Locate -> Identify)
+==================================================
+The segment tree must agree with a full rescan of the multiplicative chain
+after arbitrary point updates: chain product, first non-unitary coupling,
+and worst coupling.
+
+Run: pytest tests/test_seol_chain_index.py -v
+"""
+
+import sys, random
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import math
+import pytest
+
+from rid import SEOLChainIndex
+
+
+def _rescan(values, tol=1e-9):
+    first = next((i for i, v in enumerate(values) if v < 1.0 - tol), None)
+    worst = min(range(len(values)), key=lambda i: (values[i], i))
+    return math.prod(values), first, (worst, values[worst])
+
+
+def test_unitary_chain():
+    idx = SEOLChainIndex([1.0] * 1000)
+    assert idx.chain_product() == 1.0
+    assert idx.first_non_unitary() is None
+
+
+def test_matches_rescan_under_random_updates():
+    rnd = random.Random(27)
+    values = [1.0] * 777
+    idx = SEOLChainIndex(values)
+    for _ in range(2000):
+        i = rnd.randrange(len(values))
+        v = 1.0 if rnd.random() < 0.7 else rnd.uniform(0.9, 1.0)
+        values[i] = v
+        idx.update(i, v)
+        prod, first, worst = _rescan(values)
+        assert abs(idx.chain_product() - prod) < 1e-9
+        assert idx.first_non_unitary() == first
+        assert idx.worst_coupling() == worst
+
+
+def test_locate_and_identify_differ():
+    idx = SEOLChainIndex([1.0, 0.99, 1.0, 0.5, 1.0])
+    assert idx.first_non_unitary() == 1
+    assert idx.worst_coupling() == (3, 0.5)
+    idx.update(3, 1.0)
+    idx.update(1, 1.0)
+    assert idx.first_non_unitary() is None
+
+
+def test_values_clamped_and_bounds_checked():
+    idx = SEOLChainIndex([1.5, -0.2])
+    assert idx.value(0) == 1.0 and idx.value(1) == 0.0
+    with pytest.raises(IndexError):
+        idx.update(2, 1.0)
+
+
+def test_long_lossy_chain_does_not_underflow():
+    n = 100_000
+    idx = SEOLChainIndex([0.9] * n)
+    assert idx.chain_log_product() == pytest.approx(n * math.log(0.9), rel=1e-9)
+    assert idx.chain_product() == 0.0                     # 0.9**100000 is below any float
+    assert idx.worst_coupling() == (0, 0.9)
+    idx.update(0, 0.0)
+    assert idx.chain_log_product() == -math.inf and idx.chain_product() == 0.0
+
+
+def test_large_chain():
+    idx = SEOLChainIndex([1.0] * 100_000)
+    idx.update(73_421, 0.8)
+    idx.update(99_999, 0.9)
+    assert idx.first_non_unitary() == 73_421
+    assert idx.worst_coupling() == (73_421, 0.8)
+    assert abs(idx.chain_product() - 0.72) < 1e-12
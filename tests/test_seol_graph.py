@@ -0,0 +1,118 @@
+"""
+RID — Test: SEOL Coupling DAG Propagation
+==========================================
+Effective efficiency and the voltage-law ceiling must propagate from sources
+to outputs, a lawful graph must never exceed its source ceiling, node
+changes must only touch the affected downstream subgraph, and cycle-forming
+edges must be rejected.
+
+Run: pytest tests/test_seol_graph.py -v
+"""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pytest
+
+from rid import SEOLGraph
+
+
+def _manifold():
+    """Two sources -> shared manifold (X=2) -> output."""
+    g = SEOLGraph()
+    g.add_node("src_a", LTP_input=0.9)
+    g.add_node("src_b", LTP_input=1.0, RLE=0.95)
+    g.add_node("manifold", LTP=2.0, X=2.0, RLE=0.98)
+    g.add_node("out")
+    g.add_edge("src_a", "manifold")
+    g.add_edge("src_b", "manifold")
+    g.add_edge("manifold", "out")
+    return g
+
+
+def test_ceiling_and_raw_propagate():
+    g = _manifold()
+    out = g.node("out")
+    assert out.ceiling == 0.9
+    # the dirtier source (0.9 input) bounds the manifold, not src_b's 0.95
+    assert abs(out.raw_efficiency - 0.9 * 0.98) < 1e-12
+    assert abs(out.effective_efficiency - 0.9 * 0.98) < 1e-12
+    assert abs(g.node("src_a").raw_efficiency - 0.9) < 1e-12
+    assert out.violated is False
+    assert g.violations() == []
+
+
+def test_source_quality_scales_source_efficiency():
+    g = SEOLGraph()
+    g.add_node("src", LTP_input=0.6, RLE=0.5)
+    g.add_node("out")
+    g.add_edge("src", "out")
+    assert abs(g.node("src").raw_efficiency - 0.3) < 1e-12
+    assert abs(g.node("out").effective_efficiency - 0.3) < 1e-12
+    g.update_node("src", LTP_input=1.0)
+    assert abs(g.node("out").raw_efficiency - 0.5) < 1e-12
+    assert g.violations() == []
+
+
+def test_interface_efficiency_uses_coupling_count():
+    g = _manifold()
+    g.update_node("manifold", LTP=1.0)   # LTP / X = 0.5
+    assert abs(g.node("out").raw_efficiency - 0.9 * 0.98 * 0.5) < 1e-12
+    assert g.node("out").violated is False
+
+
+def test_update_only_touches_downstream():
+    g = SEOLGraph()
+    g.add_node("root")
+    for i in range(1000):
+        g.add_node(("leaf", i))
+        g.add_edge("root", ("leaf", i))
+    g.add_node("side")
+    g.add_node("side_out")
+    g.add_edge("side", "side_out")
+    g.propagate()
+    g.update_node("side", RLE=0.5)
+    assert g.propagate() == 2
+    assert g.node("side_out").raw_efficiency == 0.5
+
+
+def test_unchanged_output_stops_propagation():
+    g = SEOLGraph()
+    g.add_node("a")
+    g.add_node("b")
+    g.add_node("c")
+    g.add_edge("a", "b")
+    g.add_edge("b", "c")
+    g.propagate()
+    g.update_node("a", X=1.0)
+    assert g.propagate() == 1
+
+
+def test_cycle_rejected():
+    g = SEOLGraph()
+    g.add_node("a")
+    g.add_node("b")
+    g.add_node("c")
+    g.add_edge("a", "b")
+    g.add_edge("b", "c")
+    with pytest.raises(ValueError):
+        g.add_edge("c", "a")
+    with pytest.raises(ValueError):
+        g.add_edge("b", "b")
+    # the rejected edge left the graph intact and usable
+    g.update_node("a", RLE=0.5)
+    assert g.node("c").raw_efficiency == 0.5
+
+
+def test_long_chain_scales():
+    g = SEOLGraph()
+    n = 20_000
+    for i in range(n):
+        g.add_node(i, RLE=1.0)
+        if i:
+            g.add_edge(i - 1, i)
+    g.propagate()
+    g.update_node(n - 10, RLE=0.5)
+    assert g.propagate() == 10
+    assert g.node(n - 1).raw_efficiency == 0.5
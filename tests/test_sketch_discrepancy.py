@@ -0,0 +1,120 @@
+"""
+RID — Test: Sketch-Based Approximate Discrepancy
+=================================================
+Projection, SimHash and MinHash sketches must estimate discrepancy_l2,
+cosine and Jaccard discrepancy within their documented error bounds, work
+as DiscrepancyFuncs in rsr_n, refuse to compare sketches from different
+sketchers, and compare in microseconds on 100k-dimensional states.
+
+Run: pytest tests/test_sketch_discrepancy.py -v -s
+"""
+
+import math, sys, time
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import numpy as np
+import pytest
+
+from rid import (
+    MinHasher, ProjectionSketcher, SimHasher, discrepancy_l2, minhash_discrepancy, rsr_n,
+    shingles, simhash_discrepancy, sketch_cosine_discrepancy, sketch_l2_discrepancy,
+)
+
+DIM = 100_000
+
+
+def _pair(noise, seed=0):
+    rng = np.random.default_rng(seed)
+    x = rng.normal(size=DIM)
+    return x, x + noise * rng.normal(size=DIM)
+
+
+def _cos_d(x, y):
+    return (1.0 - np.dot(x, y) / (np.linalg.norm(x) * np.linalg.norm(y))) / 2.0
+
+
+@pytest.mark.parametrize("noise", [0.05, 0.3, 1.0])
+def test_l2_estimate_relative_error(noise):
+    x, y = _pair(noise)
+    exact = discrepancy_l2(x, y)
+    errs = []
+    for seed in range(5):
+        sk = ProjectionSketcher(DIM, k=256, seed=seed)
+        est = sketch_l2_discrepancy(sk.sketch(x), sk.sketch(y))
+        errs.append(abs(est - exact) / exact)
+    bound = math.sqrt(1 / (2 * 256))
+    assert np.mean(errs) < 2 * bound
+
+
+def test_cosine_estimate_relative_error():
+    x, y = _pair(0.5, seed=1)
+    sk = ProjectionSketcher(DIM, k=1024)
+    est = sketch_cosine_discrepancy(sk.sketch(x), sk.sketch(y))
+    exact = _cos_d(x, y)
+    assert abs(est - exact) / exact < 3 * math.sqrt(2 / 1024)
+
+
+def test_simhash_angle_bound():
+    x, y = _pair(0.8, seed=2)
+    sh = SimHasher(DIM, bits=512)
+    est = simhash_discrepancy(sh.sketch(x), sh.sketch(y))
+    theta = math.acos(1 - 2 * _cos_d(x, y))
+    theta_std = math.pi / (2 * math.sqrt(512))
+    lo, hi = ((1 - math.cos(max(0.0, theta - 3 * theta_std))) / 2,
+              (1 - math.cos(theta + 3 * theta_std)) / 2)
+    assert lo <= est <= hi
+    assert simhash_discrepancy(sh.sketch(x), sh.sketch(x)) == 0.0
+
+
+def test_minhash_jaccard_bound():
+    a = set(range(0, 1000))
+    b = set(range(300, 1300))                  # J = 700 / 1300
+    mh = MinHasher(num_perm=256)
+    est = minhash_discrepancy(mh.sketch(map(str, a)), mh.sketch(map(str, b)))
+    assert abs(est - (1 - 700 / 1300)) < 3 / (2 * math.sqrt(256))
+
+
+def test_minhash_over_shingles():
+    mh = MinHasher()
+    doc = "the recursive state reconstruction keeps identity across transitions"
+    same = mh.sketch(shingles(doc))
+    assert minhash_discrepancy(same, mh.sketch(shingles(doc))) == 0.0
+    edited = doc.replace("identity", "entropy")
+    d = minhash_discrepancy(same, mh.sketch(shingles(edited)))
+    assert 0.0 < d < 0.5
+    assert shingles("a b c d", k=2, words=True) == ["a b", "b c", "c d"]
+
+
+def test_plugs_into_rsr_n():
+    x, y = _pair(0.1, seed=3)
+    sk = ProjectionSketcher(DIM)
+    approx = rsr_n(sk.sketch(x), sk.sketch(y), sketch_l2_discrepancy)
+    assert approx == pytest.approx(rsr_n(x, y, discrepancy_l2), abs=0.01)
+
+
+def test_incompatible_sketches_rejected():
+    x = np.ones(DIM)
+    with pytest.raises(ValueError):
+        sketch_l2_discrepancy(ProjectionSketcher(DIM, seed=0).sketch(x),
+                              ProjectionSketcher(DIM, seed=1).sketch(x))
+    with pytest.raises(ValueError):
+        ProjectionSketcher(DIM).sketch(np.ones(10))
+
+
+def test_compare_is_microseconds():
+    x, y = _pair(0.2)
+    sk, sh = ProjectionSketcher(DIM), SimHasher(DIM)
+    a, b = sk.sketch(x), sk.sketch(y)
+    ha, hb = sh.sketch(x), sh.sketch(y)
+    n = 5000
+    t = time.perf_counter()
+    for _ in range(n):
+        sketch_l2_discrepancy(a, b)
+    l2_cost = (time.perf_counter() - t) / n
+    t = time.perf_counter()
+    for _ in range(n):
+        simhash_discrepancy(ha, hb)
+    sim_cost = (time.perf_counter() - t) / n
+    print(f"\n  compare: projection {l2_cost * 1e6:.2f} us, simhash {sim_cost * 1e6:.2f} us")
+    assert l2_cost < 50e-6 and sim_cost < 20e-6
@@ -0,0 +1,128 @@
+"""
+RID — Test: Stub Inference Server
+==================================
+The local OpenAI-compatible stand-in must serve /v1/models and streaming or
+plain chat completions, refuse contexts beyond MAX_CONTEXT, and degrade TTFT
+and TPS with context, concurrency and KV spill — exercised end to end with
+the async load generator, fully offline.
+
+Run: pytest tests/test_stub_inference_server.py -v
+"""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "HW-Info"))
+
+import asyncio
+import json
+
+import pytest
+
+from async_load_generator import LoadGenerator, context_s_n
+from stub_inference_server import MAX_CONTEXT, PerformanceModel, StubInferenceServer, estimate_tokens
+
+FAST = dict(time_scale=0.05)
+
+
+def test_performance_model_shape():
+    perf = PerformanceModel()
+    assert perf.kv_capacity_tokens == pytest.approx(6144) and perf.kv_capacity_tokens < MAX_CONTEXT
+    assert perf.spill(4000) == 1.0
+    assert perf.spill(12288) == pytest.approx(1.0 + perf.spill_penalty / 2)
+    # TTFT grows faster than linearly in context; decode slows with context and concurrency
+    assert perf.ttft(8000, 8000) / perf.ttft(2000, 2000) > 4.0
+    assert perf.token_interval(6000, 1, 6000) > perf.token_interval(1000, 1, 1000)
+    assert perf.token_interval(1000, 8, 8000) > perf.token_interval(1000, 1, 1000)
+    # the cliff: the same pair of requests is much slower once their KV no longer fits
+    assert perf.token_interval(5000, 2, 10000) > 2 * perf.token_interval(3000, 2, 6000)
+    # ... and a single stream reaches it before MAX_CONTEXT
+    assert perf.token_interval(7000, 1, 7000) > 2 * perf.token_interval(6000, 1, 6000)
+
+
+def test_estimate_tokens():
+    assert estimate_tokens([{"role": "user", "content": "x" * 400}, {"role": "system", "content": None}]) == 100
+
+
+async def _raw(port, method, path, body=None):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    data = json.dumps(body).encode() if body is not None else b""
+    writer.write(f"{method} {path} HTTP/1.1\r\nHost: x\r\nContent-Length: {len(data)}\r\n"
+                 f"Connection: close\r\n\r\n".encode() + data)
+    await writer.drain()
+    raw = await reader.read()
+    writer.close()
+    head, _, payload = raw.partition(b"\r\n\r\n")
+    return int(head.split()[1]), payload
+
+
+def test_models_plain_completion_and_refusal():
+    async def run():
+        async with StubInferenceServer(PerformanceModel(**FAST)) as srv:
+            models = await _raw(srv.port, "GET", "/v1/models")
+            plain = await _raw(srv.port, "POST", "/v1/chat/completions", {
+                "messages": [{"role": "user", "content": "hello " * 100}], "max_tokens": 3})
+            too_long = await _raw(srv.port, "POST", "/v1/chat/completions", {
+                "messages": [{"role": "user", "content": "x" * 4 * (MAX_CONTEXT + 10)}]})
+            missing = await _raw(srv.port, "GET", "/nope")
+            async with LoadGenerator(srv.url) as gen:
+                detected = await gen.detect_model()
+            return models, plain, too_long, missing, detected, srv
+
+    models, plain, too_long, missing, detected, srv = asyncio.run(run())
+    assert models[0] == 200 and json.loads(models[1])["data"][0]["id"] == srv.model_id
+    assert detected == srv.model_id
+    assert plain[0] == 200
+    body = json.loads(plain[1])
+    assert body["choices"][0]["message"]["content"] == "tok0 tok1 tok2 "
+    assert body["usage"]["prompt_tokens"] == 150
+    assert too_long[0] == 400 and srv.rejected == 1
+    assert missing[0] == 404
+
+
+def test_load_generator_sees_context_degradation():
+    async def run():
+        async with StubInferenceServer(PerformanceModel(**FAST)) as srv:
+            async with LoadGenerator(srv.url, "stub", max_tokens=6, timeout=10.0) as gen:
+                results = await gen.run_closed_loop([500, 4000, 8000, 9000], concurrency=1)
+                return results, gen.pool.opened
+
+    results, opened = asyncio.run(run())
+    small, mid, large, over = results
+    assert opened == 1
+    assert [r.status for r in results] == ["OK", "OK", "OK", "HTTP 400"]
+    assert small.tokens == 6
+    assert small.ttft < mid.ttft < large.ttft
+    assert small.tps > large.tps
+    assert small.s_n > mid.s_n > large.s_n == pytest.approx(context_s_n(8000))
+
+
+def test_concurrency_moves_the_cliff():
+    async def run(concurrency):
+        async with StubInferenceServer(PerformanceModel(**FAST)) as srv:
+            async with LoadGenerator(srv.url, "stub", max_tokens=6, timeout=10.0) as gen:
+                results = await gen.run_closed_loop([3000] * concurrency, concurrency=concurrency)
+                return results, srv.peak_active
+
+    alone, _ = asyncio.run(run(1))
+    crowded, peak = asyncio.run(run(4))
+    assert peak == 4
+    assert all(r.status == "OK" for r in crowded)
+    # 4 × 3000 tokens of KV overflow the 6144-token budget: every stream slows well beyond batching cost
+    batching_only = 4 ** PerformanceModel().batch_exponent
+    assert min(r.tps for r in crowded) < alone[0].tps / batching_only
+
+
+def test_single_stream_hits_the_cliff():
+    async def run():
+        # slower decode clock so event-loop overhead does not mask the per-token cost
+        perf = PerformanceModel(time_scale=0.2, prefill_tps=400000.0)
+        async with StubInferenceServer(perf) as srv:
+            async with LoadGenerator(srv.url, "stub", max_tokens=6, timeout=10.0) as gen:
+                return await gen.run_closed_loop([5500, 6000, 7000, 8000], concurrency=1)
+
+    below, edge, over, far = asyncio.run(run())
+    assert all(r.status == "OK" for r in (below, edge, over, far))
+    # within the KV budget decode barely moves; one stream past it loses more than half its TPS
+    assert edge.tps > 0.8 * below.tps
+    assert over.tps < edge.tps / 2
+    assert far.tps < over.tps
@@ -0,0 +1,105 @@
+"""
+RID — Test: sysfs/hwmon CPU Temperature Backend
+================================================
+SysfsThermalBackend must pick the package sensor from a fake /sys tree
+(hwmon label, then CPU hwmon driver, then thermal_zone type), keep the file
+open and reread it with pread, and make get_cpu_temperature use the
+installed backend.
+
+Run: pytest tests/test_sysfs_sensors.py -v -s
+"""
+
+import sys, time
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "Physical_Validation"))
+
+import cpu_sensors
+from cpu_sensors import SysfsThermalBackend, get_cpu_temperature, set_temperature_backend
+
+
+def _write(path: Path, text: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text + "\n")
+
+
+def _hwmon_tree(root: Path) -> Path:
+    _write(root / "class/hwmon/hwmon0/name", "acpitz")
+    _write(root / "class/hwmon/hwmon0/temp1_input", "27800")
+    _write(root / "class/hwmon/hwmon1/name", "coretemp")
+    _write(root / "class/hwmon/hwmon1/temp1_label", "Core 0")
+    _write(root / "class/hwmon/hwmon1/temp1_input", "50000")
+    _write(root / "class/hwmon/hwmon1/temp2_label", "Package id 0")
+    _write(root / "class/hwmon/hwmon1/temp2_input", "54000")
+    return root / "class/hwmon/hwmon1/temp2_input"
+
+
+def test_picks_package_label(tmp_path):
+    pkg = _hwmon_tree(tmp_path)
+    backend = SysfsThermalBackend(root=str(tmp_path))
+    assert backend.available
+    assert backend.path == str(pkg)
+    assert backend.read() == 54.0
+    backend.close()
+
+
+def test_reread_sees_new_value_through_open_handle(tmp_path):
+    pkg = _hwmon_tree(tmp_path)
+    backend = SysfsThermalBackend(root=str(tmp_path))
+    with open(pkg, "r+") as f:           # rewrite in place, like the kernel does
+        f.write("71500\n")
+    assert backend.read() == 71.5
+    backend.close()
+    assert backend.read() == -1.0
+
+
+def test_driver_fallback_without_labels(tmp_path):
+    _write(tmp_path / "class/hwmon/hwmon0/name", "nvme")
+    _write(tmp_path / "class/hwmon/hwmon0/temp1_input", "40000")
+    _write(tmp_path / "class/hwmon/hwmon1/name", "k10temp")
+    _write(tmp_path / "class/hwmon/hwmon1/temp1_input", "61250")
+    backend = SysfsThermalBackend(root=str(tmp_path))
+    assert backend.read() == 61.25
+    backend.close()
+
+
+def test_thermal_zone_fallback(tmp_path):
+    _write(tmp_path / "class/thermal/thermal_zone0/type", "acpitz")
+    _write(tmp_path / "class/thermal/thermal_zone0/temp", "30000")
+    _write(tmp_path / "class/thermal/thermal_zone1/type", "x86_pkg_temp")
+    _write(tmp_path / "class/thermal/thermal_zone1/temp", "48000")
+    backend = SysfsThermalBackend(root=str(tmp_path))
+    assert backend.path.endswith("thermal_zone1/temp")
+    assert backend.read() == 48.0
+    backend.close()
+
+
+def test_empty_tree_is_unavailable(tmp_path):
+    backend = SysfsThermalBackend(root=str(tmp_path))
+    assert not backend.available
+    assert backend.read() == -1.0
+
+
+def test_get_cpu_temperature_uses_installed_backend(tmp_path):
+    _hwmon_tree(tmp_path)
+    backend = SysfsThermalBackend(root=str(tmp_path))
+    set_temperature_backend(backend)
+    try:
+        assert get_cpu_temperature() == 54.0
+        assert cpu_sensors.get_temperature_backend() is backend
+    finally:
+        set_temperature_backend(None)
+        backend.close()
+
+
+def test_read_is_microsecond_scale(tmp_path):
+    _hwmon_tree(tmp_path)
+    backend = SysfsThermalBackend(root=str(tmp_path))
+    n = 20_000
+    t = time.perf_counter()
+    for _ in range(n):
+        backend.read()
+    per_read = (time.perf_counter() - t) / n
+    backend.close()
+    print(f"\n  sysfs read: {per_read * 1e6:.2f} us")
+    assert per_read < 50e-6
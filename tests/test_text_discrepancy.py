@@ -0,0 +1,119 @@
+"""
+RID — Test: Text Discrepancy
+=============================
+The bit-parallel Levenshtein must agree with the textbook DP, its early exit
+must only fire when the true distance exceeds the cutoff, and the normalized
+form must work as a DiscrepancyFunc at character and token level.
+
+Run: pytest tests/test_text_discrepancy.py -v
+"""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import random
+
+import numpy as np
+import pytest
+
+from rid import (
+    TextDiscrepancy, batch_edit_discrepancy, edit_discrepancy, levenshtein, rsr_n,
+)
+
+
+def _dp(a, b):
+    prev = list(range(len(b) + 1))
+    for i, x in enumerate(a, 1):
+        cur = [i]
+        for j, y in enumerate(b, 1):
+            cur.append(min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + (x != y)))
+        prev = cur
+    return prev[-1]
+
+
+def _random_pairs(count, seed=0):
+    rng = random.Random(seed)
+    for _ in range(count):
+        a = "".join(rng.choice("abcd") for _ in range(rng.randint(0, 90)))
+        b = list(a)
+        for _ in range(rng.randint(0, 20)):
+            op = rng.randrange(3)
+            pos = rng.randint(0, len(b))
+            if op == 0:
+                b.insert(pos, rng.choice("abcde"))
+            elif b and pos < len(b):
+                if op == 1:
+                    del b[pos]
+                else:
+                    b[pos] = rng.choice("abcde")
+        yield a, "".join(b)
+
+
+def test_matches_dynamic_programming():
+    for a, b in _random_pairs(300):
+        assert levenshtein(a, b) == _dp(a, b), (a, b)
+
+
+def test_known_distances_and_symmetry():
+    assert levenshtein("kitten", "sitting") == 3
+    assert levenshtein("", "abc") == 3
+    assert levenshtein("same", "same") == 0
+    assert levenshtein("flaw", "lawn") == levenshtein("lawn", "flaw") == 2
+
+
+def test_long_pattern_spans_many_words():
+    rng = random.Random(1)
+    a = "".join(rng.choice("acgt") for _ in range(300))
+    b = a[:100] + "x" + a[101:250] + a[260:]
+    assert levenshtein(a, b) == _dp(a, b)
+
+
+def test_cutoff_is_exact_below_and_flags_above():
+    for a, b in _random_pairs(300, seed=2):
+        true = _dp(a, b)
+        for k in (0, 2, 5, 10):
+            got = levenshtein(a, b, max_dist=k)
+            assert got == (true if true <= k else k + 1), (a, b, k)
+
+
+def test_token_level_counts_words():
+    y = "the quick brown fox jumps"
+    n = "the quick red fox jumps"
+    assert edit_discrepancy(y, n, level="token") == pytest.approx(1 / 5)
+    assert edit_discrepancy(y.split(), n.split()) == pytest.approx(1 / 5)   # token lists pass through
+
+
+def test_discrepancy_range_and_rsr():
+    assert edit_discrepancy("", "") == 0.0
+    assert edit_discrepancy("abc", "xyz") == 1.0
+    assert rsr_n("kitten", "sitting", edit_discrepancy) == pytest.approx(1 - 3 / 7)
+
+
+def test_threshold_result_stays_above_rsr_trip_point():
+    D = TextDiscrepancy(rsr_threshold=0.9)
+    close = "a" * 100
+    assert D(close, close[:95] + "bbbbb") == pytest.approx(0.05)     # exact below the cutoff
+    far = D(close, "b" * 100)
+    assert 0.1 < far <= 1.0
+    assert rsr_n(close, "b" * 100, D) < 0.9
+    with pytest.raises(ValueError):
+        TextDiscrepancy(level="byte")
+
+
+def test_batch_matches_single_calls():
+    pairs = list(_random_pairs(40, seed=3))
+    exact = np.array([edit_discrepancy(a, b) for a, b in pairs])
+    np.testing.assert_allclose(batch_edit_discrepancy(pairs, rsr_threshold=None), exact)
+    gated = batch_edit_discrepancy(pairs)
+    below = exact <= 0.1
+    np.testing.assert_allclose(gated[below], exact[below])
+    assert np.all(gated[~below] > 0.1)
+
+
+def test_batch_process_pool():
+    pairs = list(_random_pairs(40, seed=4))
+    np.testing.assert_allclose(
+        batch_edit_discrepancy(pairs, processes=2, chunksize=8),
+        batch_edit_discrepancy(pairs),
+    )
@@ -0,0 +1,68 @@
+"""
+RID — Test: Binary Trace Recorder
+==================================
+Records written through the memory-mapped recorder must round-trip through
+TraceReader column views and the CSV converter, survive file growth, and
+only become visible to readers at durability points.
+
+Run: pytest tests/test_trace_recorder.py -v
+"""
+
+import sys, csv
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import numpy as np
+
+from rid import FIDFConfig, TraceReader, TraceRecorder, run_fidf_loop, trace_to_csv
+
+
+def test_round_trip_with_growth(tmp_path):
+    path = tmp_path / "run.rtrace"
+    with TraceRecorder(path, sensor_names=("temp_c", "ram_pct"), capacity=16) as rec:
+        for i in range(1000):
+            rec.append(float(i), i, 1.0, 0.5, 0.9, 0.45, "SHED_LOAD", threads=i % 16,
+                       sensors=(60.0 + i * 0.01, 42.0))
+    r = TraceReader(path)
+    assert len(r) == 1000
+    assert r.sensor_names == ("temp_c", "ram_pct")
+    assert np.array_equal(r["tick"], np.arange(1000))
+    assert abs(r["temp_c"][999] - 69.99) < 1e-9
+    assert r["threads"][17] == 1
+    assert set(r.actions()) == {"SHED_LOAD"}
+    assert path.stat().st_size == 512 + 1000 * r.dtype.itemsize
+
+
+def test_reader_sees_only_durable_records(tmp_path):
+    path = tmp_path / "live.rtrace"
+    rec = TraceRecorder(path, sync_every=100, sync_interval=1e9)
+    for i in range(150):
+        rec.append(0.0, i, 1.0, 1.0, 1.0, 1.0)
+    assert len(TraceReader(path)) == 100
+    rec.close()
+    assert len(TraceReader(path)) == 150
+
+
+def test_unknown_action_and_short_sensors(tmp_path):
+    path = tmp_path / "x.rtrace"
+    with TraceRecorder(path, sensor_names=("a", "b")) as rec:
+        rec.append(0.0, 0, 1.0, 1.0, 1.0, 1.0, action="SOMETHING_NEW", sensors=(3.0,))
+    r = TraceReader(path)
+    assert r.actions() == ["other"]
+    assert list(r.records["sensors"][0]) == [3.0, 0.0]
+
+
+def test_fidf_loop_recorder_and_csv(tmp_path):
+    path = tmp_path / "fidf.rtrace"
+    with TraceRecorder(path) as rec:
+        run_fidf_loop(FIDFConfig(dt=0.0, max_steps=30),
+                      lambda n: 0.2 if n == 10 else 0.5, lambda n: 0.5,
+                      lambda n: (10.0, 10.0), lambda n: (1.0, 0.0, 1.0), recorder=rec)
+    r = TraceReader(path)
+    assert len(r) == 30
+    assert r["S_n"][10] < 1.0 and r.actions()[10] != "continue"
+    out = tmp_path / "fidf.csv"
+    assert trace_to_csv(path, out) == 30
+    rows = list(csv.reader(open(out)))
+    assert rows[0][:6] == ["Time", "Tick", "RSR", "LTP", "RLE", "S_n"]
+    assert len(rows) == 31
@@ -36,6 +36,56 @@ STEPS = [
      [PYTHON, "-m", "pytest", "tests/test_fidf_loop.py", "-v", "--tb=short"]),
     ("pytest: Physics Stress (10,000 samples)",
      [PYTHON, "-m", "pytest", "tests/test_physics_stress.py", "-v", "--tb=short"]),
+    ("pytest: Coupling Loss Matrix (log space)",
+     [PYTHON, "-m", "pytest", "tests/test_coupling_matrix.py", "-v", "--tb=short"]),
+    ("pytest: SEOL Chain Index",
+     [PYTHON, "-m", "pytest", "tests/test_seol_chain_index.py", "-v", "--tb=short"]),
+    ("pytest: SEOL Coupling DAG",
+     [PYTHON, "-m", "pytest", "tests/test_seol_graph.py", "-v", "--tb=short"]),
+    ("pytest: Descent Trigger Monitor",
+     [PYTHON, "-m", "pytest", "tests/test_descent_triggers.py", "-v", "--tb=short"]),
+    ("pytest: Loop-Lag Instrumentation",
+     [PYTHON, "-m", "pytest", "tests/test_loop_lag.py", "-v", "--tb=short"]),
+    ("pytest: Stage Tracing",
+     [PYTHON, "-m", "pytest", "tests/test_stage_tracing.py", "-v", "--tb=short"]),
+    ("pytest: Metrics Exporter",
+     [PYTHON, "-m", "pytest", "tests/test_metrics_exporter.py", "-v", "--tb=short"]),
+    ("pytest: Binary Trace Recorder",
+     [PYTHON, "-m", "pytest", "tests/test_trace_recorder.py", "-v", "--tb=short"]),
+    ("pytest: Trace Replay",
+     [PYTHON, "-m", "pytest", "tests/test_replay.py", "-v", "--tb=short"]),
+    ("pytest: sysfs Sensor Backend",
+     [PYTHON, "-m", "pytest", "tests/test_sysfs_sensors.py", "-v", "--tb=short"]),
+    ("pytest: Sensor Snapshot Sampler",
+     [PYTHON, "-m", "pytest", "tests/test_sensor_sampler.py", "-v", "--tb=short"]),
+    ("pytest: PSI / cgroup RLE Sources",
+     [PYTHON, "-m", "pytest", "tests/test_rle_sources.py", "-v", "--tb=short"]),
+    ("pytest: Duty-Cycle Governor",
+     [PYTHON, "-m", "pytest", "tests/test_duty_cycle.py", "-v", "--tb=short"]),
+    ("pytest: Incremental Drift Tracker",
+     [PYTHON, "-m", "pytest", "tests/test_drift_tracker.py", "-v", "--tb=short"]),
+    ("pytest: Merkle Identity Anchor",
+     [PYTHON, "-m", "pytest", "tests/test_merkle_anchor.py", "-v", "--tb=short"]),
+    ("pytest: Sketch Discrepancy",
+     [PYTHON, "-m", "pytest", "tests/test_sketch_discrepancy.py", "-v", "--tb=short"]),
+    ("pytest: Embedding RSR",
+     [PYTHON, "-m", "pytest", "tests/test_embedding_rsr.py", "-v", "--tb=short"]),
+    ("pytest: Reconstruction Filters",
+     [PYTHON, "-m", "pytest", "tests/test_reconstruction_filters.py", "-v", "--tb=short"]),
+    ("pytest: Distribution Discrepancies",
+     [PYTHON, "-m", "pytest", "tests/test_distribution_discrepancy.py", "-v", "--tb=short"]),
+    ("pytest: Text Discrepancy",
+     [PYTHON, "-m", "pytest", "tests/test_text_discrepancy.py", "-v", "--tb=short"]),
+    ("pytest: Quantum-Pi Ensemble",
+     [PYTHON, "-m", "pytest", "tests/test_rid_q_ensemble.py", "-v", "--tb=short"]),
+    ("pytest: Quantum-Pi Sweep",
+     [PYTHON, "-m", "pytest", "tests/test_rid_q_sweep.py", "-v", "--tb=short"]),
+    ("pytest: Async Load Generator",
+     [PYTHON, "-m", "pytest", "tests/test_async_load_generator.py", "-v", "--tb=short"]),
+    ("pytest: Stub Inference Server",
+     [PYTHON, "-m", "pytest", "tests/test_stub_inference_server.py", "-v", "--tb=short"]),
+    ("pytest: Admission Controller",
+     [PYTHON, "-m", "pytest", "tests/test_admission_controller.py", "-v", "--tb=short"]),
 ]
 
 